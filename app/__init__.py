@@ -20,8 +20,14 @@ from os.path import abspath
 from flet_manager import App
 
 from app.views import views, InitView
-from .utils import fonts, themes
+from .utils import themes
+from .utils.assets import AssetsMiddleware
+from .utils.diagnostics import add_diagnostics
+from .utils.export import add_export
+from .utils.fonts import get_default_fonts
 from .utils.logger import config_logger
+from .utils.service_worker import add_service_worker
+from .utils.warm_up import add_warm_up
 
 
 def create_app():
@@ -31,7 +37,12 @@ def create_app():
         views=views,
         view_main=InitView,
         assets_dir=abspath('assets'),
-        fonts=fonts,
+        fonts=get_default_fonts(),
         themes=themes,
     )
+    add_warm_up(app=app.fastapi)
+    add_export(app=app.fastapi)
+    add_diagnostics(app=app.fastapi)
+    add_service_worker(app=app.fastapi)
+    app.fastapi.add_middleware(AssetsMiddleware)
     return app.fastapi
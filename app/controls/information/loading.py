@@ -15,23 +15,17 @@
 #
 
 
-from asyncio import sleep, create_task
+from flet_core import Image, Column, Stack, MainAxisAlignment, CrossAxisAlignment, Container, UserControl, \
+    ProgressBar, colors
 
-from flet_core import Image, Column, Stack, MainAxisAlignment, CrossAxisAlignment, Container, UserControl
-from flet_manager.utils import get_svg
-
-SLEEP = 0.65
-ICONS = {
-    1: 300,
-}
+from app.utils.icons import get_svg_file
 
 
 class Loading(UserControl):
     infinity: bool
     opactity: int
     icon_1: Image
-    icon_2: Image
-    icon_3: Image
+    progress_bar: ProgressBar
 
     def __init__(self, color: str, infinity: bool = True, opactity: int = 1):
         super().__init__()
@@ -39,19 +33,11 @@ class Loading(UserControl):
         self.infinity = infinity
         self.opactity = opactity
 
-    def did_mount_async(self):
-        create_task(self.animate())
-
-    async def animate(self):
-        while self.infinity:
-            self.opactity = 0 if self.opactity == 1 else 1
-            self.icon_1.opacity = self.opactity
-            await self.update_async()
-            await sleep(SLEEP)
-
     def build(self):
-        svg_1 = get_svg(path=f'assets/icons/logos/logo.svg')
-        self.icon_1 = Image(src=svg_1, width=500, height=50, color=self.color, animate_opacity=300, opacity=1)
+        svg_1 = get_svg_file(path=f'assets/icons/logos/logo.svg')
+        self.icon_1 = Image(src=svg_1, width=500, height=50, color=self.color, opacity=self.opactity)
+        # Indeterminate progress is animated by the client, so loading screens send no frames
+        self.progress_bar = ProgressBar(width=120, color=self.color, bgcolor=colors.TRANSPARENT)
 
         self.expand = True
         return Column(
@@ -61,7 +47,9 @@ class Loading(UserControl):
                         self.icon_1,
                     ],
                 ),
-                Container(),
+                Container(
+                    content=self.progress_bar,
+                ),
             ],
             alignment=MainAxisAlignment.CENTER,
             horizontal_alignment=CrossAxisAlignment.CENTER,
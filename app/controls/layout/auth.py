@@ -18,11 +18,11 @@
 from typing import Any
 
 from flet_core import Image, Container, padding, alignment, Column, colors, Row
-from flet_manager.utils import get_svg
 
 from app.controls.information import Text
 from app.controls.layout.view import View
 from app.utils import Fonts, Icons
+from app.utils.icons import get_svg_file
 from config import settings
 
 
@@ -88,7 +88,7 @@ class AuthView(View):
                         # Header
                         Container(
                             content=Image(
-                                src=get_svg(
+                                src=get_svg_file(
                                     path='assets/icons/logos/logo_2_full.svg',
                                 ),
                                 height=56,
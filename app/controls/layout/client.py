@@ -18,11 +18,11 @@
 from typing import Any
 
 from flet_core import Row, Container, Image, MainAxisAlignment, Column, margin, colors
-from flet_manager.utils import get_svg
 
 from app.controls.information import Text
 from app.controls.layout.view import View
 from app.utils import Fonts
+from app.utils.icons import get_svg_file
 from config import settings
 
 
@@ -52,7 +52,7 @@ class ClientSection:
                     content=Row(
                         controls=[
                             Image(
-                                src=get_svg(path='assets/icons/addition.svg'),
+                                src=get_svg_file(path='assets/icons/addition.svg'),
                                 height=10,
                                 color='#FFFFFF',
                             ),
@@ -15,22 +15,29 @@
 #
 
 
+import asyncio
 from functools import partial
+from typing import Optional
 
-from flet_core import Container, Image, alignment, padding, BoxShadow, Row, colors
-from flet_manager.utils import get_svg
+from flet_core import Container, Control, Image, alignment, padding, BoxShadow, Row, colors
 from flet_manager.views import BaseView
 
 from app.controls.information.loading import Loading
 from app.controls.information.text import Text
 from app.controls.navigation.icon_text_button import IconTextButton
 from app.utils import Fonts, Icons
+from app.utils.icons import get_svg_file
+from app.utils.loaders import Loaders
+from app.utils.templates import templates
 from config import settings
 
 
 class View(BaseView):
     title = 'Finance Express'
     controls_last: list = []
+    resume_fields: list[str] | None = None
+    loaders: Optional[Loaders] = None
+    loading: Optional[asyncio.Task] = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -38,11 +45,34 @@ class View(BaseView):
         self.spacing = 0
         self.bgcolor = colors.BACKGROUND
 
+    @property
+    def client(self):
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+        # Client is assigned on navigation, before the view is mounted and constructed
+        if client and self.loaders and not self.loading:
+            self.loading = self.loaders.start(view=self)
+
+    async def load(self) -> None:
+        loading = self.loading or self.loaders.start(view=self)
+        self.loading = None
+        await self.set_type(loading=True)
+        data = await loading
+        await self.set_type(loading=False)
+        for name, value in data.items():
+            setattr(self, name, value)
+
+    def get_placeholder(self) -> Control:
+        return Loading(infinity=True, color=colors.PRIMARY)
+
     @staticmethod
-    async def get_header():
+    def build_header():
         return Container(
             content=Image(
-                src=get_svg(
+                src=get_svg_file(
                     path='assets/icons/logos/logo_2_full.svg',
                 ),
                 height=34,
@@ -57,6 +87,10 @@ class View(BaseView):
             ),
         )
 
+    @staticmethod
+    async def get_header():
+        return templates.get(key=('header',), build=View.build_header)
+
     async def get_title(
             self,
             title: str,
@@ -142,7 +176,7 @@ class View(BaseView):
         if loading:
             self.controls_last = self.controls
             self.controls = [
-                Loading(infinity=True, color=colors.PRIMARY),
+                self.get_placeholder(),
             ]
             if self.page:
                 await self.update_async()
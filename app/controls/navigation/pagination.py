@@ -15,13 +15,15 @@
 #
 
 
-from typing import Callable
+from functools import partial
+from typing import Any, Callable
 
 from flet_core import Container, Row, colors
 
 from app.controls.button import StandardButton
 from app.controls.information import Text
 from app.utils import Fonts
+from app.utils.templates import templates
 from config import settings
 
 
@@ -32,8 +34,8 @@ class PaginationWidget(Container):
             text_back: str,
             current_page: int,
             total_pages: int,
-            on_back: Callable,
-            on_next: Callable,
+            on_back: Callable | str,
+            on_next: Callable | str,
             disable_next_button: bool = True
     ):
         self.current_page = current_page
@@ -42,29 +44,56 @@ class PaginationWidget(Container):
         self.on_next = on_next
         self.disable_next_button = disable_next_button
         super().__init__()
+        self.back_button = StandardButton(
+            content=Text(
+                value=text_back,
+                size=settings.get_font_size(multiple=1.5),
+            ),
+            on_click=self.on_previous,
+        )
+        self.pages_text = Text(
+            size=settings.get_font_size(multiple=1.6),
+            font_family=Fonts.SEMIBOLD,
+            color=colors.ON_BACKGROUND,
+        )
+        self.next_button = StandardButton(
+            content=Text(
+                value=text_next,
+                size=settings.get_font_size(multiple=1.5),
+            ),
+            on_click=self.on_next,
+        )
         self.content = Row(
             controls=[
-                StandardButton(
-                    content=Text(
-                        value=text_back,
-                        size=settings.get_font_size(multiple=1.5),
-                    ),
-                    on_click=self.on_previous,
-                    disabled=self.current_page <= 1,
-                ),
-                Text(
-                    value=f'{self.current_page}/{self.total_pages}',
-                    size=settings.get_font_size(multiple=1.6),
-                    font_family=Fonts.SEMIBOLD,
-                    color=colors.ON_BACKGROUND,
-                ),
-                StandardButton(
-                    content=Text(
-                        value=text_next,
-                        size=settings.get_font_size(multiple=1.5),
-                    ),
-                    on_click=self.on_next,
-                    disabled=self.disable_next_button and self.current_page >= self.total_pages,
-                ),
+                self.back_button,
+                self.pages_text,
+                self.next_button,
             ],
         )
+        self.set_page(current_page=current_page, total_pages=total_pages)
+
+    def set_page(self, current_page: int, total_pages: int):
+        self.current_page = current_page
+        self.total_pages = total_pages
+        self.back_button.disabled = self.current_page <= 1
+        self.pages_text.value = f'{self.current_page}/{self.total_pages}'
+        self.next_button.disabled = self.disable_next_button and self.current_page >= self.total_pages
+
+    @staticmethod
+    def from_template(owner: Any, current_page: int, total_pages: int) -> 'PaginationWidget':
+        session = owner.client.session
+        pagination = templates.get(
+            key=session.get_template_key(name='pagination'),
+            build=partial(
+                PaginationWidget,
+                text_next=session.tv(key='next'),
+                text_back=session.tv(key='back'),
+                current_page=1,
+                total_pages=1,
+                on_back='previous_page',
+                on_next='next_page',
+            ),
+            owner=owner,
+        )
+        pagination.set_page(current_page=current_page, total_pages=total_pages)
+        return pagination
@@ -0,0 +1,111 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from collections import OrderedDict
+from copy import deepcopy
+from functools import partial, reduce
+from typing import Any
+
+from config import settings
+from .flight import SingleFlight
+from .references import is_reference, references
+from .resilience import resilience
+from .scheduler import scheduler
+from .snapshot import snapshot
+
+READ_METHODS = ['get', 'get_list', 'search', 'main', 'by_request', 'by_requisite']
+# Writes that change nothing a read returns keep the read cache
+NEUTRAL_PATHS = [('client', 'files', 'keys', 'create')]
+
+
+def is_read(path: tuple[str, ...]) -> bool:
+    return path[-1] in READ_METHODS
+
+
+class ApiPath:
+    def __init__(self, api: 'Api', path: tuple[str, ...]):
+        self.api = api
+        self.path = path
+
+    def __getattr__(self, name: str) -> 'ApiPath':
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return ApiPath(api=self.api, path=(*self.path, name))
+
+    def __call__(self, **kwargs):
+        return self.api.call(self.path, **kwargs)
+
+
+class Api:
+    def __init__(self, api, ttl: float = settings.api_cache_ttl):
+        self.api = api
+        self.flight = SingleFlight(ttl=ttl)
+        self.validators = OrderedDict()
+        self.changed = 0
+        self.unchanged = 0
+
+    def __getattr__(self, name: str) -> ApiPath:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return ApiPath(api=self, path=(name,))
+
+    async def call(self, path: tuple[str, ...], **kwargs) -> Any:
+        method = reduce(getattr, path, self.api)
+        if not is_read(path=path):
+            if path not in NEUTRAL_PATHS:
+                self.flight.forget()
+            if path[0] == 'admin':
+                references.forget()
+                snapshot.invalidate()
+            async with scheduler.slot():
+                return await resilience.call(path=path, func=partial(method, **kwargs))
+        if is_reference(path=path):
+            value = snapshot.get_reference(path=path, kwargs=kwargs)
+            if value is not None:
+                return value
+        key = (path, repr(sorted(kwargs.items())))
+        func = partial(self.read, method, path, kwargs)
+        if is_reference(path=path):
+            return await references.flight.do(key=key, func=func)
+        result, validator = await self.flight.share(key=key, func=func)
+        return self.validate(key=key, result=result, validator=validator)
+
+    def validate(self, key: Any, result: Any, validator: str) -> Any:
+        # An unchanged body hands back the object returned last time, so update_check skips its diff
+        last = self.validators.get(key)
+        if last and last[0] == validator:
+            self.validators.move_to_end(key)
+            self.unchanged += 1
+            return last[1]
+        self.changed += 1
+        result = deepcopy(result)
+        self.validators[key] = (validator, result)
+        self.validators.move_to_end(key)
+        while len(self.validators) > settings.api_validators_size:
+            self.validators.popitem(last=False)
+        return result
+
+    async def read(self, method, path: tuple[str, ...], kwargs: dict) -> Any:
+        async with scheduler.slot():
+            return await resilience.read(path=path, func=partial(method, **kwargs))
+
+    def stats(self) -> dict:
+        return {
+            **self.flight.stats(),
+            'changed': self.changed,
+            'unchanged': self.unchanged,
+        }
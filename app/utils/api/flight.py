@@ -0,0 +1,124 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+from copy import deepcopy
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from app.utils.texts import get_body_hash
+from .scheduler import PRIORITIES, priority
+
+
+class Flight:
+    future: asyncio.Future
+    generation: tuple[int, int]
+    rank: int
+
+    def __init__(self, future: asyncio.Future, generation: tuple[int, int], rank: int):
+        self.future = future
+        self.generation = generation
+        self.rank = rank
+
+
+class SingleFlight:
+    ttl: float
+    flights: dict[Any, Flight]
+    cache: dict[Any, tuple[float, tuple[Any, str]]]
+    generations: dict[Any, int]
+
+    def __init__(self, ttl: float = 0):
+        self.ttl = ttl
+        self.flights = {}
+        self.cache = {}
+        self.epoch = 0
+        self.generations = {}
+        self.calls = 0
+        self.shared = 0
+        self.cached = 0
+
+    def get_generation(self, key: Any) -> tuple[int, int]:
+        return self.epoch, self.generations.get(key, 0)
+
+    async def do(self, key: Any, func: Callable[[], Awaitable]) -> Any:
+        # Results are shared between callers, so each one gets its own copy to mutate
+        result, _ = await self.share(key=key, func=func)
+        return deepcopy(result)
+
+    async def share(self, key: Any, func: Callable[[], Awaitable]) -> tuple[Any, str]:
+        self.calls += 1
+        if self.ttl and key in self.cache:
+            created, result = self.cache[key]
+            if monotonic() - created < self.ttl:
+                self.cached += 1
+                return result
+            del self.cache[key]
+        rank = PRIORITIES.index(priority.get())
+        flight = self.flights.get(key)
+        # A flight queued at a lower priority would hold a more urgent caller back, so it starts its own
+        if flight and flight.rank <= rank:
+            self.shared += 1
+        else:
+            flight = Flight(
+                future=asyncio.ensure_future(self.run(func=func)),
+                generation=self.get_generation(key=key),
+                rank=rank,
+            )
+            flight.future.add_done_callback(lambda _: self.done(key=key, flight=flight))
+            self.flights[key] = flight
+        return await asyncio.shield(flight.future)
+
+    @staticmethod
+    async def run(func: Callable[[], Awaitable]) -> tuple[Any, str]:
+        result = await func()
+        return result, get_body_hash(body=result)
+
+    def done(self, key: Any, flight: Flight) -> None:
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+        future = flight.future
+        if future.cancelled() or future.exception() or not self.ttl:
+            return
+        # Reads started before a write may carry stale data and must not refill the cache
+        if flight.generation != self.get_generation(key=key):
+            return
+        now = monotonic()
+        self.cache = {
+            key_: value_
+            for key_, value_ in self.cache.items()
+            if now - value_[0] < self.ttl
+        }
+        self.cache[key] = (now, future.result())
+
+    def forget(self, key: Any = None) -> None:
+        if key is None:
+            self.epoch += 1
+            self.flights.clear()
+            self.cache.clear()
+            return
+        self.generations[key] = self.generations.get(key, 0) + 1
+        self.flights.pop(key, None)
+        self.cache.pop(key, None)
+
+    def stats(self) -> dict:
+        hits = self.shared + self.cached
+        return {
+            'calls': self.calls,
+            'shared': self.shared,
+            'cached': self.cached,
+            'hit_rate': round(hits / self.calls, 4) if self.calls else 0,
+        }
@@ -0,0 +1,105 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import logging
+from functools import partial
+from glob import glob
+from time import monotonic
+
+from app.utils.icons import get_svg_file
+from config import settings
+from .flight import SingleFlight
+
+REFERENCE_PATHS = [
+    ('client', 'languages', 'get_list'),
+    ('client', 'currencies', 'get_list'),
+    ('client', 'methods', 'get_list'),
+    ('client', 'countries', 'get_list'),
+    ('client', 'timezones', 'get_list'),
+    ('client', 'texts', 'packs', 'get'),
+]
+
+
+def is_reference(path: tuple[str, ...]) -> bool:
+    return path in REFERENCE_PATHS
+
+
+class References:
+    flight: SingleFlight
+    ready: bool
+    duration: float | None
+    error: str | None
+
+    def __init__(self, ttl: float = settings.references_ttl):
+        self.flight = SingleFlight(ttl=ttl)
+        self.ready = False
+        self.duration = None
+        self.error = None
+
+    @staticmethod
+    def load_icons() -> int:
+        paths = glob('assets/icons/**/*.svg', recursive=True)
+        for path in paths:
+            get_svg_file(path=path)
+        return len(paths)
+
+    async def warm_up(self, api) -> None:
+        started = monotonic()
+        loaders = {
+            'icons': partial(asyncio.to_thread, self.load_icons),
+            **{'.'.join(path): partial(api.call, path) for path in REFERENCE_PATHS if path[-1] == 'get_list'},
+        }
+        delay = settings.warm_up_retry
+        while loaders:
+            names = list(loaders)
+            results = await asyncio.gather(*[loaders[name]() for name in names], return_exceptions=True)
+            errors = {}
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    errors[name] = str(result)
+                    continue
+                loaders.pop(name)
+                if name == 'client.languages.get_list':
+                    for language in result:
+                        loaders[f'texts.{language["id_str"]}'] = partial(
+                            api.client.texts.packs.get, language=language['id_str'],
+                        )
+            if not errors:
+                continue
+            # Only the failed loaders are retried, the rest stay cached
+            self.error = '; '.join(f'{name}: {error}' for name, error in errors.items())
+            logging.warning(f'Warm up pass | retry in {delay}s | {self.error}')
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.warm_up_retry_max)
+        self.duration = round(monotonic() - started, 3)
+        self.ready = True
+        self.error = None
+
+    def forget(self) -> None:
+        self.flight.forget()
+
+    def stats(self) -> dict:
+        return {
+            'ready': self.ready,
+            'duration': self.duration,
+            'error': self.error,
+            **self.flight.stats(),
+        }
+
+
+references = References()
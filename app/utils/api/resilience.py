@@ -0,0 +1,188 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import random
+from collections import deque
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from aiohttp import ClientConnectorError, ClientError
+
+from config import settings
+from fexps_api_client.utils import ApiException
+
+TRANSIENT_ERRORS = (TimeoutError, ClientError, OSError)
+
+
+class ApiUnavailableException(ApiException):
+    # Handlers already report ApiException, so an unreachable backend is surfaced the same way
+    def __init__(self, path: tuple[str, ...]):
+        Exception.__init__(self, f'{".".join(path)} unavailable')
+        self.code = 'unavailable'
+        self.message = str(self)
+        self.kwargs = {}
+
+
+class ApiOutcomeUnknownException(ApiException):
+    # A write that timed out or lost its connection may still have been applied by the backend
+    def __init__(self, path: tuple[str, ...]):
+        Exception.__init__(self, f'{".".join(path)} outcome unknown')
+        self.code = 'outcome_unknown'
+        self.message = str(self)
+        self.kwargs = {}
+
+
+class Latencies:
+    size: int
+    latencies: dict[tuple[str, ...], deque[float]]
+
+    def __init__(self, size: int = 128):
+        self.size = size
+        self.latencies = {}
+
+    def add(self, path: tuple[str, ...], duration: float) -> None:
+        self.latencies.setdefault(path, deque(maxlen=self.size)).append(duration)
+
+    def get_percentile(self, path: tuple[str, ...], percentile: float, samples: int) -> float | None:
+        latencies = self.latencies.get(path)
+        if not latencies or len(latencies) < samples:
+            return None
+        return sorted(latencies)[int(len(latencies) * percentile) - 1]
+
+
+class RetryBudget:
+    ratio: float
+    minimum: float
+    tokens: float
+
+    def __init__(self, ratio: float, minimum: float = 10):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.tokens = minimum
+
+    def deposit(self) -> None:
+        self.tokens = min(self.tokens + self.ratio, self.minimum + 100 * self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class Resilience:
+    latencies: Latencies
+    budget: RetryBudget
+
+    def __init__(
+            self,
+            timeout: float = settings.api_timeout,
+            timeouts: dict[str, float] = None,
+            retries: int = settings.api_retries,
+            backoff: float = settings.api_retry_backoff,
+            hedge_samples: int = settings.api_hedge_samples,
+            budget: float = settings.api_retry_budget,
+    ):
+        self.timeout = timeout
+        self.timeouts = settings.api_timeouts if timeouts is None else timeouts
+        self.retries = retries
+        self.backoff = backoff
+        self.hedge_samples = hedge_samples
+        self.latencies = Latencies()
+        self.budget = RetryBudget(ratio=budget)
+        self.calls = 0
+        self.retried = 0
+        self.hedged = 0
+        self.hedges_won = 0
+        self.timeouts_count = 0
+        self.exhausted = 0
+
+    def get_timeout(self, path: tuple[str, ...]) -> float:
+        return self.timeouts.get('.'.join(path), self.timeout)
+
+    async def attempt(self, path: tuple[str, ...], func: Callable[[], Awaitable]) -> Any:
+        self.calls += 1
+        try:
+            async with asyncio.timeout(self.get_timeout(path=path)):
+                return await func()
+        except TimeoutError:
+            self.timeouts_count += 1
+            raise
+
+    async def call(self, path: tuple[str, ...], func: Callable[[], Awaitable]) -> Any:
+        try:
+            return await self.attempt(path=path, func=func)
+        except ClientConnectorError as exception:
+            # No connection was made, so the write was never sent
+            raise ApiUnavailableException(path=path) from exception
+        except TRANSIENT_ERRORS as exception:
+            raise ApiOutcomeUnknownException(path=path) from exception
+
+    async def hedge(self, path: tuple[str, ...], func: Callable[[], Awaitable]) -> Any:
+        started = monotonic()
+        tasks = [asyncio.ensure_future(func())]
+        try:
+            delay = self.latencies.get_percentile(path=path, percentile=0.95, samples=self.hedge_samples)
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self.budget.withdraw():
+                    self.hedged += 1
+                    tasks.append(asyncio.ensure_future(func()))
+            pending, error = set(tasks), None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            self.hedges_won += 1
+                        self.latencies.add(path=path, duration=monotonic() - started)
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def read(self, path: tuple[str, ...], func: Callable[[], Awaitable]) -> Any:
+        self.budget.deposit()
+        for attempt in range(self.retries + 1):
+            try:
+                return await self.attempt(path=path, func=lambda: self.hedge(path=path, func=func))
+            except TRANSIENT_ERRORS as exception:
+                if attempt == self.retries:
+                    raise ApiUnavailableException(path=path) from exception
+                if not self.budget.withdraw():
+                    self.exhausted += 1
+                    raise ApiUnavailableException(path=path) from exception
+                self.retried += 1
+                # Full jitter keeps retries from a tick of updaters from arriving together
+                await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+
+    def stats(self) -> dict:
+        return {
+            'calls': self.calls,
+            'retried': self.retried,
+            'hedged': self.hedged,
+            'hedges_won': self.hedges_won,
+            'timeouts': self.timeouts_count,
+            'budget': round(self.budget.tokens, 2),
+            'budget_exhausted': self.exhausted,
+        }
+
+
+resilience = Resilience()
@@ -0,0 +1,119 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from itertools import count
+from time import monotonic
+
+from config import settings
+
+PRIORITIES = ['interactive', 'view_load', 'updater', 'prefetch']
+
+priority: ContextVar[str] = ContextVar('priority', default='interactive')
+
+
+class Waiter:
+    rank: int
+    order: int
+    priority: str
+    future: asyncio.Future
+
+    def __init__(self, priority_: str, order: int):
+        self.rank = PRIORITIES.index(priority_)
+        self.order = order
+        self.priority = priority_
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class Scheduler:
+    limit: int
+    limits: dict[str, int]
+    waiters: list[Waiter]
+
+    def __init__(self, limit: int = settings.api_concurrency, limits: dict[str, int] = None):
+        self.limit = limit
+        self.limits = settings.api_concurrency_limits if limits is None else limits
+        self.waiters = []
+        self.order = count()
+        self.active = dict.fromkeys(PRIORITIES, 0)
+        self.calls = dict.fromkeys(PRIORITIES, 0)
+        self.queued = dict.fromkeys(PRIORITIES, 0)
+        self.queue_time_total = dict.fromkeys(PRIORITIES, 0.0)
+        self.queue_time_max = dict.fromkeys(PRIORITIES, 0.0)
+
+    def can_run(self, priority_: str) -> bool:
+        if sum(self.active.values()) >= self.limit:
+            return False
+        return self.active[priority_] < self.limits.get(priority_, self.limit)
+
+    def wake(self) -> None:
+        for waiter in sorted(self.waiters, key=lambda waiter_: (waiter_.rank, waiter_.order)):
+            if waiter.future.done():
+                self.waiters.remove(waiter)
+            elif self.can_run(priority_=waiter.priority):
+                self.active[waiter.priority] += 1
+                waiter.future.set_result(None)
+                self.waiters.remove(waiter)
+
+    async def acquire(self, priority_: str) -> None:
+        started = monotonic()
+        waiter = Waiter(priority_=priority_, order=next(self.order))
+        self.waiters.append(waiter)
+        self.wake()
+        if not waiter.future.done():
+            self.queued[priority_] += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(priority_=priority_)
+            raise
+        queue_time = monotonic() - started
+        self.calls[priority_] += 1
+        self.queue_time_total[priority_] += queue_time
+        self.queue_time_max[priority_] = max(self.queue_time_max[priority_], queue_time)
+
+    def release(self, priority_: str) -> None:
+        self.active[priority_] -= 1
+        self.wake()
+
+    @asynccontextmanager
+    async def slot(self):
+        priority_ = priority.get()
+        await self.acquire(priority_=priority_)
+        try:
+            yield
+        finally:
+            self.release(priority_=priority_)
+
+    def stats(self) -> dict:
+        return {
+            priority_: {
+                'active': self.active[priority_],
+                'waiting': sum(1 for waiter in self.waiters if waiter.priority == priority_),
+                'calls': self.calls[priority_],
+                'queued': self.queued[priority_],
+                'queue_time_avg': round(self.queue_time_total[priority_] / (self.calls[priority_] or 1), 4),
+                'queue_time_max': round(self.queue_time_max[priority_], 4),
+            }
+            for priority_ in PRIORITIES
+        }
+
+
+scheduler = Scheduler()
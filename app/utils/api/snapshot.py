@@ -0,0 +1,348 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import fcntl
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from functools import reduce
+from hashlib import md5
+from pathlib import Path
+from time import time
+from typing import Any, Iterator, Optional
+
+from addict import Dict
+
+from app.utils.subsets import get_subsets
+from app.utils.texts import PLACEHOLDER, TextPack, TextTemplate, get_body_hash
+from config import settings
+from .references import REFERENCE_PATHS
+
+MAGIC = b'FXS1'
+HEADER = struct.Struct('<4sI')
+ENTRY = struct.Struct('<IIII')
+SEPARATOR = '\0'
+
+
+def get_reference_key(path: tuple[str, ...], kwargs: dict) -> str:
+    return f'ref:{".".join(path)}{SEPARATOR}{sorted(kwargs.items())!r}'
+
+
+def write_snapshot(path: Path, entries: dict[str, bytes]) -> None:
+    items = sorted((key.encode(), value) for key, value in entries.items())
+    offset = HEADER.size + ENTRY.size * len(items)
+    table, blob = [], []
+    for key, value in items:
+        table.append(ENTRY.pack(offset, len(key), offset + len(key), len(value)))
+        blob += [key, value]
+        offset += len(key) + len(value)
+    path_tmp = path.with_suffix('.tmp')
+    with open(path_tmp, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, len(items)))
+        file.writelines(table)
+        file.writelines(blob)
+    os.replace(path_tmp, path)
+
+
+class SnapshotFile:
+    name: str
+    mmap: mmap.mmap
+    count: int
+
+    def __init__(self, path: Path):
+        self.name = path.name
+        with open(path, 'rb') as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f'Snapshot {path} is not readable')
+
+    def get_entry(self, index: int) -> tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self.mmap, HEADER.size + ENTRY.size * index)
+
+    def get_key(self, index: int) -> bytes:
+        key_offset, key_size, _, _ = self.get_entry(index)
+        return self.mmap[key_offset:key_offset + key_size]
+
+    def get_value(self, index: int) -> bytes:
+        _, _, value_offset, value_size = self.get_entry(index)
+        return self.mmap[value_offset:value_offset + value_size]
+
+    def bisect(self, key: bytes) -> int:
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get(self, key: str) -> Optional[bytes]:
+        key = key.encode()
+        index = self.bisect(key)
+        if index < self.count and self.get_key(index) == key:
+            return self.get_value(index)
+        return None
+
+    def iter_keys(self, prefix: str) -> Iterator[bytes]:
+        prefix = prefix.encode()
+        for index in range(self.bisect(prefix), self.count):
+            key = self.get_key(index)
+            if not key.startswith(prefix):
+                return
+            yield key[len(prefix):]
+
+
+class SnapshotTexts(Mapping):
+    file: SnapshotFile
+    prefix: str
+
+    def __init__(self, file: SnapshotFile, language: str):
+        self.file = file
+        self.prefix = f'texts:{language}{SEPARATOR}'
+
+    def __getitem__(self, key: str) -> str:
+        value = self.file.get(f'{self.prefix}{key}')
+        if value is None:
+            raise KeyError(key)
+        return value.decode()
+
+    def __iter__(self) -> Iterator[str]:
+        return (key.decode() for key in self.file.iter_keys(prefix=self.prefix))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.file.iter_keys(prefix=self.prefix))
+
+
+class SnapshotTemplates(Mapping):
+    file: SnapshotFile
+    texts: SnapshotTexts
+    prefix: str
+
+    def __init__(self, file: SnapshotFile, language: str):
+        self.file = file
+        self.texts = SnapshotTexts(file=file, language=language)
+        self.prefix = f'templates:{language}{SEPARATOR}'
+
+    def __getitem__(self, key: str) -> TextTemplate:
+        parts = self.file.get(f'{self.prefix}{key}')
+        if parts is not None:
+            return TextTemplate(parts=json.loads(parts))
+        value = self.texts[key]
+        return TextTemplate(parts=[value]) if '{' not in value else TextTemplate(value=value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.texts)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+class Snapshot:
+    path: Path
+    interval: float
+    ttl: float
+    file: Optional[SnapshotFile]
+    texts: dict[str, TextPack]
+    lock: Optional[int]
+    stale: bool
+    invalidated: float
+
+    def __init__(
+            self,
+            path: str = settings.snapshot_path,
+            interval: float = settings.snapshot_interval,
+            ttl: float = settings.references_ttl,
+    ):
+        self.path = Path(path)
+        self.interval = interval
+        self.ttl = ttl
+        self.file = None
+        self.texts = {}
+        self.lock = None
+        self.stale = False
+        self.invalidated = 0
+        self.built = 0
+        self.builds = 0
+        self.swaps = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def current_path(self) -> Path:
+        return self.path / 'current'
+
+    @property
+    def refresh_path(self) -> Path:
+        return self.path / 'refresh'
+
+    def get_file(self) -> Optional[SnapshotFile]:
+        if self.stale:
+            return None
+        return self.file
+
+    def get_texts(self, language: Optional[str]) -> Optional[TextPack]:
+        file = self.get_file()
+        if not file or not language:
+            return None
+        texts = self.texts.get(language)
+        if texts:
+            return texts
+        version = file.get(f'version:{language}')
+        if version is None:
+            return None
+        texts = self.texts[language] = TextPack(
+            values=SnapshotTexts(file=file, language=language),
+            version=version.decode(),
+            templates=SnapshotTemplates(file=file, language=language),
+        )
+        return texts
+
+    def get_reference(self, path: tuple[str, ...], kwargs: dict) -> Any:
+        file = self.get_file()
+        value = file.get(get_reference_key(path=path, kwargs=kwargs)) if file else None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value, object_hook=Dict)
+
+    def get_fonts(self, language: Optional[str]) -> Optional[dict[str, str]]:
+        file = self.get_file()
+        value = file.get(f'fonts:{language}') if file and language else None
+        return json.loads(value) if value else None
+
+    def invalidate(self) -> None:
+        # Served lookups fall back to the api until a fresh version is mapped
+        self.stale = True
+        self.invalidated = time()
+        if self.current_path.parent.exists():
+            self.refresh_path.touch()
+
+    def swap(self) -> None:
+        try:
+            name = self.current_path.read_text()
+            current = self.current_path.stat().st_mtime
+        except FileNotFoundError:
+            return
+        try:
+            refreshed = self.refresh_path.stat().st_mtime
+        except FileNotFoundError:
+            refreshed = 0
+        # A write on any worker bumps the shared refresh marker, every worker stays stale until a newer version lands
+        self.stale = max(refreshed, self.invalidated) > current
+        if self.file and self.file.name == name:
+            return
+        # Views holding the previous TextPack keep its mapping alive until released
+        self.file = SnapshotFile(path=self.path / name)
+        self.texts = {}
+        self.swaps += 1
+
+    def is_loader(self) -> bool:
+        if self.lock is not None:
+            return True
+        lock = os.open(self.path / 'loader.lock', os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock)
+            return False
+        self.lock = lock
+        return True
+
+    def is_due(self) -> bool:
+        if time() - self.built >= self.ttl:
+            return True
+        try:
+            return self.refresh_path.stat().st_mtime > self.built
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    async def fetch(api) -> dict[str, bytes]:
+        languages = await api.client.languages.get_list()
+        packs = await asyncio.gather(*[
+            api.client.texts.packs.get(language=language['id_str'])
+            for language in languages
+        ])
+        paths = [path for path in REFERENCE_PATHS if path[-1] == 'get_list']
+        lists = await asyncio.gather(*[reduce(getattr, path, api)() for path in paths])
+        entries = {}
+        for language, pack in zip(languages, packs):
+            entries[f'version:{language["id_str"]}'] = get_body_hash(body=pack).encode()
+            for key, value in pack.items():
+                entries[f'texts:{language["id_str"]}{SEPARATOR}{key}'] = str(value).encode()
+                parts = PLACEHOLDER.split(str(value))
+                if len(parts) > 1:
+                    entries[f'templates:{language["id_str"]}{SEPARATOR}{key}'] = json.dumps(parts).encode()
+        for path, value in zip(paths, lists):
+            entries[get_reference_key(path=path, kwargs={})] = json.dumps(value, default=str).encode()
+        for language, pack in zip(languages, packs):
+            subsets = get_subsets(language=language['id_str'], values=[str(value) for value in pack.values()])
+            if subsets:
+                entries[f'fonts:{language["id_str"]}'] = json.dumps(subsets).encode()
+        return entries
+
+    def write(self, entries: dict[str, bytes]) -> None:
+        version = md5()
+        for key in sorted(entries):
+            version.update(key.encode() + SEPARATOR.encode() + entries[key])
+        name = f'snapshot-{version.hexdigest()}.bin'
+        if not (self.path / name).exists():
+            write_snapshot(path=self.path / name, entries=entries)
+        current_tmp = self.current_path.with_suffix('.tmp')
+        current_tmp.write_text(name)
+        os.replace(current_tmp, self.current_path)
+        for path in self.path.glob('snapshot-*.bin'):
+            if path.name not in [name, self.file.name if self.file else None]:
+                path.unlink(missing_ok=True)
+
+    async def build(self, api) -> None:
+        self.built = time()
+        entries = await self.fetch(api=api)
+        await asyncio.to_thread(self.write, entries)
+        self.builds += 1
+
+    async def run(self, api) -> None:
+        await asyncio.to_thread(self.path.mkdir, parents=True, exist_ok=True)
+        while True:
+            try:
+                if self.is_loader() and self.is_due():
+                    await self.build(api=api)
+                await asyncio.to_thread(self.swap)
+            except Exception as exception:
+                logging.warning(f'Snapshot pass | {exception}')
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        return {
+            'version': self.file.name if self.file else None,
+            'loader': self.lock is not None,
+            'stale': self.stale,
+            'builds': self.builds,
+            'swaps': self.swaps,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+snapshot = Snapshot()
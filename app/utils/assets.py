@@ -0,0 +1,92 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import json
+import logging
+import mimetypes
+from os.path import abspath, isfile, join, normpath, sep
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+
+ASSETS_DIR = abspath('assets')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+SUBSETS_DIR = 'fonts/subsets'
+EMPTY_MANIFEST = {'files': {}, 'encodings': {}}
+
+manifests = {}
+
+
+def get_manifest() -> dict:
+    # Only a successful load is kept, a worker started before build_assets.py picks the manifest up later
+    if 'manifest' in manifests:
+        return manifests['manifest']
+    path = join(ASSETS_DIR, 'assets.json')
+    if not isfile(path):
+        return EMPTY_MANIFEST
+    try:
+        with open(path) as file:
+            manifests['manifest'] = json.load(file)
+    except (OSError, ValueError) as exception:
+        logging.warning(f'Assets manifest load | {exception}')
+        return EMPTY_MANIFEST
+    return manifests['manifest']
+
+
+def get_asset_url(path: str) -> str:
+    return get_manifest()['files'].get(path, path)
+
+
+class AssetsMiddleware:
+    def __init__(self, app, directory: str = ASSETS_DIR):
+        self.app = app
+        self.directory = normpath(abspath(directory))
+        self.manifest = None
+        self.immutable = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ['GET', 'HEAD']:
+            return await self.app(scope, receive, send)
+        manifest = get_manifest()
+        if manifest is not self.manifest:
+            self.manifest, self.immutable = manifest, set(manifest['files'].values())
+        path = scope['path'].lstrip('/')
+        encodings = manifest['encodings'].get(path)
+        # Font subsets are fingerprinted and compressed by build_assets.py
+        is_subset = path.startswith(f'{SUBSETS_DIR}/') and path.endswith('.ttf')
+        if is_subset:
+            encodings = ['br', 'gzip']
+        if path not in self.immutable and not encodings:
+            return await self.app(scope, receive, send)
+        file_path = normpath(join(self.directory, path))
+        if not file_path.startswith(f'{self.directory}{sep}') or not isfile(file_path):
+            return await self.app(scope, receive, send)
+        headers = {'Vary': 'Accept-Encoding'}
+        if path in self.immutable or is_subset:
+            headers['Cache-Control'] = IMMUTABLE
+        accept_encoding = Headers(scope=scope).get('accept-encoding', '')
+        for encoding in encodings or []:
+            if encoding in accept_encoding:
+                headers['Content-Encoding'] = encoding
+                file_path = f'{file_path}.{"gz" if encoding == "gzip" else encoding}'
+                break
+        response = FileResponse(
+            path=file_path,
+            headers=headers,
+            media_type=mimetypes.guess_type(path)[0] or 'application/octet-stream',
+        )
+        await response(scope, receive, send)
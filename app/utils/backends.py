@@ -0,0 +1,204 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+
+from config import settings
+
+
+class StateBackend(ABC):
+    size: int
+
+    def __init__(self, size: int = settings.state_size):
+        self.size = size
+
+    @abstractmethod
+    async def put(self, key: str, value: dict, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    async def pop(self, key: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
+
+
+class MemoryBackend(StateBackend):
+    states: OrderedDict[str, tuple[float, dict]]
+
+    def __init__(self, size: int = settings.state_size):
+        super().__init__(size=size)
+        self.states = OrderedDict()
+
+    async def put(self, key: str, value: dict, ttl: float) -> None:
+        self.states[key] = (time.time() + ttl, value)
+        self.states.move_to_end(key)
+        while len(self.states) > self.size:
+            self.states.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[dict]:
+        item = self.states.get(key)
+        if not item or item[0] < time.time():
+            return None
+        return item[1]
+
+    async def pop(self, key: str) -> Optional[dict]:
+        item = self.states.pop(key, None)
+        if not item or item[0] < time.time():
+            return None
+        return item[1]
+
+    def stats(self) -> dict:
+        return {
+            'backend': 'memory',
+            'states': len(self.states),
+        }
+
+
+class SqliteBackend(StateBackend):
+    path: str
+    created: bool
+
+    def __init__(self, path: str = settings.state_path, size: int = settings.state_size):
+        super().__init__(size=size)
+        self.path = path
+        self.created = False
+
+    def connect(self) -> sqlite3.Connection:
+        # The file is created on first use, so importing a module that declares a store writes nothing
+        if not self.created:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with sqlite3.connect(self.path, timeout=10) as connection:
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS states (key TEXT PRIMARY KEY, expires REAL, value TEXT)',
+                )
+            self.created = True
+        return sqlite3.connect(self.path, timeout=10)
+
+    def put_sync(self, key: str, value: dict, ttl: float) -> None:
+        with self.connect() as connection:
+            connection.execute('DELETE FROM states WHERE expires < ?', (time.time(),))
+            connection.execute(
+                'INSERT OR REPLACE INTO states (key, expires, value) VALUES (?, ?, ?)',
+                (key, time.time() + ttl, json.dumps(value, default=str)),
+            )
+            connection.execute(
+                'DELETE FROM states WHERE key IN (SELECT key FROM states ORDER BY expires DESC LIMIT -1 OFFSET ?)',
+                (self.size,),
+            )
+
+    def get_sync(self, key: str) -> Optional[dict]:
+        with self.connect() as connection:
+            row = connection.execute(
+                'SELECT value FROM states WHERE key = ? AND expires >= ?',
+                (key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def pop_sync(self, key: str) -> Optional[dict]:
+        with self.connect() as connection:
+            row = connection.execute(
+                'SELECT value FROM states WHERE key = ? AND expires >= ?',
+                (key, time.time()),
+            ).fetchone()
+            connection.execute('DELETE FROM states WHERE key = ?', (key,))
+        return json.loads(row[0]) if row else None
+
+    async def put(self, key: str, value: dict, ttl: float) -> None:
+        await asyncio.to_thread(self.put_sync, key, value, ttl)
+
+    async def get(self, key: str) -> Optional[dict]:
+        return await asyncio.to_thread(self.get_sync, key)
+
+    async def pop(self, key: str) -> Optional[dict]:
+        return await asyncio.to_thread(self.pop_sync, key)
+
+    def stats(self) -> dict:
+        with self.connect() as connection:
+            states = connection.execute('SELECT COUNT(*) FROM states').fetchone()[0]
+        return {
+            'backend': 'sqlite',
+            'states': states,
+        }
+
+
+class RedisBackend(StateBackend):
+    prefix: str
+    states: int
+
+    def __init__(self, url: str = settings.state_redis_url, size: int = settings.state_size, prefix: str = 'fexps'):
+        from redis.asyncio import Redis
+        super().__init__(size=size)
+        self.redis = Redis.from_url(url)
+        self.prefix = prefix
+        self.states = 0
+
+    def get_key(self, key: str) -> str:
+        return f'{self.prefix}:state:{key}'
+
+    async def put(self, key: str, value: dict, ttl: float) -> None:
+        # A sorted set of keys by expiry keeps the store bounded like the other backends
+        index, expires = f'{self.prefix}:states', time.time() + ttl
+        async with self.redis.pipeline() as pipeline:
+            pipeline.set(self.get_key(key=key), json.dumps(value, default=str), px=max(int(ttl * 1000), 1))
+            pipeline.zadd(index, {key: expires})
+            pipeline.zremrangebyscore(index, '-inf', time.time())
+            pipeline.zcard(index)
+            *_, states = await pipeline.execute()
+        if states > self.size:
+            evicted = await self.redis.zpopmin(index, states - self.size)
+            await self.redis.delete(*[self.get_key(key=key_.decode()) for key_, _ in evicted])
+        self.states = min(states, self.size)
+
+    async def get(self, key: str) -> Optional[dict]:
+        value = await self.redis.get(self.get_key(key=key))
+        return json.loads(value) if value else None
+
+    async def pop(self, key: str) -> Optional[dict]:
+        value = await self.redis.getdel(self.get_key(key=key))
+        await self.redis.zrem(f'{self.prefix}:states', key)
+        return json.loads(value) if value else None
+
+    def stats(self) -> dict:
+        return {
+            'backend': 'redis',
+            'states': self.states,
+        }
+
+
+BACKENDS = {
+    'memory': MemoryBackend,
+    'sqlite': SqliteBackend,
+    'redis': RedisBackend,
+}
+
+
+def get_backend(name: str = settings.state_backend) -> StateBackend:
+    return BACKENDS[name]()
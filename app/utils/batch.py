@@ -0,0 +1,123 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import json
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+from flet_core import Control, Page
+from flet_core.protocol import ClientMessage, ClientActions, CommandEncoder
+
+FRAME_OVERHEAD = len(json.dumps(
+    ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, []),
+    cls=CommandEncoder,
+    separators=(',', ':'),
+))
+
+current_batch: ContextVar[Optional['UpdateBatch']] = ContextVar('current_batch', default=None)
+
+
+def install(page: Page) -> None:
+    # Updates are routed per context, so only the task that opened a batch is collected
+    if 'update_async' in vars(page):
+        return
+    update, update_async = page.update, page.update_async
+
+    def update_(*controls: Control) -> None:
+        batch = current_batch.get()
+        if batch and batch.page is page:
+            return batch.collect(*controls)
+        return update(*controls)
+
+    async def update_async_(*controls: Control) -> None:
+        batch = current_batch.get()
+        if batch and batch.page is page:
+            return batch.collect(*controls)
+        return await update_async(*controls)
+
+    page.update, page.update_async = update_, update_async_
+
+
+class UpdateBatch:
+    stats = {
+        'batches': 0,
+        'calls': 0,
+        'frames': 0,
+        'frames_saved': 0,
+        'bytes_saved': 0,
+    }
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.controls: list[Control] = []
+        self.calls = 0
+        self.nested = False
+        self.token = None
+
+    async def __aenter__(self):
+        batch = current_batch.get()
+        self.nested = batch is not None and batch.page is self.page
+        if not self.nested:
+            install(page=self.page)
+            self.token = current_batch.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.nested:
+            return
+        current_batch.reset(self.token)
+        await self.flush()
+
+    def collect(self, *controls: Control) -> None:
+        self.calls += 1
+        for control in controls or (self.page,):
+            if control not in self.controls:
+                self.controls.append(control)
+
+    def get_roots(self) -> list[Control]:
+        if self.page in self.controls:
+            return [self.page]
+        roots = []
+        for control in self.controls:
+            if not control.page:
+                continue
+            parent = control.parent
+            while parent and parent not in self.controls:
+                parent = parent.parent
+            if not parent:
+                roots.append(control)
+        return roots
+
+    async def flush(self) -> None:
+        if not self.calls:
+            return
+        await self.page.update_async(*self.get_roots())
+        frames_saved = self.calls - 1
+        self.stats['batches'] += 1
+        self.stats['calls'] += self.calls
+        self.stats['frames'] += 1
+        self.stats['frames_saved'] += frames_saved
+        self.stats['bytes_saved'] += frames_saved * FRAME_OVERHEAD
+
+
+def batch_updates(func):
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        async with UpdateBatch(page=self.client.page):
+            return await func(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,93 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from typing import Any, Awaitable, Callable, Optional
+
+from flet_core import Control
+
+
+def get_field(model: Any, path: str) -> Any:
+    for key in path.split('.'):
+        if model is None:
+            return None
+        model = model.get(key)
+    return model
+
+
+class Binding:
+    control: Control
+    fields: list[str]
+    render: Callable[[], Awaitable[Any]]
+    attr: str
+
+    def __init__(self, control: Control, fields: list[str], render: Callable[[], Awaitable[Any]], attr: str):
+        self.control = control
+        self.fields = fields
+        self.render = render
+        self.attr = attr
+
+    def is_changed(self, model_1: Any, model_2: Any) -> bool:
+        return any(get_field(model_1, path) != get_field(model_2, path) for path in self.fields)
+
+
+class Bindings:
+    structure: list[str]
+    model: Optional[dict]
+    regions: dict[Optional[str], list[Binding]]
+
+    def __init__(self, structure: list[str]):
+        self.structure = structure
+        self.model = None
+        self.regions = {}
+
+    def reset(self, model: dict) -> None:
+        self.model = model
+        self.regions = {}
+
+    def clear(self, region: str) -> None:
+        # A rebuilt region replaces its controls, bindings to the detached ones must go with them
+        self.regions.pop(region, None)
+
+    def bind(
+            self,
+            control: Control,
+            fields: list[str],
+            render: Callable[[], Awaitable[Any]],
+            attr: str = 'value',
+            region: str = None,
+    ) -> Control:
+        self.regions.setdefault(region, []).append(Binding(control=control, fields=fields, render=render, attr=attr))
+        return control
+
+    async def apply(self, model: dict, update: bool = True) -> bool:
+        if self.model is None:
+            return False
+        if any(get_field(self.model, path) != get_field(model, path) for path in self.structure):
+            return False
+        changed = []
+        items = [item for region_items in self.regions.values() for item in region_items]
+        for item in items:
+            if not item.is_changed(self.model, model):
+                continue
+            setattr(item.control, item.attr, await item.render())
+            changed.append(item.control)
+        self.model = model
+        if update:
+            for control in changed:
+                if control.page:
+                    await control.update_async()
+        return True
@@ -15,10 +15,16 @@
 #
 
 
-from hashlib import md5
+import hmac
+from hashlib import md5, sha256
 from secrets import token_hex
 
+from config import settings
+
 
 def create_id_str():
     return token_hex(8)
 
+
+def get_token_hash(token: str) -> str:
+    return hmac.new(settings.secret_key.encode(), token.encode(), sha256).hexdigest()
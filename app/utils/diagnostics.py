@@ -0,0 +1,227 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Optional
+from weakref import WeakSet
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.utils.api import ApiUnavailableException, references, resilience, scheduler, snapshot
+from app.utils.batch import UpdateBatch
+from app.utils.resume import resume_store
+from app.utils.routes import add_route
+from app.utils.templates import templates
+from app.utils.texts import missing_texts
+from app.utils.updater.runner import Updater
+from app.utils.uploads import previews
+from config import settings
+from fexps_api_client import FexpsApiClient
+from fexps_api_client.utils import ApiException
+
+LAG_BUCKETS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+TASK_ORIGINS = [
+    ('Updater.', 'updater'),
+    ('Session.start_updater', 'updater'),
+    ('ChatWebSockets.', 'chat'),
+    ('FileWebSockets.', 'file_sockets'),
+    ('Ticker.', 'timers'),
+    ('Session.', 'session'),
+]
+
+sessions = WeakSet()
+
+
+class LoopMonitor:
+    interval: float
+    buckets: list[int]
+    lag_max: float
+    task: Optional[asyncio.Task]
+
+    def __init__(self, interval: float = settings.diagnostics_interval):
+        self.interval = interval
+        self.buckets = [0] * (len(LAG_BUCKETS) + 1)
+        self.lag_max = 0
+        self.task = None
+
+    def start(self) -> None:
+        if not self.task or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+
+    async def run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = (time.perf_counter() - started - self.interval) * 1000
+            self.buckets[bisect_left(LAG_BUCKETS, lag)] += 1
+            self.lag_max = max(self.lag_max, lag)
+
+    def stats(self) -> dict:
+        return {
+            'histogram_ms': {
+                f'<={bucket}' if bucket is not None else f'>{LAG_BUCKETS[-1]}': count
+                for bucket, count in zip([*LAG_BUCKETS, None], self.buckets)
+            },
+            'max_ms': round(self.lag_max, 2),
+        }
+
+
+loop_monitor = LoopMonitor()
+
+
+def get_task_origin(task: asyncio.Task) -> str:
+    name = getattr(task.get_coro(), '__qualname__', '')
+    for prefix, origin in TASK_ORIGINS:
+        if name.startswith(prefix):
+            return origin
+    return 'other'
+
+
+def get_tasks() -> dict:
+    tasks = asyncio.all_tasks()
+    return {
+        'total': len(tasks),
+        'by_origin': dict(Counter(get_task_origin(task=task) for task in tasks)),
+    }
+
+
+def set_tracemalloc(action: Optional[str]) -> None:
+    if action == 'start' and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif action == 'stop' and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def get_tracemalloc_top() -> list[dict]:
+    return [
+        {'line': str(stat.traceback), 'size': stat.size, 'count': stat.count}
+        for stat in tracemalloc.take_snapshot().statistics('lineno')[:settings.diagnostics_top]
+    ]
+
+
+async def get_tracemalloc() -> dict:
+    if not tracemalloc.is_tracing():
+        return {'tracing': False}
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        'tracing': True,
+        'current': current,
+        'peak': peak,
+        # Walking every traced block takes long enough to stall the loop
+        'top': await asyncio.to_thread(get_tracemalloc_top),
+    }
+
+
+class AdminTokens:
+    ttl: float
+    tokens: dict[str, float]
+
+    def __init__(self, ttl: float = settings.diagnostics_auth_ttl):
+        self.ttl = ttl
+        self.tokens = {}
+
+    async def check(self, token: Optional[str]) -> bool:
+        if not token:
+            return False
+        now = time.monotonic()
+        if self.tokens.get(token, 0) > now:
+            return True
+        api = FexpsApiClient(url=settings.get_url(), token=token)
+        try:
+            account = await resilience.read(path=('client', 'accounts', 'get'), func=api.client.accounts.get)
+        except ApiUnavailableException:
+            raise
+        except ApiException:
+            return False
+        if 'admin' not in account.permissions:
+            return False
+        self.tokens = {token_: expires for token_, expires in self.tokens.items() if expires > now}
+        self.tokens[token] = now + self.ttl
+        return True
+
+
+admin_tokens = AdminTokens()
+
+
+async def check_admin(request: Request) -> Optional[JSONResponse]:
+    token = request.headers.get('authorization', '').removeprefix('Bearer ')
+    try:
+        if await admin_tokens.check(token=token):
+            return None
+    except ApiUnavailableException:
+        return JSONResponse(content={'detail': 'Unavailable'}, status_code=503)
+    return JSONResponse(content={'detail': 'Forbidden'}, status_code=403)
+
+
+async def diagnostics(request: Request) -> JSONResponse:
+    error = await check_admin(request=request)
+    if error:
+        return error
+    return JSONResponse(
+        content={
+            'loop_lag': loop_monitor.stats(),
+            'tasks': get_tasks(),
+            'sessions': {
+                'total': len(sessions),
+                'connected': sum(1 for session in list(sessions) if session.updater),
+            },
+            'updater': Updater.stats,
+            'batches': UpdateBatch.stats,
+            'references': references.stats(),
+            'snapshot': snapshot.stats(),
+            'resilience': resilience.stats(),
+            'scheduler': scheduler.stats(),
+            'resume': resume_store.stats(),
+            'templates': templates.stats(),
+            'previews': previews.stats(),
+            'missing_texts': dict(missing_texts.most_common(settings.diagnostics_top)),
+            'tracemalloc': await get_tracemalloc(),
+        },
+    )
+
+
+async def diagnostics_tracemalloc(request: Request, action: str) -> JSONResponse:
+    error = await check_admin(request=request)
+    if error:
+        return error
+    set_tracemalloc(action=action)
+    return JSONResponse(content={'tracing': tracemalloc.is_tracing()})
+
+
+def add_diagnostics(app: FastAPI) -> None:
+    lifespan_context = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_: FastAPI):
+        async with lifespan_context(app_) as state:
+            loop_monitor.start()
+            yield state
+            loop_monitor.stop()
+
+    app.router.lifespan_context = lifespan
+    add_route(app=app, path='/admin/diagnostics', endpoint=diagnostics)
+    add_route(app=app, path='/admin/diagnostics/tracemalloc', endpoint=diagnostics_tracemalloc, methods=['POST'])
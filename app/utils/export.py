@@ -0,0 +1,223 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import csv
+import io
+import secrets
+from collections import deque
+from functools import cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from app.utils.backends import RedisBackend, SqliteBackend, StateBackend
+from app.utils.routes import add_route
+from app.utils.value import value_to_float
+from config import settings
+from fexps_api_client import FexpsApiClient
+
+
+async def iter_pages(
+        search: Callable[..., Awaitable],
+        key: str,
+        concurrency: int = settings.export_concurrency,
+        **kwargs,
+) -> AsyncIterator[Any]:
+    first = await search(page=1, **kwargs)
+    for item in first[key]:
+        yield item
+    pages = iter(range(2, (first.pages or 1) + 1))
+    tasks = deque(
+        asyncio.create_task(search(page=page, **kwargs))
+        for _, page in zip(range(concurrency), pages)
+    )
+    try:
+        while tasks:
+            result = await tasks.popleft()
+            page = next(pages, None)
+            if page:
+                tasks.append(asyncio.create_task(search(page=page, **kwargs)))
+            for item in result[key]:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def iter_map(
+        items: AsyncIterator[Any],
+        func: Callable[[Any], Awaitable],
+        concurrency: int = settings.export_concurrency,
+) -> AsyncIterator[Any]:
+    tasks = deque()
+    try:
+        async for item in items:
+            tasks.append(asyncio.create_task(func(item)))
+            if len(tasks) >= concurrency:
+                yield await tasks.popleft()
+        while tasks:
+            yield await tasks.popleft()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def get_date(value: Any) -> str:
+    return value.strftime(settings.datetime_format) if value else ''
+
+
+def get_currency_value(value: Optional[int], currency: Any) -> Optional[float]:
+    return value_to_float(value=value, decimal=currency.decimal if currency else settings.default_decimal)
+
+
+async def iter_transfers(api, wallet_id: int) -> AsyncIterator[list]:
+    yield ['id', 'date', 'type', 'operation', 'from', 'to', 'value', 'order']
+    async for transfer in iter_pages(
+            search=api.client.transfers.search,
+            key='transfers',
+            wallet_id=wallet_id,
+            is_sender=True,
+            is_receiver=True,
+    ):
+        yield [
+            transfer.id,
+            get_date(transfer.date),
+            transfer.type,
+            transfer.operation,
+            transfer.account_from.short_name if transfer.account_from else '',
+            transfer.account_to.short_name if transfer.account_to else '',
+            value_to_float(value=transfer.value),
+            transfer.order.id if transfer.order else '',
+        ]
+
+
+def iter_request_pages(api) -> AsyncIterator[Any]:
+    return iter_pages(
+        search=api.client.requests.search,
+        key='requests',
+        is_active=True,
+        is_completed=True,
+        is_canceled=True,
+    )
+
+
+async def iter_requests(api) -> AsyncIterator[list]:
+    yield [
+        'id', 'date', 'type', 'state', 'input_currency', 'input_currency_value', 'input_value',
+        'output_currency', 'output_currency_value', 'output_value',
+    ]
+    async for request in iter_request_pages(api=api):
+        input_currency = request.input_method.currency if request.input_method else None
+        output_currency = request.output_method.currency if request.output_method else None
+        yield [
+            request.id,
+            get_date(request.date),
+            request.type,
+            request.state,
+            input_currency.id_str.upper() if input_currency else '',
+            get_currency_value(value=request.input_currency_value, currency=input_currency),
+            value_to_float(value=request.input_value),
+            output_currency.id_str.upper() if output_currency else '',
+            get_currency_value(value=request.output_currency_value, currency=output_currency),
+            value_to_float(value=request.output_value),
+        ]
+
+
+async def iter_orders(api) -> AsyncIterator[list]:
+    yield ['id', 'request', 'type', 'state', 'currency', 'currency_value', 'value', 'rate']
+
+    async def get_orders(request) -> list:
+        return await api.client.orders.list_get.by_request(request_id=request.id)
+
+    async for orders in iter_map(items=iter_request_pages(api=api), func=get_orders):
+        for order in orders:
+            yield [
+                order.id,
+                order.request.id if order.request else '',
+                order.type,
+                order.state,
+                order.currency.id_str.upper() if order.currency else '',
+                get_currency_value(value=order.currency_value, currency=order.currency),
+                value_to_float(value=order.value),
+                order.rate,
+            ]
+
+
+EXPORTS = {
+    'transfers': iter_transfers,
+    'requests': iter_requests,
+    'orders': iter_orders,
+}
+
+
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def get_csv_cell(value: Any) -> Any:
+    # Spreadsheets run text cells starting with these characters as formulas
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+async def iter_csv(rows: AsyncIterator[list]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    async for row in rows:
+        writer.writerow([get_csv_cell(value=value) for value in row])
+        if buffer.tell() >= settings.export_chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+@cache
+def get_export_tickets() -> StateBackend:
+    # Tickets carry bearer tokens and are redeemed by whichever worker or node takes the download
+    if settings.state_backend == 'redis':
+        return RedisBackend(size=settings.export_tickets_size, prefix='fexps-export')
+    return SqliteBackend(path=settings.export_tickets_path, size=settings.export_tickets_size)
+
+
+async def get_export_url(token: str, deviation: Optional[int], name: str, **kwargs) -> str:
+    ticket = secrets.token_urlsafe(24)
+    await get_export_tickets().put(
+        key=ticket,
+        value={'token': token, 'deviation': deviation, 'name': name, 'kwargs': kwargs},
+        ttl=settings.export_ticket_ttl,
+    )
+    return f'/export/{ticket}'
+
+
+async def export(ticket: str):
+    value = await get_export_tickets().pop(key=ticket)
+    if not value:
+        return PlainTextResponse('Export link expired', status_code=404)
+    name = value['name']
+    api = FexpsApiClient(url=settings.get_url(), token=value['token'], deviation=value['deviation'])
+    return StreamingResponse(
+        iter_csv(rows=EXPORTS[name](api=api, **value['kwargs'])),
+        media_type='text/csv',
+        headers={'Content-Disposition': f'attachment; filename="{name}.csv"'},
+    )
+
+
+def add_export(app: FastAPI) -> None:
+    add_route(app=app, path='/export/{ticket}', endpoint=export)
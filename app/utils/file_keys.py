@@ -0,0 +1,82 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import logging
+from collections import deque
+from time import monotonic
+from typing import Any, Optional
+
+from app.utils.api import priority
+from config import settings
+
+
+class FileKey:
+    token: str
+    value: Any
+    created: float
+
+    def __init__(self, token: str, value: Any):
+        self.token = token
+        self.value = value
+        self.created = monotonic()
+
+
+class FileKeys:
+    size: int
+    ttl: float
+    keys: deque[FileKey]
+    task: Optional[asyncio.Task]
+
+    def __init__(self, session, size: int = settings.file_keys_size, ttl: float = settings.file_keys_ttl):
+        self.session = session
+        self.size = size
+        self.ttl = ttl
+        self.keys = deque()
+        self.task = None
+
+    def is_valid(self, key: FileKey) -> bool:
+        return key.token == self.session.token and monotonic() - key.created < self.ttl
+
+    def clean(self) -> None:
+        self.keys = deque(key for key in self.keys if self.is_valid(key=key))
+
+    async def create(self) -> FileKey:
+        token = self.session.token
+        return FileKey(token=token, value=await self.session.api.client.files.keys.create())
+
+    async def fill(self) -> None:
+        priority.set('prefetch')
+        try:
+            while True:
+                self.clean()
+                if len(self.keys) >= self.size:
+                    return
+                self.keys.append(await self.create())
+        except Exception as exception:
+            logging.warning(f'File keys refill pass | {exception}')
+
+    def refill(self) -> None:
+        if not self.session.token or (self.task and not self.task.done()):
+            return
+        self.task = asyncio.create_task(self.fill())
+
+    async def get(self) -> Any:
+        self.clean()
+        key = self.keys.popleft() if self.keys else await self.create()
+        self.refill()
+        return key.value
@@ -17,6 +17,9 @@
 
 from flet_manager.utils import Font
 
+from app.utils.assets import get_asset_url
+from app.utils.subsets import get_default_subset
+
 
 class Fonts:
     REGULAR = Font(path='fonts/GolosText-Regular.ttf')
@@ -31,3 +34,18 @@ fonts = [
     Fonts.SEMIBOLD,
     Fonts.BOLD,
 ]
+
+
+def get_fonts_paths() -> dict[str, str]:
+    return {font.name: get_asset_url(path=font.path) for font in fonts}
+
+
+def get_default_fonts() -> list[Font]:
+    # Registered with the app so the first view renders before the session picks its language subset
+    paths = get_default_subset() or get_fonts_paths()
+    default_fonts = []
+    for font in fonts:
+        default_font = Font(path=font.path)
+        default_font.path = paths[font.name]
+        default_fonts.append(default_font)
+    return default_fonts
@@ -15,11 +15,19 @@
 #
 
 
+from functools import cache
+
 from flet_manager.utils import get_svg as fm_get_svg
 
 
+@cache
+def get_svg_file(path: str) -> str:
+    # Cached values are shared by every caller, so the read lines are joined into an immutable string
+    return ''.join(fm_get_svg(path=path))
+
+
 def get_svg(icon_name):
-    return fm_get_svg(f'assets/icons/app/{icon_name}.svg')
+    return get_svg_file(path=f'assets/icons/app/{icon_name}.svg')
 
 
 class Icons:
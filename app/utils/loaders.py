@@ -0,0 +1,45 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from app.utils.api import priority
+
+
+class Loaders:
+    loaders: dict[str, Callable[[Any], Awaitable]]
+
+    def __init__(self, **loaders: Callable[[Any], Awaitable]):
+        self.loaders = loaders
+
+    def start(self, view: Any) -> asyncio.Task:
+        task = asyncio.create_task(self.load(view=view))
+        # Navigation may be abandoned before construct() awaits the result
+        task.add_done_callback(lambda task_: task_.cancelled() or task_.exception())
+        return task
+
+    async def load(self, view: Any) -> dict:
+        priority.set('view_load')
+        tasks = [asyncio.ensure_future(loader(view)) for loader in self.loaders.values()]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return dict(zip(self.loaders, results))
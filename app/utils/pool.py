@@ -0,0 +1,73 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+from config import settings
+
+
+class AccountState:
+    token: str
+    api: Any
+    account: Any
+    timezone: Any
+    wallets: Optional[list]
+    current_wallet: Optional[dict]
+    snapshots: dict
+
+    def __init__(
+            self,
+            token: str,
+            api: Any,
+            account: Any,
+            timezone: Any,
+            wallets: Optional[list],
+            current_wallet: Optional[dict],
+            snapshots: dict = None,
+    ):
+        self.token = token
+        self.api = api
+        self.account = account
+        self.timezone = timezone
+        self.wallets = wallets
+        self.current_wallet = current_wallet
+        self.snapshots = snapshots or {}
+
+
+class AccountPool:
+    size: int
+    states: OrderedDict[int, AccountState]
+
+    def __init__(self, size: int = settings.max_accounts):
+        self.size = size
+        self.states = OrderedDict()
+
+    def get(self, account_id: int) -> Optional[AccountState]:
+        state = self.states.get(account_id)
+        if state:
+            self.states.move_to_end(account_id)
+        return state
+
+    def put(self, account_id: int, state: AccountState) -> None:
+        self.states[account_id] = state
+        self.states.move_to_end(account_id)
+        while len(self.states) > self.size:
+            self.states.popitem(last=False)
+
+    def remove(self, account_id: int) -> None:
+        self.states.pop(account_id, None)
@@ -0,0 +1,150 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import secrets
+from importlib import import_module
+from typing import Any, Optional
+
+from addict import Dict
+
+from app.utils.backends import StateBackend, get_backend
+from config import settings
+
+
+class ViewState:
+    path: str
+    kwargs: dict
+
+    def __init__(self, path: str, kwargs: dict):
+        self.path = path
+        self.kwargs = kwargs
+
+    @staticmethod
+    def from_views(views: list) -> list['ViewState']:
+        states = []
+        for view in views:
+            fields = getattr(view, 'resume_fields', None)
+            if fields is None:
+                break
+            states.append(
+                ViewState(
+                    path=f'{type(view).__module__}:{type(view).__qualname__}',
+                    kwargs={field: getattr(view, field) for field in fields},
+                ),
+            )
+        return states
+
+    def create(self) -> Any:
+        module, name = self.path.split(':')
+        return getattr(import_module(module), name)(**self.kwargs)
+
+    def to_dict(self) -> dict:
+        return {'path': self.path, 'kwargs': self.kwargs}
+
+    @staticmethod
+    def from_dict(value: dict) -> 'ViewState':
+        return ViewState(path=value['path'], kwargs=value['kwargs'])
+
+
+class ResumeState:
+    token_hash: str
+    language: Optional[str]
+    debug: bool
+    account: Dict
+    timezone: Dict
+    wallets: list
+    current_wallet: Optional[dict]
+    snapshots: dict
+    views: list[ViewState]
+
+    def __init__(
+            self,
+            token_hash: str,
+            language: Optional[str],
+            debug: bool,
+            account: Any,
+            timezone: Any,
+            wallets: list,
+            current_wallet: Optional[dict],
+            snapshots: dict,
+            views: list[ViewState],
+    ):
+        self.token_hash = token_hash
+        self.language = language
+        self.debug = debug
+        self.account = Dict(account)
+        self.timezone = Dict(timezone)
+        self.wallets = [Dict(wallet) for wallet in wallets or []]
+        self.current_wallet = current_wallet
+        self.snapshots = Dict(snapshots)
+        self.views = views
+
+    def to_dict(self) -> dict:
+        return {
+            'token_hash': self.token_hash,
+            'language': self.language,
+            'debug': self.debug,
+            'account': self.account,
+            'timezone': self.timezone,
+            'wallets': self.wallets,
+            'current_wallet': self.current_wallet,
+            'snapshots': self.snapshots,
+            'views': [view.to_dict() for view in self.views],
+        }
+
+    @staticmethod
+    def from_dict(value: dict) -> 'ResumeState':
+        return ResumeState(**{
+            **value,
+            'views': [ViewState.from_dict(view) for view in value['views']],
+        })
+
+
+class ResumeStore:
+    backend: StateBackend
+    ttl: float
+
+    def __init__(self, backend: StateBackend = None, ttl: float = settings.resume_ttl):
+        self.backend = backend or get_backend()
+        self.ttl = ttl
+        self.saved = 0
+        self.resumed = 0
+
+    @staticmethod
+    def create_token() -> str:
+        return secrets.token_urlsafe(24)
+
+    async def put(self, resume_token: str, state: ResumeState) -> None:
+        await self.backend.put(key=resume_token, value=state.to_dict(), ttl=self.ttl)
+        self.saved += 1
+
+    async def pop(self, resume_token: str) -> Optional[ResumeState]:
+        value = await self.backend.pop(key=resume_token)
+        if not value:
+            return None
+        self.resumed += 1
+        return ResumeState.from_dict(value=value)
+
+    def stats(self) -> dict:
+        return {
+            **self.backend.stats(),
+            'saved': self.saved,
+            'resumed': self.resumed,
+        }
+
+
+resume_store = ResumeStore()
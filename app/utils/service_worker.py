@@ -0,0 +1,165 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import json
+from functools import cache
+from hashlib import md5
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from flet_core.version import version as flet_version
+
+from app.utils.assets import SUBSETS_DIR, get_manifest
+from app.utils.routes import add_route
+from config import settings
+
+SHELL = ['./', 'manifest.json', 'favicon.png']
+RUNTIME = ['flutter.js', 'main.dart.js', 'python.js', 'python-worker.js', 'version.json']
+# Not fingerprinted, an edited file must reach clients without a release bump
+NETWORK = ['assets/']
+BYPASS = ['assets/snapshots/', 'snapshots/']
+IMMUTABLE_ORIGINS = ['https://www.gstatic.com/flutter-canvaskit/', 'https://fonts.gstatic.com/']
+SERVICE_WORKER = '''\'use strict\';
+const VERSION = %(version)s;
+const PREFIX = 'fexps-';
+const CACHE = PREFIX + VERSION;
+const SHELL = %(shell)s;
+const RUNTIME = %(runtime)s;
+const NETWORK = %(network)s;
+const BYPASS = %(bypass)s;
+const IMMUTABLE = new Set(%(immutable)s);
+const IMMUTABLE_DIRS = %(immutable_dirs)s;
+const IMMUTABLE_ORIGINS = %(immutable_origins)s;
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    caches.open(CACHE)
+      .then((cache) => cache.addAll([...SHELL, 'flutter.js', 'main.dart.js']))
+      .catch(() => null)
+      .then(() => self.skipWaiting()),
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((keys) => Promise.all(
+        keys.filter((key) => key.startsWith(PREFIX) && key !== CACHE).map((key) => caches.delete(key)),
+      ))
+      .then(() => self.clients.claim()),
+  );
+});
+
+function getStrategy(request) {
+  if (request.method !== 'GET') {
+    return null;
+  }
+  const url = new URL(request.url);
+  if (IMMUTABLE_ORIGINS.some((origin) => request.url.startsWith(origin))) {
+    return cacheFirst;
+  }
+  if (url.origin !== self.location.origin) {
+    return null;
+  }
+  if (request.mode === 'navigate') {
+    return networkFirst;
+  }
+  const path = new URL(url.pathname, self.registration.scope).href.slice(self.registration.scope.length);
+  if (BYPASS.some((dir) => path.startsWith(dir))) {
+    return null;
+  }
+  if (IMMUTABLE.has(path) || IMMUTABLE_DIRS.some((dir) => path.startsWith(dir))) {
+    return cacheFirst;
+  }
+  if (RUNTIME.includes(path)) {
+    return cacheFirst;
+  }
+  if (SHELL.includes(path) || NETWORK.some((dir) => path.startsWith(dir))) {
+    return networkFirst;
+  }
+  return null;
+}
+
+async function cacheFirst(request) {
+  const cache = await caches.open(CACHE);
+  const cached = await cache.match(request);
+  if (cached) {
+    return cached;
+  }
+  const response = await fetch(request);
+  if (response.ok || response.type === 'opaque') {
+    cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function networkFirst(request) {
+  const cache = await caches.open(CACHE);
+  try {
+    const response = await fetch(request);
+    if (response.ok) {
+      cache.put(request.mode === 'navigate' ? './' : request, response.clone());
+    }
+    return response;
+  } catch (error) {
+    const cached = await cache.match(request.mode === 'navigate' ? './' : request);
+    if (cached) {
+      return cached;
+    }
+    throw error;
+  }
+}
+
+self.addEventListener('fetch', (event) => {
+  const strategy = getStrategy(event.request);
+  if (strategy) {
+    event.respondWith(strategy(event.request));
+  }
+});
+'''
+
+
+def get_service_worker() -> str:
+    return build_service_worker(immutable=tuple(sorted(get_manifest()['files'].values())))
+
+
+@cache
+def build_service_worker(immutable: tuple[str, ...]) -> str:
+    # Runtime files are only versioned by the flet release and the app version
+    version = md5(json.dumps([settings.version, flet_version, list(immutable)]).encode()).hexdigest()[:12]
+    return SERVICE_WORKER % {
+        'version': json.dumps(version),
+        'shell': json.dumps(SHELL),
+        'runtime': json.dumps(RUNTIME),
+        'network': json.dumps(NETWORK),
+        'bypass': json.dumps(BYPASS),
+        'immutable': json.dumps(list(immutable)),
+        'immutable_dirs': json.dumps([f'{SUBSETS_DIR}/']),
+        'immutable_origins': json.dumps(IMMUTABLE_ORIGINS),
+    }
+
+
+async def service_worker() -> Response:
+    return Response(
+        content=get_service_worker(),
+        media_type='application/javascript',
+        headers={'Cache-Control': 'no-cache', 'Service-Worker-Allowed': '/'},
+    )
+
+
+def add_service_worker(app: FastAPI) -> None:
+    add_route(app=app, path='/sw.js', endpoint=service_worker)
@@ -23,8 +23,17 @@ from flet_core import Page
 from flet_manager.utils import Client
 
 from app.utils import Icons
+from app.utils.api import Api, ApiOutcomeUnknownException, snapshot
+from app.utils.crypto import get_token_hash
+from app.utils.fonts import get_fonts_paths
+from app.utils.diagnostics import sessions
+from app.utils.export import get_export_url
+from app.utils.file_keys import FileKeys
+from app.utils.pool import AccountPool, AccountState
 from app.utils.registration import Registration
-from app.utils.value import value_replace
+from app.utils.resume import ResumeState, ViewState, resume_store
+from app.utils.updater.runner import Updater
+from app.utils.texts import TextPack
 from config import settings
 from fexps_api_client import FexpsApiClient
 from fexps_api_client.utils import ApiException
@@ -39,7 +48,8 @@ class Session:
     text_pack_id: int | None
     text_pack_language: str | None
     text_pack: dict | None
-    api: FexpsApiClient | None
+    texts: TextPack
+    api: Api | None
     registration: Registration
     current_wallet: None
     wallets: list | None
@@ -49,19 +59,45 @@ class Session:
     datepicker: Any
     filepicker: Any
     answers: dict | None
+    pool: AccountPool
+    file_keys: FileKeys
+    snapshots: dict
+    updater_runner: Updater | None
+    resume_token: str | None
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, pool: AccountPool = None):
         self.client = client
         self.page = client.page
+        sessions.add(self)
         self.accounts: list[dict] = []
         self.account = None
         self.timezone = None
         self.updater = True
+        self.updater_runner = None
+        self.resume_token = None
+        self.pool = pool or AccountPool()
+        self.file_keys = FileKeys(session=self)
+        self.text_pack_language = None
+        self.text_pack = None
+        self.texts = TextPack()
+        self.snapshots = {}
 
     async def error(self, exception: ApiException):
+        if isinstance(exception, ApiOutcomeUnknownException):
+            await self.refetch()
         title = await self.gtv(key=f'error_{exception.code}', **exception.kwargs)
         await self.bs_error.open_(title=title, icon=Icons.ERROR)
 
+    async def refetch(self) -> None:
+        # The write may have been applied, the current view reloads to show what the backend holds
+        view = self.page.views[-1] if self.page.views else None
+        if not hasattr(view, 'restart'):
+            return
+        try:
+            await view.restart()
+        except ApiException as exception:
+            logging.warning(f'Refetch after unknown write outcome pass | {exception}')
+
     async def init_bs(self):
         from app.controls.information.bottom_sheet import BottomSheet
         from app.controls.input.file_picker import FilePicker
@@ -87,13 +123,14 @@ class Session:
         from app.views.auth.init import InitView
         if len(self.accounts) == 1:
             return False
+        account_dict_next = None
         if account_id:
             if account_id == self.account.id:
                 return False
             for account_dict in self.accounts:
                 if account_id != account_dict['id']:
                     continue
-                await self.set_cs(key='token', value=account_dict['token'])
+                account_dict_next = account_dict
         elif account_next:
             i = None
             for i, account_dict in enumerate(self.accounts):
@@ -104,17 +141,77 @@ class Session:
             i += 1
             if i >= len(self.accounts):
                 i -= len(self.accounts)
-            await self.set_cs(key='token', value=self.accounts[i]['token'])
+            account_dict_next = self.accounts[i]
+        await self.forget_resume()
+        if account_dict_next:
+            await self.set_cs(key='token', value=account_dict_next['token'])
         await self.set_cs(key='current_wallet', value=None)
-        await change_view(view=InitView(), delete_current=True)
+        state = self.pool.get(account_id=account_dict_next['id']) if account_dict_next else None
+        if not state or state.token != account_dict_next['token']:
+            await change_view(view=InitView(), delete_current=True)
+            return
+        await self.switch_state(state=state)
+
+    def save_state(self) -> None:
+        if not self.account:
+            return
+        self.pool.put(
+            account_id=self.account.id,
+            state=AccountState(
+                token=self.token,
+                api=self.api,
+                account=self.account,
+                timezone=self.timezone,
+                wallets=self.wallets,
+                current_wallet=self.current_wallet,
+                snapshots=self.snapshots,
+            ),
+        )
+
+    def load_state(self, state: AccountState) -> None:
+        self.token = state.token
+        self.api = state.api
+        self.account = state.account
+        self.timezone = state.timezone
+        self.wallets = state.wallets
+        self.current_wallet = state.current_wallet
+        self.snapshots = state.snapshots
+
+    async def switch_state(self, state: AccountState) -> None:
+        from app.utils.updater.views.main import check_update_main_view
+        from app.views.main.main import MainView
+        self.save_state()
+        self.load_state(state=state)
+        await self.set_cs(key='current_wallet', value=self.current_wallet)
+        view = MainView()
+        await self.client.clear_views()
+        await self.client.change_view(view=view)
+        if self.snapshots:
+            await check_update_main_view(view=view, snapshots=self.snapshots)
+        asyncio.create_task(self.refresh_state())
+
+    async def refresh_state(self) -> None:
+        api, account_id = self.api, self.account.id
+        try:
+            account = await api.client.accounts.get()
+            wallets = await api.client.wallets.get_list()
+        except ApiException as exception:
+            logging.warning(f'Account state refresh pass | {exception}')
+            return
+        # The user may have switched account while the refresh was pending
+        if self.api is not api or account.id != account_id:
+            return
+        self.account, self.wallets = account, wallets
+        self.save_state()
+        await self.save_resume()
 
     async def init(self):
         self.token = await self.get_cs(key='token')
         self.accounts = await self.get_cs(key='accounts') or []
         self.language = await self.get_cs(key='language')
-        self.text_pack = await self.get_cs(key='text_pack')
+        self.set_texts(language=self.language, text_pack=await self.get_cs(key='text_pack'))
         self.current_wallet = await self.get_cs(key='current_wallet')
-        self.api = FexpsApiClient(url=settings.get_url(), token=self.token)
+        self.api = Api(api=FexpsApiClient(url=settings.get_url(), token=self.token))
         asyncio.create_task(self.start_updater())
         try:
             self.account = await self.api.client.accounts.get()
@@ -131,7 +228,9 @@ class Session:
                 self.accounts[account_index] = current_account_dict
             await self.set_cs(key='accounts', value=self.accounts)
             self.timezone = await self.api.client.timezones.get(id_str=self.account.timezone)
-            self.api = FexpsApiClient(url=settings.get_url(), token=self.token, deviation=self.timezone.deviation)
+            self.api = Api(
+                api=FexpsApiClient(url=settings.get_url(), token=self.token, deviation=self.timezone.deviation),
+            )
             if self.language != self.account.language:
                 await self.set_cs(key='language', value=self.language)
             self.wallets = await self.api.client.wallets.get_list()
@@ -142,12 +241,95 @@ class Session:
             if not self.debug:
                 await self.set_cs(key='debug', value=False)
                 self.debug = False
+            self.save_state()
+            await self.set_resume_token()
+            await self.save_resume()
         except ApiException:
             await self.set_cs(key='token', value=None)
             await self.set_cs(key='current_wallet', value=None)
             self.token = None
         await self.init_bs()
 
+    async def set_resume_token(self) -> None:
+        self.resume_token = resume_store.create_token()
+        await self.set_cs(key='resume', value=self.resume_token)
+
+    async def save_resume(self) -> None:
+        if not self.resume_token or not self.account:
+            return
+        await resume_store.put(
+            resume_token=self.resume_token,
+            state=ResumeState(
+                token_hash=get_token_hash(token=self.token),
+                language=self.language,
+                debug=self.debug,
+                account=self.account,
+                timezone=self.timezone,
+                wallets=self.wallets,
+                current_wallet=self.current_wallet,
+                snapshots=self.snapshots,
+                views=ViewState.from_views(views=self.page.views),
+            ),
+        )
+
+    async def forget_resume(self) -> None:
+        if self.resume_token:
+            await resume_store.pop(resume_token=self.resume_token)
+
+    async def resume(self) -> bool:
+        from app.utils.updater.views.main import check_update_main_view
+        from app.views.main.main import MainView
+        resume_token = await self.get_cs(key='resume')
+        state = await resume_store.pop(resume_token=resume_token) if resume_token else None
+        # Tokens are never stored with the state, the one in client storage must match its hash
+        token = await self.get_cs(key='token')
+        if not state or not token or state.token_hash != get_token_hash(token=token):
+            return False
+        self.accounts = await self.get_cs(key='accounts') or []
+        self.language = state.language
+        self.debug = state.debug
+        self.load_state(
+            state=AccountState(
+                token=token,
+                api=Api(
+                    api=FexpsApiClient(url=settings.get_url(), token=token, deviation=state.timezone.deviation),
+                ),
+                account=state.account,
+                timezone=state.timezone,
+                wallets=state.wallets,
+                current_wallet=state.current_wallet,
+                snapshots=state.snapshots,
+            ),
+        )
+        # Text packs are not stored with the state either, they come from the snapshot, client storage or the API
+        text_pack = await self.get_cs(key='text_pack')
+        if text_pack:
+            self.set_texts(language=state.language, text_pack=text_pack)
+        else:
+            try:
+                await self.get_text_pack(language=state.language)
+            except ApiException:
+                return False
+        self.save_state()
+        await self.set_resume_token()
+        await self.init_bs()
+        asyncio.create_task(self.start_updater())
+        await self.client.clear_views()
+        for view in [view_state.create() for view_state in state.views] or [MainView()]:
+            await self.client.change_view(view=view)
+            if isinstance(view, MainView) and self.snapshots:
+                await check_update_main_view(view=view, snapshots=self.snapshots)
+        asyncio.create_task(self.refresh_state())
+        return True
+
+    async def get_export_url(self, name: str, **kwargs) -> str:
+        return await get_export_url(
+            token=self.token,
+            deviation=self.timezone.deviation if self.timezone else None,
+            name=name,
+            **kwargs,
+        )
+
     # Client storage
     async def get_cs(self, key: str) -> Any:
         try:
@@ -169,19 +351,36 @@ class Session:
                 pass
 
     # Texts
+    def tv(self, key, **kwargs) -> str | None:
+        return self.texts.get(key, **kwargs)
+
+    def resolve(self, keys: list[str]) -> dict:
+        return self.texts.resolve(keys=keys)
+
+    def get_template_key(self, name: str) -> tuple:
+        permissions = self.account.permissions if self.account else []
+        return name, self.language, self.texts.version, 'admin' in permissions
+
     async def get_text_value(self, key):
-        if key:
-            return self.text_pack.get(key, f'404 {key}')
-        else:
-            return None
+        return self.texts.get(key)
 
     async def gtv(self, key, **kwargs):
-        return value_replace(await self.get_text_value(key=key), **kwargs)
+        return self.texts.get(key, **kwargs)
+
+    def set_texts(self, language: str | None, text_pack: dict | None) -> None:
+        texts = snapshot.get_texts(language=language)
+        self.text_pack_language = language
+        self.text_pack = None if texts else text_pack
+        self.texts = texts or TextPack(values=text_pack)
+        self.page.fonts = snapshot.get_fonts(language=language) or get_fonts_paths()
 
     async def get_text_pack(self, language: str = None):
         if not language:
             language = self.language
-        self.text_pack = await self.api.client.texts.packs.get(language=language)
+        if snapshot.get_texts(language=language):
+            self.set_texts(language=language, text_pack=None)
+            return
+        self.set_texts(language=language, text_pack=await self.api.client.texts.packs.get(language=language))
         await self.set_cs(key='text_pack', value=self.text_pack)
 
     async def start_updater(self):
@@ -206,17 +405,10 @@ class Session:
             (RequisiteView, check_update_requisite_view),
             (RequisiteOrderView, check_update_requisite_order_view),
         ]
-        while self.updater:
-            last_view = self.page.views[-1]
-            for type_, func in methods:
-                if not isinstance(last_view, type_):
-                    continue
-                # await func(view=last_view)
-                try:
-                    await func(view=last_view)
-                except Exception as exception:
-                    logging.critical(f'Updater pass {type_} | {exception}')
-            await asyncio.sleep(settings.update_interval)
+        self.updater_runner = Updater(page=self.page, methods=methods)
+        await self.updater_runner.run(is_running=lambda: self.updater)
 
     async def on_disconnect(self, _):
         self.updater = False
+        self.save_state()
+        await self.save_resume()
@@ -0,0 +1,108 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from typing import Optional
+
+from addict import Dict
+
+from app.utils.constants.order import OrderStates, OrderTypes
+from app.utils.constants.request import RequestStates
+
+
+class Roles:
+    REQUEST = 'request'
+    REQUISITE = 'requisite'
+
+
+class RequestActions:
+    CONFIRMATION = 'confirmation'
+    CANCELLATION = 'cancellation'
+
+
+class OrderActions:
+    PAYMENT = 'payment'
+    PAYMENT_CONFIRMATION = 'payment_confirmation'
+    ORDER_REQUEST_CREATE = 'order_request_create'
+    ORDER_REQUEST_ANSWER = 'order_request_answer'
+
+
+class StateMachine:
+    transitions: dict[str, list[str]]
+    actions: dict[tuple, list[str]]
+
+    def __init__(self, transitions: dict[str, list[str]], actions: dict[tuple, list[str]]):
+        self.transitions = transitions
+        self.actions = actions
+
+    def is_terminal(self, state: str) -> bool:
+        return not self.transitions.get(state)
+
+    def is_finished(self, entity: Optional[dict]) -> bool:
+        return isinstance(entity, dict) and self.is_terminal(state=entity.get('state'))
+
+    def get_actions(self, *key: Optional[str]) -> list[str]:
+        return self.actions.get(key, [])
+
+
+request_machine = StateMachine(
+    transitions={
+        RequestStates.CONFIRMATION: [
+            RequestStates.INPUT_RESERVATION, RequestStates.OUTPUT_RESERVATION, RequestStates.CANCELED,
+        ],
+        RequestStates.INPUT_RESERVATION: [RequestStates.INPUT, RequestStates.CANCELED],
+        RequestStates.INPUT: [RequestStates.OUTPUT_RESERVATION, RequestStates.COMPLETED, RequestStates.CANCELED],
+        RequestStates.OUTPUT_RESERVATION: [RequestStates.OUTPUT, RequestStates.CANCELED],
+        RequestStates.OUTPUT: [RequestStates.COMPLETED, RequestStates.CANCELED],
+        RequestStates.COMPLETED: [],
+        RequestStates.CANCELED: [],
+    },
+    # (state,)
+    actions={
+        (RequestStates.CONFIRMATION,): [RequestActions.CONFIRMATION],
+        (RequestStates.INPUT_RESERVATION,): [RequestActions.CANCELLATION],
+        (RequestStates.INPUT,): [RequestActions.CANCELLATION],
+        (RequestStates.OUTPUT_RESERVATION,): [RequestActions.CANCELLATION],
+        (RequestStates.OUTPUT,): [RequestActions.CANCELLATION],
+    },
+)
+
+order_machine = StateMachine(
+    transitions={
+        OrderStates.WAITING: [OrderStates.PAYMENT, OrderStates.CANCELED],
+        OrderStates.PAYMENT: [OrderStates.WAITING, OrderStates.CONFIRMATION, OrderStates.CANCELED],
+        OrderStates.CONFIRMATION: [OrderStates.PAYMENT, OrderStates.COMPLETED, OrderStates.CANCELED],
+        OrderStates.COMPLETED: [],
+        OrderStates.CANCELED: [],
+    },
+    # (role, type, state); an open order request replaces the state with None
+    actions={
+        (Roles.REQUEST, OrderTypes.INPUT, OrderStates.PAYMENT): [
+            OrderActions.ORDER_REQUEST_CREATE, OrderActions.PAYMENT,
+        ],
+        (Roles.REQUEST, OrderTypes.OUTPUT, OrderStates.PAYMENT): [OrderActions.ORDER_REQUEST_CREATE],
+        (Roles.REQUEST, OrderTypes.OUTPUT, OrderStates.CONFIRMATION): [OrderActions.PAYMENT_CONFIRMATION],
+        (Roles.REQUISITE, OrderTypes.INPUT, OrderStates.CONFIRMATION): [OrderActions.PAYMENT_CONFIRMATION],
+        (Roles.REQUISITE, OrderTypes.OUTPUT, OrderStates.PAYMENT): [OrderActions.PAYMENT],
+        (Roles.REQUISITE, OrderTypes.INPUT, None): [OrderActions.ORDER_REQUEST_ANSWER],
+        (Roles.REQUISITE, OrderTypes.OUTPUT, None): [OrderActions.ORDER_REQUEST_ANSWER],
+    },
+)
+
+
+def get_order_actions(role: str, order: Dict) -> list[str]:
+    state = None if order.order_request else order.state
+    return order_machine.get_actions(role, order.type, state)
@@ -0,0 +1,41 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from string import whitespace
+from typing import Iterable, Optional
+
+from app.utils.assets import get_manifest
+
+
+DEFAULT_SUBSET = 'latin-cyrillic'
+
+
+def get_subsets(language: str, values: Iterable[str]) -> Optional[dict[str, str]]:
+    # Subsets are built by build_assets.py. The language's own subset is the smallest,
+    # script subsets cover packs edited after the build, the smallest covering one wins
+    manifest = get_manifest()
+    chars = set().union(*values) - set(whitespace)
+    subsets = [manifest.get('languages', {}).get(language), *manifest.get('subsets', {}).values()]
+    for subset in subsets:
+        if subset and chars <= set(subset['chars']):
+            return subset['fonts']
+    return None
+
+
+def get_default_subset() -> Optional[dict[str, str]]:
+    subset = get_manifest().get('subsets', {}).get(DEFAULT_SUBSET)
+    return subset['fonts'] if subset else None
@@ -0,0 +1,116 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from collections import OrderedDict
+from copy import copy
+from types import MethodType
+from typing import Any, Callable
+
+from flet_core import Control
+
+from config import settings
+
+# Cloning copies Control internals of the pinned flet_core release
+PRIVATE_FIELDS = [
+    '_Control__page',
+    '_Control__uid',
+    '_Control__previous_children',
+    '_Control__attrs',
+    '_Control__event_handlers',
+]
+missing_fields = set(PRIVATE_FIELDS) - set(vars(Control()))
+if missing_fields:
+    raise ImportError(f'flet_core Control no longer has {", ".join(sorted(missing_fields))}, templates cannot clone')
+
+
+def copy_tree(value: Any, memo: dict, pending: list) -> Any:
+    if isinstance(value, list):
+        return [copy_tree(item, memo=memo, pending=pending) for item in value]
+    if not isinstance(value, Control):
+        return value
+    if id(value) in memo:
+        return memo[id(value)]
+    control = memo[id(value)] = copy(value)
+    fields = vars(control)
+    methods = []
+    for name, field in fields.items():
+        if isinstance(field, (Control, list)):
+            fields[name] = copy_tree(field, memo=memo, pending=pending)
+        elif isinstance(field, MethodType):
+            methods.append(name)
+    fields['_Control__page'] = None
+    fields['_Control__uid'] = None
+    fields['_Control__previous_children'] = []
+    fields['_Control__attrs'] = fields['_Control__attrs'].copy()
+    fields['_Control__event_handlers'] = fields['_Control__event_handlers'].copy()
+    fields['parent'] = None
+    if methods or fields['_Control__event_handlers']:
+        pending.append((fields, methods))
+    return control
+
+
+def rebind(handler: Any, memo: dict) -> Any:
+    if isinstance(handler, MethodType) and id(handler.__self__) in memo:
+        return MethodType(handler.__func__, memo[id(handler.__self__)])
+    return handler
+
+
+def clone(value: Any, owner: Any = None) -> Any:
+    memo, pending = {}, []
+    result = copy_tree(value, memo=memo, pending=pending)
+    for fields, methods in pending:
+        for name in methods:
+            fields[name] = rebind(fields[name], memo=memo)
+        handlers = fields['_Control__event_handlers']
+        for event, handler in handlers.items():
+            handlers[event] = getattr(owner, handler) if isinstance(handler, str) else rebind(handler, memo=memo)
+    return result
+
+
+class Templates:
+    size: int
+    templates: OrderedDict[tuple, Control | list[Control]]
+
+    def __init__(self, size: int = settings.templates_size):
+        self.size = size
+        self.templates = OrderedDict()
+        self.builds = 0
+        self.clones = 0
+
+    def get(self, key: tuple, build: Callable, owner: Any = None) -> Control | list[Control]:
+        template = self.templates.get(key)
+        if template is None:
+            self.builds += 1
+            template = self.templates[key] = build()
+            while len(self.templates) > self.size:
+                self.templates.popitem(last=False)
+        self.templates.move_to_end(key)
+        self.clones += 1
+        return clone(template, owner=owner)
+
+    def forget(self) -> None:
+        self.templates.clear()
+
+    def stats(self) -> dict:
+        return {
+            'templates': len(self.templates),
+            'builds': self.builds,
+            'clones': self.clones,
+        }
+
+
+templates = Templates()
@@ -0,0 +1,83 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import json
+import re
+from collections import Counter
+from collections.abc import Mapping
+from hashlib import md5
+from types import MappingProxyType
+from typing import Any, Optional
+
+PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+missing_texts = Counter()
+
+
+def get_body_hash(body: Any) -> str:
+    return md5(json.dumps(body, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class TextTemplate:
+    parts: list[str]
+
+    def __init__(self, value: str = None, parts: list[str] = None):
+        self.parts = PLACEHOLDER.split(value) if parts is None else parts
+
+    def render(self, **kwargs) -> str:
+        if len(self.parts) == 1:
+            return self.parts[0]
+        parts = self.parts.copy()
+        for i in range(1, len(parts), 2):
+            if parts[i] in kwargs:
+                parts[i] = str(kwargs[parts[i]])
+            else:
+                parts[i] = '{' + parts[i] + '}'
+        return ''.join(parts)
+
+
+class TextPack:
+    values: Mapping
+    templates: Mapping[str, TextTemplate]
+    version: str
+
+    def __init__(self, values: Mapping = None, version: str = None, templates: Mapping = None):
+        # Versioned values are immutable snapshots and are shared as is
+        self.values = values if version else MappingProxyType(dict(values or {}))
+        # Snapshot packs read compiled templates from shared memory instead of caching them per worker
+        self.templates = {} if templates is None else templates
+        self.version = version or get_body_hash(body=dict(self.values))
+
+    def get(self, key: Optional[str], **kwargs) -> Optional[str]:
+        if not key:
+            return None
+        template = self.templates.get(key)
+        if not template:
+            value = self.values.get(key)
+            if value is None:
+                missing_texts[key] += 1
+                return key
+            template = TextTemplate(value=value)
+            if isinstance(self.templates, dict):
+                self.templates[key] = template
+        return template.render(**kwargs)
+
+    def resolve(self, keys: list[str]) -> dict[str, Optional[str]]:
+        return {
+            key: self.get(key=key)
+            for key in keys
+        }
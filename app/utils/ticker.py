@@ -0,0 +1,67 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import logging
+from typing import Optional
+from weakref import WeakSet
+
+from flet_core import Control
+
+
+class Ticker:
+    interval: float
+    controls: WeakSet
+    task: Optional[asyncio.Task]
+
+    def __init__(self, interval: float = 1):
+        self.interval = interval
+        self.controls = WeakSet()
+        self.task = None
+
+    def add(self, control: Control) -> None:
+        self.controls.add(control)
+        if not self.task or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def remove(self, control: Control) -> None:
+        self.controls.discard(control)
+
+    async def run(self):
+        while self.controls:
+            await asyncio.sleep(self.interval)
+            await self.tick()
+
+    async def tick(self):
+        pages = {}
+        for control in list(self.controls):
+            page = control.page
+            if not page:
+                self.remove(control)
+                continue
+            updates = control.tick()
+            if not updates or not control.visible:
+                continue
+            pages.setdefault(page, []).extend(updates)
+        for page, controls in pages.items():
+            try:
+                await page.update_async(*controls)
+            except Exception as exception:
+                logging.warning(f'Ticker update pass | {exception}')
+
+
+ticker = Ticker()
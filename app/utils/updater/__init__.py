@@ -16,4 +16,5 @@
 
 
 from .checker import update_check
+from .query import Call, ScreenQuery
 from . import schemes
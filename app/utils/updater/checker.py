@@ -20,6 +20,8 @@ def update_check(
         obj_1: dict,
         obj_2: dict,
 ) -> bool:
+    if obj_1 is obj_2:
+        return False
     scheme_obj_1 = scheme(obj_1)
     scheme_obj_2 = scheme(obj_2)
     if scheme_obj_1 == scheme_obj_2:
@@ -0,0 +1,72 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+from functools import reduce
+from typing import Any
+
+
+class Call:
+    path: str
+    kwargs: dict
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self.kwargs = kwargs
+
+    @property
+    def key(self) -> tuple:
+        return self.path, repr(sorted(self.kwargs.items()))
+
+    async def run(self, api) -> Any:
+        method = reduce(getattr, self.path.split('.'), api)
+        return await method(**self.kwargs)
+
+
+async def batch_local(api, calls: list[Call]) -> list:
+    return await asyncio.gather(*[call.run(api=api) for call in calls])
+
+
+class ScreenQuery:
+    calls: dict[str, Call]
+
+    def __init__(self, **calls: Call):
+        self.calls = calls
+
+    @staticmethod
+    def plan(queries: list['ScreenQuery']) -> dict[tuple, Call]:
+        calls = {}
+        for query in queries:
+            for call in query.calls.values():
+                calls.setdefault(call.key, call)
+        return calls
+
+    @staticmethod
+    async def fetch_many(api, queries: list['ScreenQuery'], batch: callable = batch_local) -> list[dict]:
+        calls = ScreenQuery.plan(queries=queries)
+        results = dict(zip(calls.keys(), await batch(api=api, calls=list(calls.values()))))
+        return [
+            {
+                name: results[call.key]
+                for name, call in query.calls.items()
+            }
+            for query in queries
+        ]
+
+    async def fetch(self, api, batch: callable = batch_local) -> dict:
+        snapshots = await self.fetch_many(api=api, queries=[self], batch=batch)
+        return snapshots[0]
@@ -0,0 +1,175 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+
+from flet_core import Page, View
+
+from app.utils.api import priority
+from app.utils.batch import UpdateBatch
+from config import settings
+
+
+class CircuitBreaker:
+    threshold: int
+    interval: float
+    interval_max: float
+    failures: int
+
+    def __init__(
+            self,
+            threshold: int = settings.update_breaker_threshold,
+            interval: float = settings.update_interval,
+            interval_max: float = settings.update_interval_max,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.interval_max = interval_max
+        self.failures = 0
+
+    @property
+    def opened(self) -> bool:
+        return self.failures >= self.threshold
+
+    def get_interval(self) -> float:
+        if not self.opened:
+            return self.interval
+        return min(self.interval * 2 ** (self.failures - self.threshold + 1), self.interval_max)
+
+    def success(self) -> bool:
+        opened = self.opened
+        self.failures = 0
+        return opened
+
+    def failure(self) -> bool:
+        opened = self.opened
+        self.failures += 1
+        return not opened and self.opened
+
+
+class Updater:
+    stats = {
+        'ticks': 0,
+        'skipped': 0,
+        'cancelled': 0,
+        'timeouts': 0,
+        'errors': 0,
+        'duration_total': 0.0,
+        'duration_max': 0.0,
+        'breakers_opened': 0,
+        'breakers_open': 0,
+    }
+
+    page: Page
+    methods: list[tuple[type, Callable]]
+    deadline: float
+    breaker: CircuitBreaker
+    task: asyncio.Task | None
+    view: View | None
+
+    def __init__(self, page: Page, methods: list[tuple[type, Callable]], deadline: float = settings.update_deadline):
+        self.page = page
+        self.methods = methods
+        self.deadline = deadline
+        self.breaker = CircuitBreaker()
+        self.task = None
+        self.view = None
+
+    def get_method(self, view: View) -> Callable | None:
+        for type_, func in self.methods:
+            if isinstance(view, type_):
+                return func
+
+    def cancel(self) -> None:
+        if self.task and not self.task.done():
+            self.task.cancel()
+            Updater.stats['cancelled'] += 1
+        self.task, self.view = None, None
+
+    def close(self) -> None:
+        self.cancel()
+        if self.breaker.opened:
+            Updater.stats['breakers_open'] -= 1
+        self.breaker.failures = 0
+
+    def get_view(self) -> View | None:
+        return self.page.views[-1] if self.page.views else None
+
+    def check_view(self) -> None:
+        if self.task and not self.task.done() and self.get_view() is not self.view:
+            self.cancel()
+
+    def next(self) -> None:
+        view = self.get_view()
+        if self.task and not self.task.done():
+            if view is self.view:
+                Updater.stats['skipped'] += 1
+                return
+            self.cancel()
+        func = self.get_method(view=view)
+        if not func:
+            self.task, self.view = None, None
+            return
+        self.view = view
+        self.task = asyncio.create_task(self.tick(view=view, func=func))
+
+    async def tick(self, view: View, func: Callable) -> Any:
+        priority.set('updater')
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.deadline):
+                async with UpdateBatch(page=self.page):
+                    await func(view=view)
+        except TimeoutError:
+            Updater.stats['timeouts'] += 1
+            self.failure(view=view, exception=None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            Updater.stats['errors'] += 1
+            self.failure(view=view, exception=exception)
+        else:
+            if self.breaker.success():
+                Updater.stats['breakers_open'] -= 1
+                logging.info(f'Updater {type(view).__name__} | breaker closed')
+        finally:
+            duration = time.perf_counter() - started
+            Updater.stats['ticks'] += 1
+            Updater.stats['duration_total'] += duration
+            Updater.stats['duration_max'] = max(Updater.stats['duration_max'], duration)
+
+    def failure(self, view: View, exception: Exception | None) -> None:
+        if not self.breaker.failure():
+            logging.debug(f'Updater {type(view).__name__} | {exception or "deadline exceeded"}')
+            return
+        Updater.stats['breakers_opened'] += 1
+        Updater.stats['breakers_open'] += 1
+        logging.warning(f'Updater {type(view).__name__} | breaker opened | {exception or "deadline exceeded"}')
+
+    async def run(self, is_running: Callable[[], bool]) -> None:
+        try:
+            while is_running():
+                self.next()
+                deadline = time.monotonic() + self.breaker.get_interval()
+                while is_running() and time.monotonic() < deadline:
+                    await asyncio.sleep(min(settings.update_poll_interval, deadline - time.monotonic()))
+                    self.check_view()
+        finally:
+            self.close()
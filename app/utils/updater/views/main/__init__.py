@@ -15,15 +15,23 @@
 #
 
 
-from app.utils.updater.views.main.account import check_update_main_account_view
-from app.utils.updater.views.main.home import check_update_main_home_view
-from app.utils.updater.views.main.request import check_update_main_request_view
-from app.utils.updater.views.main.requisite import check_update_main_requisite_view
+from app.utils.updater import ScreenQuery
+from app.utils.updater.views.main.account import check_update_main_account_view, get_main_account_query
+from app.utils.updater.views.main.home import check_update_main_home_view, get_main_home_query
+from app.utils.updater.views.main.request import check_update_main_request_view, get_main_request_query
+from app.utils.updater.views.main.requisite import check_update_main_requisite_view, get_main_requisite_query
 from app.views.main.main import MainView
 from app.views.main.tabs import HomeTab, RequestTab, RequisiteTab, AccountTab
 
+TABS_UPDATERS = [
+    (HomeTab, get_main_home_query, check_update_main_home_view),
+    (RequestTab, get_main_request_query, check_update_main_request_view),
+    (RequisiteTab, get_main_requisite_query, check_update_main_requisite_view),
+    (AccountTab, get_main_account_query, check_update_main_account_view),
+]
 
-async def check_update_main_view(view: MainView):
+
+async def check_update_main_view(view: MainView, snapshots: dict = None):
     tabs = []
     for tab in view.tabs:
         if tab == view.tab_selected:
@@ -31,13 +39,24 @@ async def check_update_main_view(view: MainView):
             tabs.insert(0, tab)
             continue
         tabs.append(tab)
+    updaters = []
     for tab in tabs:
         tab_view = tab.controls[0]
-        if isinstance(tab_view, HomeTab):
-            await check_update_main_home_view(tab_view, update=tab == view.tab_selected)
-        elif isinstance(tab_view, RequestTab):
-            await check_update_main_request_view(tab_view, update=tab == view.tab_selected)
-        elif isinstance(tab_view, RequisiteTab):
-            await check_update_main_requisite_view(tab_view, update=tab == view.tab_selected)
-        elif isinstance(tab_view, AccountTab):
-            await check_update_main_account_view(tab_view, update=tab == view.tab_selected)
+        for type_, get_query, check_update in TABS_UPDATERS:
+            if not isinstance(tab_view, type_):
+                continue
+            updaters.append((tab, tab_view, get_query(view=tab_view), check_update))
+    if snapshots is None:
+        snapshots = dict(zip(
+            [type(tab_view).__name__ for _, tab_view, _, _ in updaters],
+            await ScreenQuery.fetch_many(
+                api=view.client.session.api,
+                queries=[query for _, _, query, _ in updaters],
+            ),
+        ))
+        view.client.session.snapshots = snapshots
+    for tab, tab_view, _, check_update in updaters:
+        snapshot = snapshots.get(type(tab_view).__name__)
+        if snapshot is None:
+            continue
+        await check_update(tab_view, update=tab == view.tab_selected, snapshot=snapshot)
@@ -15,17 +15,24 @@
 #
 
 
-from app.utils.updater import update_check
+from app.utils.updater import update_check, Call, ScreenQuery
 from app.utils.updater.schemes import get_account_scheme
 from app.views.main.tabs import AccountTab
 
 
-async def check_update_main_account_view(view: AccountTab, update: bool = True):
+def get_main_account_query(view: AccountTab) -> ScreenQuery:
+    return ScreenQuery(
+        account=Call('client.accounts.get'),
+    )
+
+
+async def check_update_main_account_view(view: AccountTab, update: bool = True, snapshot: dict = None):
+    if snapshot is None:
+        snapshot = await get_main_account_query(view=view).fetch(api=view.client.session.api)
     # account
-    account = await view.client.session.api.client.accounts.get()
+    account = snapshot['account']
     if update_check(scheme=get_account_scheme, obj_1=view.client.session.account, obj_2=account):
         view.client.session.account = account
         await view.update_account_column(update=update)
     if update:
         await view.account_column.update_async()
-
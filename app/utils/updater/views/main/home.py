@@ -15,7 +15,7 @@
 #
 
 
-from app.utils.updater import update_check
+from app.utils.updater import update_check, Call, ScreenQuery
 from app.utils.updater.schemes import get_wallet_list_scheme, get_request_list_scheme, get_transfer_list_scheme, \
     get_wallet_scheme
 from app.views.main.tabs import HomeTab
@@ -27,32 +27,44 @@ class Chips:
     all = 'all'
 
 
-async def check_update_main_home_view(view: HomeTab, update: bool = True):
+def get_main_home_query(view: HomeTab) -> ScreenQuery:
+    return ScreenQuery(
+        wallets=Call('client.wallets.get_list'),
+        current_wallet=Call('client.wallets.get', id_=view.client.session.current_wallet['id']),
+        currently_request=Call('client.requests.search', is_active=True),
+        transfer_history=Call(
+            'client.transfers.search',
+            wallet_id=view.client.session.current_wallet['id'],
+            is_sender=view.selected_chip in [Chips.output, Chips.all],
+            is_receiver=view.selected_chip in [Chips.input, Chips.all],
+            page=view.page_transfer,
+        ),
+    )
+
+
+async def check_update_main_home_view(view: HomeTab, update: bool = True, snapshot: dict = None):
+    if snapshot is None:
+        snapshot = await get_main_home_query(view=view).fetch(api=view.client.session.api)
     # wallets
-    wallets = await view.client.session.api.client.wallets.get_list()
+    wallets = snapshot['wallets']
     if update_check(scheme=get_wallet_list_scheme, obj_1=view.client.session.wallets, obj_2=wallets):
         view.client.session.wallets = wallets
     # current_wallet
-    current_wallet = await view.client.session.api.client.wallets.get(id_=view.client.session.current_wallet['id'])
+    current_wallet = snapshot['current_wallet']
     if update_check(scheme=get_wallet_scheme, obj_1=view.client.session.current_wallet, obj_2=current_wallet):
         view.client.session.current_wallet = current_wallet
         await view.update_balance_stack(update=update)
     if update:
         await view.balance_stack.update_async()
     # current_requests
-    currently_request = await view.client.session.api.client.requests.search(is_active=True)
+    currently_request = snapshot['currently_request']
     if update_check(scheme=get_request_list_scheme, obj_1=view.currently_request, obj_2=currently_request.requests):
         view.currently_request = currently_request.requests
         await view.update_currently_request_row(update=update)
     if update:
         await view.currently_request_row.update_async()
     # transfers
-    transfer_history = await view.client.session.api.client.transfers.search(
-        wallet_id=view.client.session.current_wallet['id'],
-        is_sender=view.selected_chip in [Chips.output, Chips.all],
-        is_receiver=view.selected_chip in [Chips.input, Chips.all],
-        page=view.page_transfer,
-    )
+    transfer_history = snapshot['transfer_history']
     if update_check(scheme=get_transfer_list_scheme, obj_1=view.transfer_history, obj_2=transfer_history.transfers):
         view.transfer_history = transfer_history.transfers
         await view.update_transfer_history_row(update=update)
@@ -15,7 +15,7 @@
 #
 import logging
 
-from app.utils.updater import update_check
+from app.utils.updater import update_check, Call, ScreenQuery
 from app.utils.updater.schemes import get_request_list_scheme
 from app.views.main.tabs import RequestTab
 
@@ -28,23 +28,33 @@ class Chips:
     PARTNERS = 'partners'
 
 
-async def check_update_main_request_view(view: RequestTab, update: bool = True):
+def get_main_request_query(view: RequestTab) -> ScreenQuery:
+    return ScreenQuery(
+        current_requests=Call('client.requests.search', is_active=True),
+        history_requests=Call(
+            'client.requests.search',
+            id_=view.search_value,
+            is_active=view.selected_chip in [Chips.ACTIVE, Chips.ALL],
+            is_completed=view.selected_chip in [Chips.COMPLETED, Chips.ALL],
+            is_canceled=view.selected_chip in [Chips.CANCELED, Chips.ALL],
+            is_partner=view.partner_chip,
+            page=view.page_request,
+        ),
+    )
+
+
+async def check_update_main_request_view(view: RequestTab, update: bool = True, snapshot: dict = None):
+    if snapshot is None:
+        snapshot = await get_main_request_query(view=view).fetch(api=view.client.session.api)
     # current_requests
-    current_requests = await view.client.session.api.client.requests.search(is_active=True)
+    current_requests = snapshot['current_requests']
     if update_check(scheme=get_request_list_scheme, obj_1=view.currently_request, obj_2=current_requests.requests):
         view.currently_request = current_requests.requests
         await view.update_currently_request_row(update=update)
     if update:
         await view.currently_request_row.update_async()
     # history_requests
-    history_requests = await view.client.session.api.client.requests.search(
-        id_=view.search_value,
-        is_active=view.selected_chip in [Chips.ACTIVE, Chips.ALL],
-        is_completed=view.selected_chip in [Chips.COMPLETED, Chips.ALL],
-        is_canceled=view.selected_chip in [Chips.CANCELED, Chips.ALL],
-        is_partner=view.partner_chip,
-        page=view.page_request,
-    )
+    history_requests = snapshot['history_requests']
     if update_check(scheme=get_request_list_scheme, obj_1=view.history_requests, obj_2=history_requests.requests):
         view.history_requests = history_requests.requests
         view.total_pages = history_requests.pages
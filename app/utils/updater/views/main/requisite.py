@@ -15,7 +15,7 @@
 #
 
 
-from app.utils.updater import update_check
+from app.utils.updater import update_check, Call, ScreenQuery
 from app.utils.updater.schemes import get_order_list_scheme, get_requisite_list_scheme
 from app.views.main.tabs import RequisiteTab
 
@@ -33,28 +33,46 @@ class StateChips:
     ALL = 'all'
 
 
-async def check_update_main_requisite_view(view: RequisiteTab, update: bool = True):
-    # currency_orders
-    currency_orders = await view.client.session.api.client.orders.list_get.main(
-        by_request=False,
-        by_requisite=True,
-        is_active=True,
-        is_finished=False,
+def get_main_requisite_query(view: RequisiteTab) -> ScreenQuery:
+    return ScreenQuery(
+        currency_orders=Call(
+            'client.orders.list_get.main',
+            by_request=False,
+            by_requisite=True,
+            is_active=True,
+            is_finished=False,
+        ),
+        history_requisites=Call(
+            'client.requisites.search',
+            is_type_input=view.selected_type_chip in [TypeChips.INPUT, TypeChips.ALL],
+            is_type_output=view.selected_type_chip in [TypeChips.OUTPUT, TypeChips.ALL],
+            is_state_enable=view.selected_state_chip in [StateChips.ENABLE, StateChips.ALL],
+            is_state_stop=view.selected_state_chip in [StateChips.STOP, StateChips.ALL],
+            is_state_disable=view.selected_state_chip in [StateChips.DISABLE, StateChips.ALL],
+            page=view.page_requisites,
+        ),
+        orders=Call(
+            'client.orders.list_get.main',
+            by_request=False,
+            by_requisite=True,
+            is_active=False,
+            is_finished=True,
+        ),
     )
+
+
+async def check_update_main_requisite_view(view: RequisiteTab, update: bool = True, snapshot: dict = None):
+    if snapshot is None:
+        snapshot = await get_main_requisite_query(view=view).fetch(api=view.client.session.api)
+    # currency_orders
+    currency_orders = snapshot['currency_orders']
     if update_check(scheme=get_order_list_scheme, obj_1=view.current_orders, obj_2=currency_orders):
         view.current_orders = currency_orders
         await view.update_current_orders_column(update=update)
     if update:
         await view.current_orders_column.update_async()
     # history_requisites
-    history_requisites = await view.client.session.api.client.requisites.search(
-        is_type_input=view.selected_type_chip in [TypeChips.INPUT, TypeChips.ALL],
-        is_type_output=view.selected_type_chip in [TypeChips.OUTPUT, TypeChips.ALL],
-        is_state_enable=view.selected_state_chip in [StateChips.ENABLE, StateChips.ALL],
-        is_state_stop=view.selected_state_chip in [StateChips.STOP, StateChips.ALL],
-        is_state_disable=view.selected_state_chip in [StateChips.DISABLE, StateChips.ALL],
-        page=view.page_requisites,
-    )
+    history_requisites = snapshot['history_requisites']
     if update_check(
             scheme=get_requisite_list_scheme,
             obj_1=view.history_requisites,
@@ -66,12 +84,7 @@ async def check_update_main_requisite_view(view: RequisiteTab, update: bool = Tr
     if update:
         await view.history_requisites_column.update_async()
     # orders
-    orders = await view.client.session.api.client.orders.list_get.main(
-        by_request=False,
-        by_requisite=True,
-        is_active=False,
-        is_finished=True,
-    )
+    orders = snapshot['orders']
     if update_check(scheme=get_order_list_scheme, obj_1=view.orders, obj_2=orders):
         view.orders = orders
         await view.update_orders_column(update=update)
@@ -15,18 +15,24 @@
 #
 
 
+from app.utils.states import order_machine, request_machine
 from app.utils.updater import update_check
 from app.utils.updater.schemes import get_request_scheme, get_order_list_scheme
 from app.views.client.requests import RequestView
 
 
 async def check_update_request_view(view: RequestView, update: bool = True):
-    request = await view.client.session.api.client.requests.get(id_=view.request_id)
-    if update_check(scheme=get_request_scheme, obj_1=view.request, obj_2=request):
-        view.request = request
-        await view.construct()
-    if update:
-        await view.update_async()
+    if not request_machine.is_finished(view.request):
+        request = await view.client.session.api.client.requests.get(id_=view.request_id)
+        if update_check(scheme=get_request_scheme, obj_1=view.request, obj_2=request):
+            view.request = request
+            if not await view.bindings.apply(model=request, update=update):
+                await view.construct()
+                if update:
+                    await view.update_async()
+    # Orders of a finished request may still settle, so they are polled until every one is finished
+    elif all(order_machine.is_finished(order) for order in view.orders):
+        return
     orders = await view.client.session.api.client.orders.list_get.by_request(request_id=view.request_id)
     if update_check(scheme=get_order_list_scheme, obj_1=view.orders, obj_2=orders):
         view.orders = orders
@@ -15,12 +15,15 @@
 #
 
 
+from app.utils.states import order_machine
 from app.utils.updater import update_check
 from app.utils.updater.schemes import get_order_scheme
 from app.views.client.requests import RequestOrderView
 
 
 async def check_update_request_order_view(view: RequestOrderView, update: bool = True):
+    if order_machine.is_finished(view.order):
+        return
     check_list = []
     order = await view.client.session.api.client.orders.get(id_=view.order_id)
     check_list += [
@@ -32,6 +35,9 @@ async def check_update_request_order_view(view: RequestOrderView, update: bool =
     ]
     if True not in check_list:
         return
+    view.order = order
+    if await view.bindings.apply(model=order, update=update):
+        return
     await view.construct()
     if update:
         await view.update_async()
@@ -0,0 +1,91 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import logging
+from base64 import b64encode
+from collections import OrderedDict
+from hashlib import md5
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from config import settings
+
+
+def get_data_url(body: bytes, mime_type: str = 'image/jpeg') -> str:
+    return f'data:{mime_type};base64,{b64encode(body).decode()}'
+
+
+def render_preview(body: bytes, size: int, quality: int) -> bytes:
+    image = Image.open(BytesIO(body))
+    # JPEG decoding is scaled down in the DCT step, skipping most of the full-size decode
+    image.draft('RGB', (size, size))
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((size, size))
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    result = BytesIO()
+    image.save(result, format='JPEG', quality=quality, optimize=True)
+    return result.getvalue()
+
+
+class Previews:
+    size: int
+    quality: int
+    previews: OrderedDict[tuple[str, int], str]
+
+    def __init__(self, size: int = settings.previews_size, quality: int = settings.previews_quality):
+        self.size = size
+        self.quality = quality
+        self.previews = OrderedDict()
+        self.renders = 0
+        self.hits = 0
+        self.errors = 0
+
+    async def get(self, body: bytes, size: int) -> str:
+        # Previews are shown at most at twice their logical size
+        key = (md5(body).hexdigest(), size * 2)
+        preview = self.previews.get(key)
+        if preview:
+            self.hits += 1
+            self.previews.move_to_end(key)
+            return preview
+        try:
+            preview = get_data_url(
+                body=await asyncio.to_thread(render_preview, body=body, size=size * 2, quality=self.quality),
+            )
+            self.renders += 1
+        except Exception as exception:
+            logging.debug(f'Preview pass | {exception}')
+            self.errors += 1
+            return get_data_url(body=body)
+        self.previews[key] = preview
+        while len(self.previews) > self.size:
+            self.previews.popitem(last=False)
+        return preview
+
+    def stats(self) -> dict:
+        return {
+            'previews': len(self.previews),
+            'renders': self.renders,
+            'hits': self.hits,
+            'errors': self.errors,
+        }
+
+
+previews = Previews()
@@ -0,0 +1,55 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.utils.api import Api, references, snapshot
+from app.utils.routes import add_route
+from config import settings
+from fexps_api_client import FexpsApiClient
+
+
+async def health() -> JSONResponse:
+    return JSONResponse(
+        content={'status': 'ready' if references.ready else 'warming', **references.stats()},
+        status_code=200 if references.ready else 503,
+    )
+
+
+def add_warm_up(app: FastAPI) -> None:
+    lifespan_context = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_: FastAPI):
+        async with lifespan_context(app_) as state:
+            api = FexpsApiClient(url=settings.get_url())
+            task = asyncio.create_task(references.warm_up(api=Api(api=api)))
+            snapshot_task = asyncio.create_task(snapshot.run(api=api))
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=settings.warm_up_timeout)
+            except TimeoutError:
+                pass
+            yield state
+            task.cancel()
+            snapshot_task.cancel()
+
+    app.router.lifespan_context = lifespan
+    add_route(app=app, path='/health', endpoint=health)
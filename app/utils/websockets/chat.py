@@ -18,7 +18,6 @@
 import asyncio
 import datetime
 import json
-from base64 import b64encode
 from functools import partial
 
 import aiohttp
@@ -28,6 +27,7 @@ from flet_core import Column, UserControl, Control, colors, ScrollMode, Containe
 from app.controls.button import StandardButton
 from app.controls.information import Text, InformationContainer
 from app.utils import Fonts, Icons
+from app.utils.uploads import previews
 from app.utils.value import size_value_to_str
 from config import settings
 
@@ -101,7 +101,7 @@ class ChatWebSockets(UserControl):
                 if file['extension'] in ['jpg', 'jpeg', 'png']:
                     file_byte = file['value'].encode('ISO-8859-1')
                     file_image = Image(
-                        src=f'data:image/jpeg;base64,{b64encode(file_byte).decode()}',
+                        src=await previews.get(body=file_byte, size=30),
                         width=30,
                         height=30,
                     )
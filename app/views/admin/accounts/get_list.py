@@ -41,7 +41,7 @@ class AccountListView(AdminBaseView):
         await self.set_type(loading=False)
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_account_get_list_view_title'),
+            title=self.client.session.tv(key='admin_account_get_list_view_title'),
             main_section_controls=[
                 *[
                     Card(
@@ -75,13 +75,10 @@ class AccountListView(AdminBaseView):
                     )
                     for account in self.accounts
                 ],
-                PaginationWidget(
+                PaginationWidget.from_template(
+                    owner=self,
                     current_page=self.page_account,
                     total_pages=self.total_pages,
-                    on_back=self.previous_page,
-                    on_next=self.next_page,
-                    text_back=await self.client.session.gtv(key='back'),
-                    text_next=await self.client.session.gtv(key='next'),
                 ),
             ]
         )
@@ -50,13 +50,13 @@ class AccountRoleListView(AdminBaseView):
 
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_account_role_get_list_view_title'),
+            title=self.client.session.tv(key='admin_account_role_get_list_view_title'),
             on_create_click=self.create_role,
             main_section_controls=[
                 Card(
                     controls=[
                         Text(
-                            value=await self.client.session.gtv(key=role['role']['name_text']),
+                            value=self.client.session.tv(key=role['role']['name_text']),
                             size=18,
                             font_family=Fonts.SEMIBOLD,
                             color=colors.ON_PRIMARY_CONTAINER,
@@ -15,8 +15,6 @@
 #
 
 
-from typing import Any
-
 from flet_core import ScrollMode, Column
 
 from app.controls.layout import AdminBaseView
@@ -34,14 +32,15 @@ from .timezones.get_list import TimezoneListView
 from .wallet.get_list import WalletListView
 from ...controls.button import ListItemButton
 from ...utils import Icons
+from ...utils.templates import templates
 
 
 class Setting:
     name: str
     icon: str
-    on_click: Any
+    on_click: str
 
-    def __init__(self, name: str, icon: str, on_click: Any):
+    def __init__(self, name: str, icon: str, on_click: str):
         self.name = name
         self.icon = icon
         self.on_click = on_click
@@ -54,92 +53,98 @@ class Section:
         self.settings = settings
 
 
-class AdminView(AdminBaseView):
-    route = '/admin'
+SETTINGS = [
+    Setting(
+        name='admin_account_get_list_view_title',
+        icon=Icons.ADMIN_ACCOUNTS,
+        on_click='get_accounts',
+    ),
+    Setting(
+        name='admin_commissions_packs_get_list_view_title',
+        icon=Icons.COMMISSION_PACK,
+        on_click='get_commissions_packs',
+    ),
+    Setting(
+        name='admin_contacts_get_list_view_title',
+        icon=Icons.CONTACT,
+        on_click='get_contacts',
+    ),
+    Setting(
+        name='admin_country_get_list_view_title',
+        icon=Icons.COUNTRY,
+        on_click='get_countries',
+    ),
+    Setting(
+        name='admin_currency_get_list_view_title',
+        icon=Icons.CURRENCY,
+        on_click='get_currencies',
+    ),
+    Setting(
+        name='admin_language_get_list_view_title',
+        icon=Icons.LANGUAGE,
+        on_click='get_languages',
+    ),
+    Setting(
+        name='admin_method_get_list_view_title',
+        icon=Icons.METHOD,
+        on_click='get_methods',
+    ),
+    Setting(
+        name='admin_permission_get_list_view_title',
+        icon=Icons.ADMIN_PERMISSIONS,
+        on_click='get_permissions',
+    ),
+    Setting(
+        name='admin_role_get_list_view_title',
+        icon=Icons.ADMIN_ROLES,
+        on_click='get_roles',
+    ),
+    Setting(
+        name='admin_text_get_list_view_title',
+        icon=Icons.ADMIN_TEXTS,
+        on_click='get_texts',
+    ),
+    Setting(
+        name='admin_timezone_get_list_view_title',
+        icon=Icons.TIMEZONE,
+        on_click='get_timezones',
+    ),
+    Setting(
+        name='admin_wallet_get_list_view_title',
+        icon=Icons.WALLET,
+        on_click='get_wallets',
+    ),
+]
 
-    async def construct(self):
-        self.scroll = ScrollMode.AUTO
-        parts = [
-            Setting(
-                name='admin_account_get_list_view_title',
-                icon=Icons.ADMIN_ACCOUNTS,
-                on_click=self.get_accounts,
-            ),
-            Setting(
-                name='admin_commissions_packs_get_list_view_title',
-                icon=Icons.COMMISSION_PACK,
-                on_click=self.get_commissions_packs,
-            ),
-            Setting(
-                name='admin_contacts_get_list_view_title',
-                icon=Icons.CONTACT,
-                on_click=self.get_contacts,
-            ),
-            Setting(
-                name='admin_country_get_list_view_title',
-                icon=Icons.COUNTRY,
-                on_click=self.get_countries,
-            ),
-            Setting(
-                name='admin_currency_get_list_view_title',
-                icon=Icons.CURRENCY,
-                on_click=self.get_currencies,
-            ),
-            Setting(
-                name='admin_language_get_list_view_title',
-                icon=Icons.LANGUAGE,
-                on_click=self.get_languages,
-            ),
-            Setting(
-                name='admin_method_get_list_view_title',
-                icon=Icons.METHOD,
-                on_click=self.get_methods,
-            ),
-            Setting(
-                name='admin_permission_get_list_view_title',
-                icon=Icons.ADMIN_PERMISSIONS,
-                on_click=self.get_permissions,
-            ),
-            Setting(
-                name='admin_role_get_list_view_title',
-                icon=Icons.ADMIN_ROLES,
-                on_click=self.get_roles,
-            ),
-            Setting(
-                name='admin_text_get_list_view_title',
-                icon=Icons.ADMIN_TEXTS,
-                on_click=self.get_texts,
-            ),
-            Setting(
-                name='admin_timezone_get_list_view_title',
-                icon=Icons.TIMEZONE,
-                on_click=self.get_timezones,
-            ),
-            Setting(
-                name='admin_wallet_get_list_view_title',
-                icon=Icons.WALLET,
-                on_click=self.get_wallets,
-            ),
 
-        ]
+class AdminView(AdminBaseView):
+    route = '/admin'
 
-        main_sections_controls = [
+    def build_controls(self) -> list:
+        texts = self.client.session.resolve(keys=[setting.name for setting in SETTINGS])
+        return [
             Column(
                 controls=[
                     ListItemButton(
                         icon=setting.icon,
-                        name=await self.client.session.gtv(key=setting.name),
+                        name=texts[setting.name],
                         on_click=setting.on_click,
                     )
-                    for setting in parts
+                    for setting in SETTINGS
                 ],
                 spacing=4,
             ),
         ]
 
+    async def construct(self):
+        self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_view_title'),
-            main_section_controls=main_sections_controls,
+            title=self.client.session.tv(key='admin_view_title'),
+            main_section_controls=templates.get(
+                key=self.client.session.get_template_key(name='admin_view'),
+                build=self.build_controls,
+                owner=self,
+            ),
         )
 
     async def go_back(self, _):
@@ -49,14 +49,14 @@ class CommissionPackListView(AdminBaseView):
         self.commissions_packs = self.commissions_packs[index_1:index_2]
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_commissions_packs_get_list_view_title'),
+            title=self.client.session.tv(key='admin_commissions_packs_get_list_view_title'),
             on_create_click=self.commission_pack_create,
             main_section_controls=[
                 *[
                     Card(
                         controls=[
                             Text(
-                                value=await self.client.session.gtv(key=commission_pack['name_text']),
+                                value=self.client.session.tv(key=commission_pack['name_text']),
                                 size=18,
                                 font_family=Fonts.SEMIBOLD,
                                 color=colors.ON_PRIMARY_CONTAINER,
@@ -67,13 +67,10 @@ class CommissionPackListView(AdminBaseView):
                     )
                     for commission_pack in self.commissions_packs
                 ],
-                PaginationWidget(
+                PaginationWidget.from_template(
+                    owner=self,
                     current_page=self.page_count,
                     total_pages=self.total_pages,
-                    on_back=self.previous_page,
-                    on_next=self.next_page,
-                    text_back=await self.client.session.gtv(key='back'),
-                    text_next=await self.client.session.gtv(key='next'),
                 ),
             ]
         )
@@ -50,7 +50,7 @@ class CommissionPackValueListView(AdminBaseView):
         self.commissions_packs_values = self.commissions_packs_values[index_1:index_2]
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_commissions_packs_get_list_view_title'),
+            title=self.client.session.tv(key='admin_commissions_packs_get_list_view_title'),
             on_create_click=self.commission_pack_create,
             main_section_controls=[
                 *[
@@ -84,13 +84,10 @@ class CommissionPackValueListView(AdminBaseView):
                     )
                     for commission_pack_value in self.commissions_packs_values
                 ],
-                PaginationWidget(
+                PaginationWidget.from_template(
+                    owner=self,
                     current_page=self.page_count,
                     total_pages=self.total_pages,
-                    on_back=self.previous_page,
-                    on_next=self.next_page,
-                    text_back=await self.client.session.gtv(key='back'),
-                    text_next=await self.client.session.gtv(key='next'),
                 ),
             ]
         )
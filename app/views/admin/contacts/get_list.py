@@ -36,13 +36,13 @@ class ContactsListView(AdminBaseView):
         await self.set_type(loading=False)
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_contacts_get_list_view_title'),
+            title=self.client.session.tv(key='admin_contacts_get_list_view_title'),
             on_create_click=self.contact_create,
             main_section_controls=[
                 Card(
                     controls=[
                         Text(
-                            value=await self.client.session.gtv(key=contact.name_text),
+                            value=self.client.session.tv(key=contact.name_text),
                             size=18,
                             font_family=Fonts.SEMIBOLD,
                             color=colors.ON_PRIMARY_CONTAINER,
@@ -26,10 +26,17 @@ from app.controls.button import StandardButton
 from app.controls.information import Text
 from app.controls.information.snack_bar import SnackBar
 from app.controls.layout import AdminBaseView
+from app.utils.loaders import Loaders
 
 
 class CountryView(AdminBaseView):
     route = '/admin/country/get'
+    loaders = Loaders(
+        country=lambda view: view.client.session.api.client.countries.get(id_str=view.country_id_str),
+        languages=lambda view: view.client.session.api.client.languages.get_list(),
+        timezones=lambda view: view.client.session.api.client.timezones.get_list(),
+        currencies=lambda view: view.client.session.api.client.currencies.get_list(),
+    )
     country = dict
     languages = list[dict]
     timezones = list[dict]
@@ -45,14 +52,7 @@ class CountryView(AdminBaseView):
         self.country_id_str = country_id_str
 
     async def construct(self):
-        await self.set_type(loading=True)
-        self.country = await self.client.session.api.client.countries.get(
-            id_str=self.country_id_str,
-        )
-        self.languages = await self.client.session.api.client.languages.get_list()
-        self.timezones = await self.client.session.api.client.timezones.get_list()
-        self.currencies = await self.client.session.api.client.currencies.get_list()
-        await self.set_type(loading=False)
+        await self.load()
 
         language_options = [
             Option(
@@ -37,7 +37,7 @@ class CurrencyListView(AdminBaseView):
 
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_currency_get_list_view_title'),
+            title=self.client.session.tv(key='admin_currency_get_list_view_title'),
             on_create_click=self.currency_create,
             main_section_controls=[
                 Card(
@@ -25,14 +25,20 @@ from app.controls.information import Text
 from app.controls.input import TextField, Dropdown
 from app.controls.layout import AdminBaseView
 from app.utils import Fonts, Error, value_to_int, value_to_float
+from app.utils.loaders import Loaders
 from config import settings
 from fexps_api_client.utils import ApiException
 
 
 class MethodView(AdminBaseView):
     route = '/admin/method/get'
+    loaders = Loaders(
+        method=lambda view: view.client.session.api.client.methods.get(id_=view.method_id),
+        currencies=lambda view: view.client.session.api.client.currencies.get_list(),
+    )
     method = dict
     currency = dict
+    currencies = list[dict]
 
     currency_options: list[Option]
     schema_type_options: list[Option]
@@ -56,14 +62,12 @@ class MethodView(AdminBaseView):
         self.method_id = method_id
 
     async def construct(self):
-        await self.set_type(loading=True)
-        self.method = await self.client.session.api.client.methods.get(id_=self.method_id)
+        await self.load()
         self.currency = self.method.currency
         self.currency_options = [
             Option(text=currency.id_str.upper(), key=currency.id_str)
-            for currency in await self.client.session.api.client.currencies.get_list()
+            for currency in self.currencies
         ]
-        await self.set_type(loading=False)
         self.schema_type_options = [
             Option(key='int', text=await self.client.session.gtv(key='int')),
             Option(key='str', text=await self.client.session.gtv(key='str')),
@@ -46,14 +46,14 @@ class MethodListView(AdminBaseView):
 
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_method_get_list_view_title'),
+            title=self.client.session.tv(key='admin_method_get_list_view_title'),
             on_create_click=self.create_text,
             main_section_controls=[
                 *[
                     Card(
                         controls=[
                             Text(
-                                value=await self.client.session.gtv(key=method.name_text),
+                                value=self.client.session.tv(key=method.name_text),
                                 size=18,
                                 font_family=Fonts.SEMIBOLD,
                                 color=colors.ON_PRIMARY_CONTAINER,
@@ -70,13 +70,10 @@ class MethodListView(AdminBaseView):
                     )
                     for method in self.methods
                 ],
-                PaginationWidget(
+                PaginationWidget.from_template(
+                    owner=self,
                     current_page=self.page_method,
                     total_pages=self.total_pages,
-                    on_back=self.previous_page,
-                    on_next=self.next_page,
-                    text_back=await self.client.session.gtv(key='back'),
-                    text_next=await self.client.session.gtv(key='next'),
                 ),
             ]
         )
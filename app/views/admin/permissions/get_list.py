@@ -37,13 +37,13 @@ class PermissionListView(AdminBaseView):
 
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_permission_get_list_view_title'),
+            title=self.client.session.tv(key='admin_permission_get_list_view_title'),
             on_create_click=self.create_permission,
             main_section_controls=[
                 Card(
                     controls=[
                         Text(
-                            value=await self.client.session.gtv(key=permission['name_text']),
+                            value=self.client.session.tv(key=permission['name_text']),
                             size=18,
                             font_family=Fonts.SEMIBOLD,
                             color=colors.ON_PRIMARY_CONTAINER,
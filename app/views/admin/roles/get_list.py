@@ -37,13 +37,13 @@ class RoleListView(AdminBaseView):
 
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_role_get_list_view_title'),
+            title=self.client.session.tv(key='admin_role_get_list_view_title'),
             on_create_click=self.create_role,
             main_section_controls=[
                 Card(
                     controls=[
                         Text(
-                            value=await self.client.session.gtv(key=role['name_text']),
+                            value=self.client.session.tv(key=role['name_text']),
                             size=18,
                             font_family=Fonts.SEMIBOLD,
                             color=colors.ON_PRIMARY_CONTAINER,
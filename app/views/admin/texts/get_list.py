@@ -44,14 +44,14 @@ class TextListView(AdminBaseView):
         self.texts = self.texts[(self.page_text - 1) * self.items_per_page: self.page_text * self.items_per_page]
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_text_get_list_view_title'),
+            title=self.client.session.tv(key='admin_text_get_list_view_title'),
             on_create_click=self.create_text,
             main_section_controls=[
                 *[
                     Card(
                         controls=[
                             Text(
-                                value=await self.client.session.gtv(key=text['key']),
+                                value=self.client.session.tv(key=text['key']),
                                 size=18,
                                 font_family=Fonts.SEMIBOLD,
                                 color=colors.ON_PRIMARY_CONTAINER,
@@ -68,13 +68,10 @@ class TextListView(AdminBaseView):
                     )
                     for text in self.texts
                 ],
-                PaginationWidget(
+                PaginationWidget.from_template(
+                    owner=self,
                     current_page=self.page_text,
                     total_pages=self.total_pages,
-                    on_back=self.previous_page,
-                    on_next=self.next_page,
-                    text_back=await self.client.session.gtv(key='back'),
-                    text_next=await self.client.session.gtv(key='next'),
                 ),
             ]
         )
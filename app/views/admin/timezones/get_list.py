@@ -37,7 +37,7 @@ class TimezoneListView(AdminBaseView):
 
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_timezone_get_list_view_title'),
+            title=self.client.session.tv(key='admin_timezone_get_list_view_title'),
             on_create_click=self.create_timezone,
             main_section_controls=[
                 Card(
@@ -43,7 +43,7 @@ class WalletListView(AdminBaseView):
         await self.set_type(loading=False)
         self.scroll = ScrollMode.AUTO
         self.controls = await self.get_controls(
-            title=await self.client.session.gtv(key='admin_wallet_get_list_view_title'),
+            title=self.client.session.tv(key='admin_wallet_get_list_view_title'),
             main_section_controls=[
                 Card(
                     controls=[
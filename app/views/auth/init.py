@@ -32,7 +32,12 @@ class InitView(AuthView):
 
     async def on_load(self):
         await self.set_type(loading=True)
-        self.client.session = Session(client=self.client)
+        session = getattr(self.client, 'session', None)
+        pool = session.pool if session else None
+        self.client.session = Session(client=self.client, pool=pool)
+        # Re-entries from inside the app (add account, language change) always run a full init
+        if not session and not self.new_login and await self.client.session.resume():
+            return
         await self.client.session.init()
         await self.set_type(loading=False)
         # If not language
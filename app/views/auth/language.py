@@ -82,6 +82,7 @@ class LanguageView(AuthView):
             self.dd_language.error_text = await self.client.session.gtv(key='error_language_select')
             await self.update_async()
             return
+        await self.client.session.forget_resume()
         await self.client.session.set_cs(key='language', value=language)
         await self.client.session.get_text_pack(language=language)
         from .init import InitView
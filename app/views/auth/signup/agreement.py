@@ -22,6 +22,7 @@ from app.controls.button import ListItemButton, StandardButton
 from app.controls.information import Text
 from app.controls.layout import AuthView
 from app.utils import Icons
+from app.utils.api import Api
 from config import settings
 from fexps_api_client import FexpsApiClient
 
@@ -96,7 +97,7 @@ class AgreementRegistrationView(AuthView):
         await self.client.session.set_cs(key='tokens', value=tokens)
         await self.client.session.set_cs(key='token', value=session.token)
         await self.client.session.set_cs(key='current_wallet', value=None)
-        self.client.session.api = FexpsApiClient(url=settings.get_url(), token=session.token)
+        self.client.session.api = Api(api=FexpsApiClient(url=settings.get_url(), token=session.token))
         for contact_id, value in self.client.session.registration.contacts.items():
             if not contact_id or not value:
                 continue
@@ -131,6 +131,7 @@ class ChangeAccountView(ClientBaseView):
             )
             return
         from app.views.auth.init import InitView
+        await self.client.session.forget_resume()
         await self.client.change_view(
             view=InitView(new_login=True),
         )
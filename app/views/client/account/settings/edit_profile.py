@@ -15,8 +15,6 @@
 #
 
 
-from base64 import b64encode
-
 from flet_core import Column, Container, ScrollMode, Row, Image, ImageFit, alignment, Control, colors, MainAxisAlignment
 
 from app.controls.button import StandardButton
@@ -24,6 +22,7 @@ from app.controls.information import Text, SnackBar
 from app.controls.input import TextField
 from app.controls.layout import ClientBaseView
 from app.utils import Fonts
+from app.utils.uploads import previews
 from app.utils.websockets.file import FileWebSockets
 from config import settings
 from fexps_api_client.utils import ApiException
@@ -49,7 +48,7 @@ class AccountSettingsEdtProfileView(ClientBaseView):
     async def construct(self):
         await self.set_type(loading=True)
         self.account = self.client.session.account
-        self.file_keys = await self.client.session.api.client.files.keys.create()
+        self.file_keys = await self.client.session.file_keys.get()
         await self.set_type(loading=False)
         self.tf_firstname = TextField(
             label=await self.client.session.gtv(key='account_settings_edit_profile_firstname'),
@@ -127,7 +126,7 @@ class AccountSettingsEdtProfileView(ClientBaseView):
 
     async def update_file_keys(self, key: str):
         self.file_key = key
-        self.file_keys = await self.client.session.api.client.files.keys.create()
+        self.file_keys = await self.client.session.file_keys.get()
         self.btn_edit_photo.url = self.file_keys.url
         await self.btn_edit_photo.update_async()
 
@@ -141,7 +140,7 @@ class AccountSettingsEdtProfileView(ClientBaseView):
             return [
                 Container(
                     content=Image(
-                        src=f'data:image/jpeg;base64,{b64encode(file_byte).decode()}',
+                        src=await previews.get(body=file_byte, size=150),
                         width=150,
                         height=150,
                         fit=ImageFit.CONTAIN,
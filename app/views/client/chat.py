@@ -15,8 +15,6 @@
 #
 
 
-from base64 import b64encode
-
 from flet_core import Container, Row, colors, Image, Column, ScrollMode, ImageFit, Control, alignment, Stack
 
 from app.controls.button import StandardButton
@@ -24,13 +22,20 @@ from app.controls.information import Text
 from app.controls.input import TextField
 from app.controls.layout import ClientBaseView
 from app.utils import Icons
+from app.utils.loaders import Loaders
+from app.utils.uploads import previews
 from app.utils.websockets.chat import ChatWebSockets
 from app.utils.websockets.file import FileWebSockets
 
 
 class ChatView(ClientBaseView):
     route = '/client/chat'
+    loaders = Loaders(
+        messages=lambda view: view.client.session.api.client.messages.get_list(order_id=view.order_id),
+        file_keys=lambda view: view.client.session.file_keys.get(),
+    )
 
+    messages = list[dict]
     file_keys = dict
     chat: ChatWebSockets
     file_row: [Row, FileWebSockets]
@@ -46,10 +51,7 @@ class ChatView(ClientBaseView):
 
     async def construct(self):
         account = self.client.session.account
-        await self.set_type(loading=True)
-        old_messages = await self.client.session.api.client.messages.get_list(order_id=self.order_id)
-        self.file_keys = await self.client.session.api.client.files.keys.create()
-        await self.set_type(loading=False)
+        await self.load()
         old_messages_controls = [
             await ChatWebSockets.create_message_card(
                 gtv=self.client.session.gtv,
@@ -57,7 +59,7 @@ class ChatView(ClientBaseView):
                 account_id=account.id,
                 message=message,
             )
-            for message in old_messages[::-1]
+            for message in self.messages[::-1]
         ]
         self.chat = ChatWebSockets(
             account_id=account.id,
@@ -138,7 +140,7 @@ class ChatView(ClientBaseView):
 
     async def update_file_keys(self, key: str):
         self.send_key = key
-        self.file_keys = await self.client.session.api.client.files.keys.create()
+        self.file_keys = await self.client.session.file_keys.get()
         self.btn_attach_file.url = self.file_keys.url
         self.btn_attach_file.update()
 
@@ -160,7 +162,7 @@ class ChatView(ClientBaseView):
                 file_byte = file['value'].encode('ISO-8859-1')
                 file_image = Container(
                     content=Image(
-                        src=f'data:image/jpeg;base64,{b64encode(file_byte).decode()}',
+                        src=await previews.get(body=file_byte, size=150),
                         width=150,
                         height=150,
                         fit=ImageFit.CONTAIN,
@@ -105,7 +105,7 @@ class RequestCreateView(ClientBaseView):
         for method in self.methods:
             if method.currency.id_str.lower() != currency_id_str.lower():
                 continue
-            method_str = await self.client.session.gtv(key=method.name_text)
+            method_str = self.client.session.tv(key=method.name_text)
             if self.client.session.debug:
                 method_str = f'{method_str} ({method.id})'
             options += [
@@ -116,7 +116,7 @@ class RequestCreateView(ClientBaseView):
     async def get_requisite_data_options(self, method_id: int) -> list[Option]:
         requisites_datas = await self.client.session.api.client.requisites_datas.get_list()
         options = [
-            Option(text=await self.client.session.gtv(key=f'request_create_requisite_data_{key}'), key=key)
+            Option(text=self.client.session.tv(key=f'request_create_requisite_data_{key}'), key=key)
             for key in [RequisiteDataCreateTypes.DEFAULT, RequisiteDataCreateTypes.DISPOSABLE]
         ]
         for requisite_data in requisites_datas:
@@ -135,12 +135,12 @@ class RequestCreateView(ClientBaseView):
 
     async def update_input(self, update: bool = True) -> None:
         self.tf_input_value = TextField(
-            label=await self.client.session.gtv(key='value'),
+            label=self.client.session.tv(key='value'),
             on_change=self.change_value,
             expand=4,
         )
         self.dd_input_currency = Dropdown(
-            label=await self.client.session.gtv(key='currency'),
+            label=self.client.session.tv(key='currency'),
             # value=await self.client.session.get_cs(key='request_create_input_currency'),
             options=await self.get_currency_options(),
             on_change=partial(self.change_currency, 'input'),
@@ -148,14 +148,14 @@ class RequestCreateView(ClientBaseView):
         )
         self.t_input_available_sum = Text(value=value_to_str(value=0), font_family=Fonts.BOLD)
         self.dd_input_method = Dropdown(
-            label=await self.client.session.gtv(key='request_create_input_method'),
+            label=self.client.session.tv(key='request_create_input_method'),
             # value=await self.client.session.get_cs(key='request_create_input_method'),
             on_change=self.change_method,
             disabled=True,
         )
         self.input_column = Column(
             controls=[
-                SubTitle(value=await self.client.session.gtv(key='request_create_input')),
+                SubTitle(value=self.client.session.tv(key='request_create_input')),
                 Row(
                     controls=[
                         self.tf_input_value,
@@ -166,7 +166,7 @@ class RequestCreateView(ClientBaseView):
                 Row(
                     controls=[
                         Text(
-                            value=await self.client.session.gtv(key='request_create_available_sum'),
+                            value=self.client.session.tv(key='request_create_available_sum'),
                         ),
                         self.t_input_available_sum,
                     ],
@@ -213,33 +213,33 @@ class RequestCreateView(ClientBaseView):
 
     async def update_output(self, update: bool = True) -> None:
         self.tf_output_value = TextField(
-            label=await self.client.session.gtv(key='value'),
+            label=self.client.session.tv(key='value'),
             on_change=self.change_value,
             expand=4,
         )
         self.t_output_available_sum = Text(value=value_to_str(value=0), font_family=Fonts.BOLD)
         self.dd_output_currency = Dropdown(
-            label=await self.client.session.gtv(key='currency'),
+            label=self.client.session.tv(key='currency'),
             options=await self.get_currency_options(),
             # value=await self.client.session.get_cs(key='request_create_output_currency'),
             on_change=partial(self.change_currency, 'output'),
             expand=2,
         )
         self.dd_output_method = Dropdown(
-            label=await self.client.session.gtv(key='request_create_output_method'),
+            label=self.client.session.tv(key='request_create_output_method'),
             # value=await self.client.session.get_cs(key='request_create_output_method'),
             on_change=self.change_output_method,
             disabled=True,
         )
         self.dd_output_requisite_data = Dropdown(
-            label=await self.client.session.gtv(key='request_create_output_requisite_data'),
+            label=self.client.session.tv(key='request_create_output_requisite_data'),
             on_change=self.change_output_requisite_data,
             disabled=True,
         )
         self.output_requisite_data_column = Column(controls=[])
         self.output_column = Column(
             controls=[
-                SubTitle(value=await self.client.session.gtv(key='request_create_output')),
+                SubTitle(value=self.client.session.tv(key='request_create_output')),
                 Row(
                     controls=[
                         self.tf_output_value,
@@ -250,7 +250,7 @@ class RequestCreateView(ClientBaseView):
                 Row(
                     controls=[
                         Text(
-                            value=await self.client.session.gtv(key='request_create_available_sum'),
+                            value=self.client.session.tv(key='request_create_available_sum'),
                         ),
                         self.t_output_available_sum,
                     ],
@@ -298,7 +298,7 @@ class RequestCreateView(ClientBaseView):
         if account_client_text and account_client_text.value:
             self.client_text_column.controls = [
                 TextField(
-                    label=await self.client.session.gtv(key='request_get_client_text'),
+                    label=self.client.session.tv(key='request_get_client_text'),
                     multiline=True,
                     value=value_replace(
                         account_client_text.value,
@@ -340,7 +340,7 @@ class RequestCreateView(ClientBaseView):
         # await self.write_data()
         self.controls = await self.get_controls(
             with_expand=True,
-            title=await self.client.session.gtv(key='request_create_title'),
+            title=self.client.session.tv(key='request_create_title'),
             main_section_controls=[
                 Container(
                     content=Column(
@@ -360,7 +360,7 @@ class RequestCreateView(ClientBaseView):
                         controls=[
                             StandardButton(
                                 content=Text(
-                                    value=await self.client.session.gtv(key='request_create_button'),
+                                    value=self.client.session.tv(key='request_create_button'),
                                     size=settings.get_font_size(multiple=1.5),
                                 ),
                                 on_click=self.request_create,
@@ -727,7 +727,7 @@ class RequestCreateView(ClientBaseView):
             await self.set_type(loading=False)
             await Error.field_error_set(
                 fields=[field],
-                text=await self.client.session.gtv(key='error_empty'),
+                text=self.client.session.tv(key='error_empty'),
             )
             return
         input_currency, output_currency = None, None
@@ -739,7 +739,7 @@ class RequestCreateView(ClientBaseView):
                 await self.set_type(loading=False)
                 await Error.field_error_set(
                     fields=[self.dd_input_method],
-                    text=await self.client.session.gtv(key='error_empty'),
+                    text=self.client.session.tv(key='error_empty'),
                 )
                 return
             input_method_id = self.dd_input_method.value
@@ -750,7 +750,7 @@ class RequestCreateView(ClientBaseView):
                 await self.set_type(loading=False)
                 await Error.field_error_set(
                     fields=[self.dd_output_requisite_data],
-                    text=await self.client.session.gtv(key='error_empty'),
+                    text=self.client.session.tv(key='error_empty'),
                 )
                 return
             output_requisite_data_id = self.dd_output_requisite_data.value
@@ -762,7 +762,7 @@ class RequestCreateView(ClientBaseView):
                 await self.set_type(loading=False)
                 await Error.field_error_set(
                     fields=[self.dd_input_method],
-                    text=await self.client.session.gtv(key='error_empty'),
+                    text=self.client.session.tv(key='error_empty'),
                 )
                 return
             input_method_id = self.dd_input_method.value
@@ -770,13 +770,13 @@ class RequestCreateView(ClientBaseView):
                 await self.set_type(loading=False)
                 await Error.field_error_set(
                     fields=[self.dd_output_requisite_data],
-                    text=await self.client.session.gtv(key='error_empty'),
+                    text=self.client.session.tv(key='error_empty'),
                 )
                 return
             output_requisite_data_id = self.dd_output_requisite_data.value
         input_value, output_value = None, None
-        error_less_div_str = await self.client.session.gtv(key='error_less_div')
-        error_div_str = await self.client.session.gtv(key='error_div')
+        error_less_div_str = self.client.session.tv(key='error_less_div')
+        error_div_str = self.client.session.tv(key='error_div')
         for field, field_currency in [
             (self.tf_input_value, input_currency),
             (self.tf_output_value, output_currency),
@@ -819,7 +819,7 @@ class RequestCreateView(ClientBaseView):
             await self.set_type(loading=False)
             await Error.field_error_set(
                 fields=[self.tf_input_value, self.tf_output_value],
-                text=await self.client.session.gtv(key='error_one_value_required'),
+                text=self.client.session.tv(key='error_one_value_required'),
             )
             return
         try:
@@ -15,7 +15,6 @@
 #
 
 
-import asyncio
 from functools import partial
 from typing import Optional
 
@@ -27,8 +26,11 @@ from app.controls.information import Text, SubTitle, InformationContainer
 from app.controls.input import TextField
 from app.controls.layout import ClientBaseView
 from app.utils import Fonts, value_to_float, Icons, value_to_str
-from app.utils.constants.order import OrderStates
-from app.utils.constants.request import RequestStates, RequestTypes
+from app.utils.binding import Bindings
+from app.utils.constants.request import RequestTypes
+from app.utils.loaders import Loaders
+from app.utils.states import RequestActions, order_machine, request_machine
+from app.utils.ticker import ticker
 from app.utils.value import requisite_value_to_str, get_fix_rate
 from app.views.client.requests.models import RequestUpdateNameModel
 from app.views.client.requests.orders.get import RequestOrderView
@@ -54,10 +56,12 @@ class DynamicTimer(UserControl):
         self.font_family = font_family
 
     def did_mount(self):
-        asyncio.create_task(self.update_second())
+        if self.seconds and self.seconds > 0:
+            ticker.add(self)
 
     def will_unmount(self):
         self.running = False
+        ticker.remove(self)
 
     def get_time(self):
         seconds = self.seconds
@@ -67,15 +71,22 @@ class DynamicTimer(UserControl):
             minutes += 1
         return f'({minutes:02}:{seconds:02})'
 
-    async def update_second(self):
-        while self.seconds and self.running:
+    def set_time(self):
+        if self.seconds and self.seconds > 0:
             self.time_text.value = self.get_time()
-            await self.time_text.update_async()
-            await asyncio.sleep(1)
-            self.seconds -= 1
+            return
         self.time_text.color = colors.RED
         self.time_text.value = f'(X)'
-        await self.time_text.update_async()
+
+    def tick(self) -> list:
+        if not self.running:
+            ticker.remove(self)
+            return []
+        self.seconds -= 1
+        if self.seconds <= 0:
+            ticker.remove(self)
+        self.set_time()
+        return [self.time_text]
 
     def build(self):
         self.time_text = Text(
@@ -84,14 +95,21 @@ class DynamicTimer(UserControl):
             color=self.color,
             font_family=self.font_family,
         )
+        self.set_time()
         return self.time_text
 
 
 class RequestView(ClientBaseView):
     route = '/client/request/get'
+    resume_fields = ['request_id']
+    loaders = Loaders(
+        request=lambda view: view.client.session.api.client.requests.get(id_=view.request_id),
+        orders=lambda view: view.client.session.api.client.orders.list_get.by_request(request_id=view.request_id),
+    )
     dialog: AlertDialog
 
     request_edit_name_model: RequestUpdateNameModel
+    bindings: Bindings
     request = dict
     orders = list[dict]
     account_client_text = dict
@@ -112,9 +130,9 @@ class RequestView(ClientBaseView):
         self.orders = []
         self.orders_row = Row(wrap=True)
         self.info_card_column = Column(spacing=-50)
+        self.bindings = Bindings(structure=['state', 'type', 'input_method', 'output_method'])
 
-    async def update_info_card(self, update: bool = True) -> None:
-        rate = value_to_float(value=self.request.rate, decimal=self.request.rate_decimal)
+    async def get_value_str(self) -> str:
         input_currency_id_str, output_currency_id_str = '', ''
         if self.request.type == RequestTypes.INPUT:
             input_currency = self.request.input_method.currency
@@ -150,19 +168,31 @@ class RequestView(ClientBaseView):
             f' -> '
             f'{value_to_str(value=output_value)} {output_currency_id_str}'
         )
-        rate_str = value_to_str(value=get_fix_rate(rate=rate))
         if self.request.name:
             value_str = f'{self.request.name} ({value_str})'
+        return value_str
+
+    async def get_rate_str(self) -> str:
+        rate = value_to_float(value=self.request.rate, decimal=self.request.rate_decimal)
+        return value_to_str(value=get_fix_rate(rate=rate))
+
+    async def update_info_card(self, update: bool = True) -> None:
+        self.bindings.clear(region='info_card')
         state_row = await self.client.session.gtv(key=f'request_state_{self.request.state}')
         rate_controls = [
-            Text(
-                value=rate_str,
-                size=settings.get_font_size(multiple=1.5),
-                font_family=Fonts.SEMIBOLD,
-                color=colors.ON_PRIMARY_CONTAINER,
+            self.bindings.bind(
+                Text(
+                    value=await self.get_rate_str(),
+                    size=settings.get_font_size(multiple=1.5),
+                    font_family=Fonts.SEMIBOLD,
+                    color=colors.ON_PRIMARY_CONTAINER,
+                ),
+                fields=['rate', 'rate_decimal'],
+                render=self.get_rate_str,
+                region='info_card',
             ),
         ]
-        if self.request.state not in [RequestStates.CANCELED, RequestStates.COMPLETED]:
+        if not request_machine.is_finished(self.request):
             rate_controls += [
                 DynamicTimer(
                     seconds=self.request.rate_fixed_delta,
@@ -173,11 +203,22 @@ class RequestView(ClientBaseView):
         info_card_controls = [
             Row(
                 controls=[
-                    Text(
-                        value=value_str,
-                        size=settings.get_font_size(multiple=3),
-                        font_family=Fonts.SEMIBOLD,
-                        color=colors.ON_PRIMARY_CONTAINER,
+                    self.bindings.bind(
+                        Text(
+                            value=await self.get_value_str(),
+                            size=settings.get_font_size(multiple=3),
+                            font_family=Fonts.SEMIBOLD,
+                            color=colors.ON_PRIMARY_CONTAINER,
+                        ),
+                        fields=[
+                            'name',
+                            'input_currency_value',
+                            'input_value',
+                            'output_value',
+                            'output_currency_value',
+                        ],
+                        render=self.get_value_str,
+                        region='info_card',
                     ),
                     StandardButton(
                         content=Image(
@@ -391,7 +432,7 @@ class RequestView(ClientBaseView):
             value = value_to_float(value=order.currency_value, decimal=currency.decimal)
             value_str = f'{value} {currency.id_str.upper()}'
             color, bgcolor = colors.ON_PRIMARY, colors.PRIMARY
-            if order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
+            if order_machine.is_finished(order):
                 color, bgcolor = colors.ON_PRIMARY_CONTAINER, colors.PRIMARY_CONTAINER
             order_info_str = ''
             if order.requisite_scheme_fields:
@@ -494,25 +535,27 @@ class RequestView(ClientBaseView):
         if update:
             await self.orders_row.update_async()
 
+    async def get_client_text_controls(self) -> list:
+        if not self.request.client_text:
+            return []
+        return [
+            Divider(),
+            TextField(
+                label=await self.client.session.gtv(key='request_get_client_text'),
+                multiline=True,
+                value=self.request.client_text,
+            ),
+        ]
+
     async def update_client_text(self, update: bool = True, _=None):
-        self.client_text_column.controls = []
-        if self.request.client_text:
-            self.client_text_column.controls = [
-                Divider(),
-                TextField(
-                    label=await self.client.session.gtv(key='request_get_client_text'),
-                    multiline=True,
-                    value=self.request.client_text,
-                ),
-            ]
+        self.client_text_column.controls = await self.get_client_text_controls()
         if update:
             await self.client_text_column.update_async()
 
     async def construct(self):
         controls, buttons = [], []
-        await self.set_type(loading=True)
-        self.request = await self.client.session.api.client.requests.get(id_=self.request_id)
-        await self.set_type(loading=False)
+        await self.load()
+        self.bindings.reset(model=self.request)
         await self.update_info_card(update=False)
         controls += [
             InformationContainer(
@@ -523,7 +566,8 @@ class RequestView(ClientBaseView):
         ]
         if self.confirmation_timer:
             self.confirmation_timer.running = False
-        if self.request.state == 'confirmation':
+        actions = request_machine.get_actions(self.request.state)
+        if RequestActions.CONFIRMATION in actions:
             await self.update_confirmation_timer(update=False)
             await self.update_confirmation_false_button(update=False)
             await self.update_confirmation_true_button(update=False)
@@ -535,16 +579,12 @@ class RequestView(ClientBaseView):
                     ],
                 ),
             ]
-        elif self.request.state in [RequestStates.COMPLETED, RequestStates.CANCELED]:
-            await self.update_orders_row(update=False)
-            controls += [
-                self.orders_row,
-            ]
         else:
             await self.update_orders_row(update=False)
             controls += [
                 self.orders_row,
             ]
+        if RequestActions.CANCELLATION in actions:
             await self.update_cancel_button(update=False)
             buttons += [
                 Row(
@@ -553,7 +593,12 @@ class RequestView(ClientBaseView):
                     ],
                 ),
             ]
-        self.client_text_column = Column()
+        self.client_text_column = self.bindings.bind(
+            Column(),
+            fields=['client_text'],
+            render=self.get_client_text_controls,
+            attr='controls',
+        )
         await self.update_client_text(update=False)
         controls += [
             self.client_text_column,
@@ -26,7 +26,8 @@ from app.controls.information import Text, InformationContainer
 from app.controls.input import TextField
 from app.controls.layout import ClientBaseView
 from app.utils import Fonts, value_to_float, Icons, Error, value_to_int
-from app.utils.constants.order import OrderStates, OrderTypes
+from app.utils.binding import Bindings
+from app.utils.states import OrderActions, Roles, get_order_actions, order_machine
 from app.utils.value import value_to_str
 from config import settings
 from fexps_api_client.utils import ApiException
@@ -34,6 +35,7 @@ from fexps_api_client.utils import ApiException
 
 class RequestOrderView(ClientBaseView):
     route = '/client/request/order/get'
+    resume_fields = ['order_id']
 
     order = dict
     order_request = dict
@@ -42,6 +44,7 @@ class RequestOrderView(ClientBaseView):
     currency = dict
 
     info_card: InformationContainer
+    bindings: Bindings
     inactive: Optional[bool]
 
     chat_button: StandardButton
@@ -65,9 +68,18 @@ class RequestOrderView(ClientBaseView):
         self.dialog = AlertDialog()
         self.tf_value = TextField()
         self.inactive = None
+        self.bindings = Bindings(
+            structure=['type', 'state', 'order_request', 'method', 'currency', 'requisite_scheme_fields'],
+        )
+
+    async def get_currency_value(self) -> float:
+        return value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+
+    async def get_requisite_field(self, key: str) -> Optional[str]:
+        return self.order.requisite_fields.get(key)
 
     async def update_info_card(self, update: bool = True) -> None:
-        currency_value = value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+        self.bindings.clear(region='info_card')
         state_str = await self.client.session.gtv(key=f'request_order_{self.order.type}_{self.order.state}')
         info_controls = [
             Row(
@@ -100,23 +112,26 @@ class RequestOrderView(ClientBaseView):
             Divider(color=self.method.color),
         ]
         for scheme_field in self.order.requisite_scheme_fields:
+            key = scheme_field.get('key')
             info_controls += [
                 Row(
                     controls=[
-                        TextField(
-                            label=await self.client.session.gtv(key=scheme_field.get('name_text_key')),
-                            value=self.order.requisite_fields.get(scheme_field.get('key')),
-                            color=self.method.color,
-                            bgcolor=self.method.bgcolor,
-                            expand=True,
-                            read_only=True,
+                        self.bindings.bind(
+                            TextField(
+                                label=await self.client.session.gtv(key=scheme_field.get('name_text_key')),
+                                value=await self.get_requisite_field(key=key),
+                                color=self.method.color,
+                                bgcolor=self.method.bgcolor,
+                                expand=True,
+                                read_only=True,
+                            ),
+                            fields=[f'requisite_fields.{key}'],
+                            render=partial(self.get_requisite_field, key),
+                            region='info_card',
                         ),
                         StandardButton(
                             content=Image(src=Icons.COPY, width=18, color=self.method.color),
-                            on_click=partial(
-                                self.copy_to_clipboard,
-                                self.order.requisite_fields.get(scheme_field.get('key')),
-                            ),
+                            on_click=partial(self.copy_requisite_field, key),
                             bgcolor=self.method.bgcolor,
                             horizontal=4,
                             vertical=4,
@@ -128,18 +143,23 @@ class RequestOrderView(ClientBaseView):
         info_controls += [
             Row(
                 controls=[
-                    TextField(
-                        label=await self.client.session.gtv(key='sum'),
-                        value=currency_value,
-                        suffix_text=self.currency.id_str.upper(),
-                        color=self.method.color,
-                        bgcolor=self.method.bgcolor,
-                        expand=True,
-                        read_only=True,
+                    self.bindings.bind(
+                        TextField(
+                            label=await self.client.session.gtv(key='sum'),
+                            value=await self.get_currency_value(),
+                            suffix_text=self.currency.id_str.upper(),
+                            color=self.method.color,
+                            bgcolor=self.method.bgcolor,
+                            expand=True,
+                            read_only=True,
+                        ),
+                        fields=['currency_value'],
+                        render=self.get_currency_value,
+                        region='info_card',
                     ),
                     StandardButton(
                         content=Image(src=Icons.COPY, width=18, color=self.method.color),
-                        on_click=partial(self.copy_to_clipboard, currency_value),
+                        on_click=self.copy_currency_value,
                         bgcolor=self.method.bgcolor,
                         horizontal=0,
                         vertical=0,
@@ -162,18 +182,26 @@ class RequestOrderView(ClientBaseView):
     INPUT PAYMENT
     """
 
+    async def get_payment_payment_button_str(self) -> str:
+        return await self.client.session.gtv(
+            key='request_order_payment_payment_button',
+            value=value_to_str(await self.get_currency_value()),
+            currency=self.currency.id_str.upper(),
+        )
+
     async def update_payment_payment_button(self, update: bool = True) -> None:
-        currency_value = value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+        self.bindings.clear(region='payment_payment_button')
         self.payment_payment_button = StandardButton(
-            content=Text(
-                value=await self.client.session.gtv(
-                    key='request_order_payment_payment_button',
-                    value=value_to_str(currency_value),
-                    currency=self.currency.id_str.upper(),
+            content=self.bindings.bind(
+                Text(
+                    value=await self.get_payment_payment_button_str(),
+                    size=settings.get_font_size(multiple=1.5),
+                    font_family=Fonts.SEMIBOLD,
+                    color=colors.WHITE,
                 ),
-                size=settings.get_font_size(multiple=1.5),
-                font_family=Fonts.SEMIBOLD,
-                color=colors.WHITE,
+                fields=['currency_value'],
+                render=self.get_payment_payment_button_str,
+                region='payment_payment_button',
             ),
             bgcolor=colors.GREEN,
             on_click=self.payment,
@@ -186,18 +214,26 @@ class RequestOrderView(ClientBaseView):
     OUTPUT CONFIRMATION
     """
 
+    async def get_payment_confirmation_confirm_button_str(self) -> str:
+        return await self.client.session.gtv(
+            key='request_order_payment_confirmation_confirm_button',
+            value=value_to_str(await self.get_currency_value()),
+            currency=self.currency.id_str.upper(),
+        )
+
     async def update_payment_confirmation_confirm_button(self, update: bool = True) -> None:
-        currency_value = value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+        self.bindings.clear(region='payment_confirmation_confirm_button')
         self.payment_confirmation_confirm_button = StandardButton(
-            content=Text(
-                value=await self.client.session.gtv(
-                    key='request_order_payment_confirmation_confirm_button',
-                    value=value_to_str(currency_value),
-                    currency=self.currency.id_str.upper(),
+            content=self.bindings.bind(
+                Text(
+                    value=await self.get_payment_confirmation_confirm_button_str(),
+                    size=settings.get_font_size(multiple=1.5),
+                    font_family=Fonts.SEMIBOLD,
+                    color=colors.BLACK,
                 ),
-                size=settings.get_font_size(multiple=1.5),
-                font_family=Fonts.SEMIBOLD,
-                color=colors.BLACK,
+                fields=['currency_value'],
+                render=self.get_payment_confirmation_confirm_button_str,
+                region='payment_confirmation_confirm_button',
             ),
             bgcolor=colors.GREEN,
             on_click=self.payment_confirmation_confirm,
@@ -225,7 +261,7 @@ class RequestOrderView(ClientBaseView):
     CHAT
     """
 
-    async def update_chat_button(self, update: bool = True) -> None:
+    async def get_chat_button_controls(self) -> list:
         image = Image(
             src=Icons.CHAT,
             height=16,
@@ -247,18 +283,28 @@ class RequestOrderView(ClientBaseView):
                 width=20,
                 height=16,
             )
+        return [
+            Text(
+                value=await self.client.session.gtv(key='chat_button'),
+                size=settings.get_font_size(multiple=1.5),
+                font_family=Fonts.SEMIBOLD,
+                color=colors.ON_PRIMARY_CONTAINER,
+            ),
+            image,
+        ]
+
+    async def update_chat_button(self, update: bool = True) -> None:
+        self.bindings.clear(region='chat_button')
         self.chat_button = StandardButton(
-            content=Row(
-                controls=[
-                    Text(
-                        value=await self.client.session.gtv(key='chat_button'),
-                        size=settings.get_font_size(multiple=1.5),
-                        font_family=Fonts.SEMIBOLD,
-                        color=colors.ON_PRIMARY_CONTAINER,
-                    ),
-                    image,
-                ],
-                alignment=MainAxisAlignment.CENTER,
+            content=self.bindings.bind(
+                Row(
+                    controls=await self.get_chat_button_controls(),
+                    alignment=MainAxisAlignment.CENTER,
+                ),
+                fields=['chat_is_read'],
+                render=self.get_chat_button_controls,
+                attr='controls',
+                region='chat_button',
             ),
             bgcolor=colors.PRIMARY_CONTAINER,
             on_click=self.chat_open,
@@ -361,8 +407,9 @@ class RequestOrderView(ClientBaseView):
         self.dialog = AlertDialog(modal=True)
         await self.set_type(loading=True)
         self.order = await self.client.session.api.client.orders.get(id_=self.order_id)
+        self.bindings.reset(model=self.order)
         if self.inactive is not None:
-            if not self.inactive and self.order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
+            if not self.inactive and order_machine.is_finished(self.order):
                 await self.set_type(loading=False)
                 await self.client.change_view(go_back=True, delete_current=True)
                 return
@@ -384,66 +431,43 @@ class RequestOrderView(ClientBaseView):
             ),
         ]
         await self.update_chat_button(update=False)
-        self.inactive = False
-        if self.order_request:
-            pass
-        elif self.order.type == OrderTypes.INPUT:
-            if self.order.state == OrderStates.WAITING:
-                pass
-            elif self.order.state == OrderStates.PAYMENT:
-                await self.update_order_request_create_update_value_button(update=False)
-                await self.update_order_request_create_recreate_button(update=False)
-                await self.update_order_request_create_cancel_button(update=False)
-                await self.update_payment_payment_button(update=False)
-                buttons += [
-                    Row(
-                        controls=[
-                            self.order_request_create_update_value_button,
-                            self.order_request_create_recreate_button,
-                            self.order_request_create_cancel_button,
-                        ],
-                        spacing=6,
-                    ),
-                    Row(
-                        controls=[
-                            self.payment_payment_button,
-                        ],
-                    ),
-                ]
-            elif self.order.state == OrderStates.CONFIRMATION:
-                pass
-            elif self.order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
-                self.inactive = True
-        elif self.order.type == OrderTypes.OUTPUT:
-            if self.order.state == OrderStates.WAITING:
-                pass
-            elif self.order.state == OrderStates.PAYMENT:
-                await self.update_order_request_create_update_value_button(update=False)
-                await self.update_order_request_create_recreate_button(update=False)
-                await self.update_order_request_create_cancel_button(update=False)
-                buttons += [
-                    Row(
-                        controls=[
-                            self.order_request_create_update_value_button,
-                            self.order_request_create_recreate_button,
-                            self.order_request_create_cancel_button,
-                        ],
-                        spacing=6,
-                    ),
-                ]
-            elif self.order.state == OrderStates.CONFIRMATION:
-                await self.update_payment_confirmation_cancel_button(update=False)
-                await self.update_payment_confirmation_confirm_button(update=False)
-                buttons += [
-                    Row(
-                        controls=[
-                            self.payment_confirmation_cancel_button,
-                            self.payment_confirmation_confirm_button,
-                        ]
-                    ),
-                ]
-            elif self.order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
-                self.inactive = True
+        actions = get_order_actions(role=Roles.REQUEST, order=self.order)
+        if OrderActions.ORDER_REQUEST_CREATE in actions:
+            await self.update_order_request_create_update_value_button(update=False)
+            await self.update_order_request_create_recreate_button(update=False)
+            await self.update_order_request_create_cancel_button(update=False)
+            buttons += [
+                Row(
+                    controls=[
+                        self.order_request_create_update_value_button,
+                        self.order_request_create_recreate_button,
+                        self.order_request_create_cancel_button,
+                    ],
+                    spacing=6,
+                ),
+            ]
+        if OrderActions.PAYMENT in actions:
+            await self.update_payment_payment_button(update=False)
+            buttons += [
+                Row(
+                    controls=[
+                        self.payment_payment_button,
+                    ],
+                ),
+            ]
+        if OrderActions.PAYMENT_CONFIRMATION in actions:
+            await self.update_payment_confirmation_cancel_button(update=False)
+            await self.update_payment_confirmation_confirm_button(update=False)
+            buttons += [
+                Row(
+                    controls=[
+                        self.payment_confirmation_cancel_button,
+                        self.payment_confirmation_confirm_button,
+                    ]
+                ),
+            ]
+        # A pending order request keeps the view active even in a terminal state
+        self.inactive = not self.order_request and order_machine.is_finished(self.order)
         buttons += [
             Row(
                 controls=[
@@ -480,6 +504,12 @@ class RequestOrderView(ClientBaseView):
     async def copy_to_clipboard(self, data, _):
         await self.client.session.page.set_clipboard(str(data))
 
+    async def copy_requisite_field(self, key: str, _):
+        await self.copy_to_clipboard(await self.get_requisite_field(key=key), _)
+
+    async def copy_currency_value(self, _):
+        await self.copy_to_clipboard(await self.get_currency_value(), _)
+
     async def chat_open(self, _):
         from app.views.client.chat import ChatView
         await self.client.change_view(view=ChatView(order_id=self.order_id))
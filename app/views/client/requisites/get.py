@@ -25,7 +25,8 @@ from app.controls.information import SubTitle, Text, InformationContainer
 from app.controls.input import TextField
 from app.controls.layout import ClientBaseView
 from app.utils import Icons, Fonts, value_to_float, Error, value_to_int, value_to_str
-from app.utils.constants.order import OrderStates
+from app.utils.loaders import Loaders
+from app.utils.states import order_machine
 from app.utils.value import requisite_value_to_str, get_fix_rate
 from app.views.client.requisites.orders.get import RequisiteOrderView
 from config import settings
@@ -34,6 +35,11 @@ from fexps_api_client.utils import ApiException
 
 class RequisiteView(ClientBaseView):
     route = '/client/requisite/get'
+    resume_fields = ['requisite_id']
+    loaders = Loaders(
+        requisite=lambda view: view.client.session.api.client.requisites.get(id_=view.requisite_id),
+        orders=lambda view: view.client.session.api.client.orders.list_get.by_requisite(requisite_id=view.requisite_id),
+    )
 
     requisite = dict
     orders = list[dict]
@@ -282,7 +288,7 @@ class RequisiteView(ClientBaseView):
             value = value_to_float(value=order.currency_value, decimal=currency.decimal)
             value_str = f'{value} {currency.id_str.upper()}'
             color, bgcolor = colors.ON_PRIMARY, colors.PRIMARY
-            if order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
+            if order_machine.is_finished(order):
                 color, bgcolor = colors.ON_PRIMARY_CONTAINER, colors.PRIMARY_CONTAINER
             order_info_str = ''
             if order.requisite_scheme_fields:
@@ -445,10 +451,7 @@ class RequisiteView(ClientBaseView):
     async def construct(self):
         self.dialog = AlertDialog(modal=False)
         controls, buttons = [], []
-        await self.set_type(loading=True)
-        self.requisite = await self.client.session.api.client.requisites.get(id_=self.requisite_id)
-        self.orders = await self.client.session.api.client.orders.list_get.by_requisite(requisite_id=self.requisite_id)
-        await self.set_type(loading=False)
+        await self.load()
         await self.update_info_card(update=False)
         await self.update_order_row(update=False)
         controls += [
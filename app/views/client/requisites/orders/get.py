@@ -26,7 +26,8 @@ from app.controls.information import Text, InformationContainer
 from app.controls.input import TextField
 from app.controls.layout import ClientBaseView
 from app.utils import Fonts, value_to_float, Icons
-from app.utils.constants.order import OrderStates, OrderTypes
+from app.utils.binding import Bindings
+from app.utils.states import OrderActions, Roles, get_order_actions, order_machine
 from app.utils.value import value_to_str
 from config import settings
 from fexps_api_client.utils import ApiException
@@ -34,6 +35,7 @@ from fexps_api_client.utils import ApiException
 
 class RequisiteOrderView(ClientBaseView):
     route = '/client/requisite/order/get'
+    resume_fields = ['order_id']
 
     order = dict
     order_request = dict
@@ -42,6 +44,7 @@ class RequisiteOrderView(ClientBaseView):
     currency = dict
 
     info_card: InformationContainer
+    bindings: Bindings
     inactive: Optional[bool]
 
     chat_button: StandardButton
@@ -61,9 +64,18 @@ class RequisiteOrderView(ClientBaseView):
         self.order_id = order_id
         self.dialog = AlertDialog()
         self.inactive = None
+        self.bindings = Bindings(
+            structure=['type', 'state', 'order_request', 'method', 'currency', 'requisite_scheme_fields'],
+        )
+
+    async def get_currency_value(self) -> float:
+        return value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+
+    async def get_requisite_field(self, key: str) -> Optional[str]:
+        return self.order.requisite_fields.get(key)
 
     async def update_info_card(self, update: bool = True) -> None:
-        currency_value = value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+        self.bindings.clear(region='info_card')
         state_str = await self.client.session.gtv(key=f'requisite_order_{self.order.type}_{self.order.state}')
         info_controls = [
             Row(
@@ -96,23 +108,26 @@ class RequisiteOrderView(ClientBaseView):
             Divider(color=self.method.color),
         ]
         for scheme_field in self.order.requisite_scheme_fields:
+            key = scheme_field.get('key')
             info_controls += [
                 Row(
                     controls=[
-                        TextField(
-                            label=await self.client.session.gtv(key=scheme_field.get('name_text_key')),
-                            value=self.order.requisite_fields.get(scheme_field.get('key')),
-                            color=self.method.color,
-                            bgcolor=self.method.bgcolor,
-                            expand=True,
-                            read_only=True,
+                        self.bindings.bind(
+                            TextField(
+                                label=await self.client.session.gtv(key=scheme_field.get('name_text_key')),
+                                value=await self.get_requisite_field(key=key),
+                                color=self.method.color,
+                                bgcolor=self.method.bgcolor,
+                                expand=True,
+                                read_only=True,
+                            ),
+                            fields=[f'requisite_fields.{key}'],
+                            render=partial(self.get_requisite_field, key),
+                            region='info_card',
                         ),
                         StandardButton(
                             content=Image(src=Icons.COPY, width=18, color=self.method.color),
-                            on_click=partial(
-                                self.copy_to_clipboard,
-                                self.order.requisite_fields.get(scheme_field.get('key')),
-                            ),
+                            on_click=partial(self.copy_requisite_field, key),
                             bgcolor=self.method.bgcolor,
                             horizontal=4,
                             vertical=4,
@@ -124,18 +139,23 @@ class RequisiteOrderView(ClientBaseView):
         info_controls += [
             Row(
                 controls=[
-                    TextField(
-                        label=await self.client.session.gtv(key='sum'),
-                        value=currency_value,
-                        suffix_text=self.currency.id_str.upper(),
-                        color=self.method.color,
-                        bgcolor=self.method.bgcolor,
-                        expand=True,
-                        read_only=True,
+                    self.bindings.bind(
+                        TextField(
+                            label=await self.client.session.gtv(key='sum'),
+                            value=await self.get_currency_value(),
+                            suffix_text=self.currency.id_str.upper(),
+                            color=self.method.color,
+                            bgcolor=self.method.bgcolor,
+                            expand=True,
+                            read_only=True,
+                        ),
+                        fields=['currency_value'],
+                        render=self.get_currency_value,
+                        region='info_card',
                     ),
                     StandardButton(
                         content=Image(src=Icons.COPY, width=18, color=self.method.color),
-                        on_click=partial(self.copy_to_clipboard, currency_value),
+                        on_click=self.copy_currency_value,
                         bgcolor=self.method.bgcolor,
                         horizontal=0,
                         vertical=0,
@@ -158,21 +178,26 @@ class RequisiteOrderView(ClientBaseView):
     INPUT CONFIRMATION
     """
 
-    async def update_payment_confirmation_confirm_button(self, update: bool = True) -> None:
-        currency_value = value_to_float(
-            value=self.order.currency_value,
-            decimal=self.currency.decimal,
+    async def get_payment_confirmation_confirm_button_str(self) -> str:
+        return await self.client.session.gtv(
+            key='requisite_order_payment_confirmation_confirm_button',
+            value=value_to_str(await self.get_currency_value()),
+            currency=self.currency.id_str.upper(),
         )
+
+    async def update_payment_confirmation_confirm_button(self, update: bool = True) -> None:
+        self.bindings.clear(region='payment_confirmation_confirm_button')
         self.payment_confirmation_confirm_button = StandardButton(
-            content=Text(
-                value=await self.client.session.gtv(
-                    key='requisite_order_payment_confirmation_confirm_button',
-                    value=value_to_str(currency_value),
-                    currency=self.currency.id_str.upper(),
+            content=self.bindings.bind(
+                Text(
+                    value=await self.get_payment_confirmation_confirm_button_str(),
+                    size=settings.get_font_size(multiple=1.5),
+                    font_family=Fonts.SEMIBOLD,
+                    color=colors.BLACK,
                 ),
-                size=settings.get_font_size(multiple=1.5),
-                font_family=Fonts.SEMIBOLD,
-                color=colors.BLACK,
+                fields=['currency_value'],
+                render=self.get_payment_confirmation_confirm_button_str,
+                region='payment_confirmation_confirm_button',
             ),
             bgcolor=colors.GREEN,
             on_click=self.payment_confirmation_confirm,
@@ -200,18 +225,26 @@ class RequisiteOrderView(ClientBaseView):
     PAYMENT
     """
 
+    async def get_output_payment_button_str(self) -> str:
+        return await self.client.session.gtv(
+            key='requisite_order_payment_payment_button',
+            value=value_to_str(await self.get_currency_value()),
+            currency=self.currency.id_str.upper(),
+        )
+
     async def update_output_payment_button(self, update: bool = True) -> None:
-        currency_value = value_to_float(value=self.order.currency_value, decimal=self.currency.decimal)
+        self.bindings.clear(region='output_payment_button')
         self.payment_payment_button = StandardButton(
-            content=Text(
-                value=await self.client.session.gtv(
-                    key='requisite_order_payment_payment_button',
-                    value=value_to_str(currency_value),
-                    currency=self.currency.id_str.upper(),
+            content=self.bindings.bind(
+                Text(
+                    value=await self.get_output_payment_button_str(),
+                    size=settings.get_font_size(multiple=1.5),
+                    font_family=Fonts.SEMIBOLD,
+                    color=colors.WHITE,
                 ),
-                size=settings.get_font_size(multiple=1.5),
-                font_family=Fonts.SEMIBOLD,
-                color=colors.WHITE,
+                fields=['currency_value'],
+                render=self.get_output_payment_button_str,
+                region='output_payment_button',
             ),
             bgcolor=colors.GREEN,
             on_click=self.payment,
@@ -340,8 +373,9 @@ class RequisiteOrderView(ClientBaseView):
     async def construct(self):
         await self.set_type(loading=True)
         self.order = await self.client.session.api.client.orders.get(id_=self.order_id)
+        self.bindings.reset(model=self.order)
         if self.inactive is not None:
-            if not self.inactive and self.order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
+            if not self.inactive and order_machine.is_finished(self.order):
                 await self.set_type(loading=False)
                 await self.client.change_view(go_back=True, delete_current=True)
                 return
@@ -363,8 +397,8 @@ class RequisiteOrderView(ClientBaseView):
             ),
         ]
         await self.update_chat_button(update=False)
-        self.inactive = False
-        if self.order_request:
+        actions = get_order_actions(role=Roles.REQUISITE, order=self.order)
+        if OrderActions.ORDER_REQUEST_ANSWER in actions:
             await self.update_order_request_canceled_button(update=False)
             await self.update_order_request_completed_button(update=False)
             buttons += [
@@ -375,40 +409,28 @@ class RequisiteOrderView(ClientBaseView):
                     ]
                 ),
             ]
-        elif self.order.type == OrderTypes.INPUT:
-            if self.order.state == OrderStates.WAITING:
-                pass
-            elif self.order.state == OrderStates.PAYMENT:
-                pass
-            elif self.order.state == OrderStates.CONFIRMATION:
-                await self.update_payment_confirmation_cancel_button(update=False)
-                await self.update_payment_confirmation_confirm_button(update=False)
-                buttons += [
-                    Row(
-                        controls=[
-                            self.payment_confirmation_cancel_button,
-                            self.payment_confirmation_confirm_button,
-                        ],
-                    ),
-                ]
-            elif self.order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
-                self.inactive = True
-        elif self.order.type == OrderTypes.OUTPUT:
-            if self.order.state == OrderStates.WAITING:
-                pass
-            elif self.order.state == OrderStates.PAYMENT:
-                await self.update_output_payment_button(update=False)
-                buttons += [
-                    Row(
-                        controls=[
-                            self.payment_payment_button,
-                        ],
-                    ),
-                ]
-            elif self.order.state == OrderStates.CONFIRMATION:
-                pass
-            elif self.order.state in [OrderStates.COMPLETED, OrderStates.CANCELED]:
-                self.inactive = True
+        if OrderActions.PAYMENT_CONFIRMATION in actions:
+            await self.update_payment_confirmation_cancel_button(update=False)
+            await self.update_payment_confirmation_confirm_button(update=False)
+            buttons += [
+                Row(
+                    controls=[
+                        self.payment_confirmation_cancel_button,
+                        self.payment_confirmation_confirm_button,
+                    ],
+                ),
+            ]
+        if OrderActions.PAYMENT in actions:
+            await self.update_output_payment_button(update=False)
+            buttons += [
+                Row(
+                    controls=[
+                        self.payment_payment_button,
+                    ],
+                ),
+            ]
+        # A pending order request keeps the view active even in a terminal state
+        self.inactive = OrderActions.ORDER_REQUEST_ANSWER not in actions and order_machine.is_finished(self.order)
         buttons += [
             Row(
                 controls=[
@@ -444,6 +466,12 @@ class RequisiteOrderView(ClientBaseView):
             return
         await self.client.page.set_clipboard_async(str(data))
 
+    async def copy_requisite_field(self, key: str, _):
+        await self.copy_to_clipboard(await self.get_requisite_field(key=key), _)
+
+    async def copy_currency_value(self, _):
+        await self.copy_to_clipboard(await self.get_currency_value(), _)
+
     async def chat_open(self, _):
         from app.views.client.chat import ChatView
         await self.client.change_view(view=ChatView(order_id=self.order_id))
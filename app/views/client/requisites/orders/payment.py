@@ -15,7 +15,6 @@
 #
 
 
-from base64 import b64encode
 from functools import partial
 
 from flet_core import Control, Row, TextField, ControlEvent, Image, ScrollMode, Container, Column, ImageFit, colors, \
@@ -25,6 +24,8 @@ from app.controls.button import StandardButton
 from app.controls.information import Text
 from app.controls.layout import ClientBaseView
 from app.utils import Icons, Error, value_to_int
+from app.utils.loaders import Loaders
+from app.utils.uploads import previews
 from app.utils.websockets.file import FileWebSockets
 from config import settings
 from fexps_api_client.utils import ApiException
@@ -32,6 +33,10 @@ from fexps_api_client.utils import ApiException
 
 class RequisiteOrderPaymentView(ClientBaseView):
     route = '/client/requisite/order/payment'
+    loaders = Loaders(
+        order=lambda view: view.client.session.api.client.orders.get(id_=view.order_id),
+        file_keys=lambda view: view.client.session.file_keys.get(),
+    )
 
     order = dict
     file_keys = dict
@@ -95,10 +100,7 @@ class RequisiteOrderPaymentView(ClientBaseView):
 
     async def construct(self):
         self.input_fields = {}
-        await self.set_type(loading=True)
-        self.order = await self.client.session.api.client.orders.get(id_=self.order_id)
-        self.file_keys = await self.client.session.api.client.files.keys.create()
-        await self.set_type(loading=False)
+        await self.load()
         controls = []
         if self.order.requisite.is_flex:
             self.tf_rate = TextField(
@@ -145,7 +147,7 @@ class RequisiteOrderPaymentView(ClientBaseView):
 
     async def update_file_keys(self, key: str):
         self.send_key = key
-        self.file_keys = await self.client.session.api.client.files.keys.create()
+        self.file_keys = await self.client.session.file_keys.get()
         self.attach_file_btn.url = self.file_keys.url
         self.attach_file_btn.update()
 
@@ -167,7 +169,7 @@ class RequisiteOrderPaymentView(ClientBaseView):
                 file_byte = file['value'].encode('ISO-8859-1')
                 file_image = Container(
                     content=Image(
-                        src=f'data:image/jpeg;base64,{b64encode(file_byte).decode()}',
+                        src=await previews.get(body=file_byte, size=150),
                         width=150,
                         height=150,
                         fit=ImageFit.CONTAIN,
@@ -24,12 +24,17 @@ from app.controls.button import StandardButton
 from app.controls.information import Text
 from app.controls.layout import ClientBaseView
 from app.utils import Fonts
+from app.utils.loaders import Loaders
 from config import settings
 from fexps_api_client.utils import ApiException
 
 
 class WalletView(ClientBaseView):
     route = '/client/wallet'
+    loaders = Loaders(
+        wallets=lambda view: view.client.session.api.client.wallets.get_list(),
+        wallet=lambda view: view.client.session.api.client.wallets.get(id_=view.client.session.current_wallet['id']),
+    )
     wallets: list
     wallet = dict
 
@@ -85,14 +90,11 @@ class WalletView(ClientBaseView):
 
     async def construct(self):
         self.dialog = AlertDialog(modal=True)
-        await self.set_type(loading=True)
-        self.wallets = await self.client.session.api.client.wallets.get_list()
-        self.wallet = await self.client.session.api.client.wallets.get(id_=self.client.session.current_wallet['id'])
+        await self.load()
         self.wallets_column = Column(
             controls=await self.get_wallet_list(),
             scroll=ScrollMode.AUTO,
         )
-        await self.set_type(loading=False)
         self.controls = await self.get_controls(
             title=await self.client.session.gtv(key='wallet_select_title'),
             with_expand=True,
@@ -16,6 +16,7 @@
 
 
 from base64 import b64encode
+from functools import partial
 
 from flet_core import ListView, padding
 
@@ -23,6 +24,8 @@ from app.controls.layout.view import View
 from app.controls.navigation import BottomNavigation, BottomNavigationTab
 from .tabs import HomeTab, RequestTab, AccountTab, RequisiteTab
 from ...utils import Icons
+from ...utils.batch import batch_updates
+from ...utils.templates import templates
 
 
 class Tab:
@@ -33,12 +36,38 @@ class Tab:
         self.control = control
 
 
+TABS = [
+    Tab(
+        name='tab_home',
+        icon_src=Icons.HOME,
+        control=HomeTab,
+    ),
+    Tab(
+        name='tab_request',
+        icon_src=Icons.EXCHANGE,
+        control=RequestTab,
+    ),
+    Tab(
+        name='tab_requisite',
+        icon_src=Icons.REQUISITE,
+        control=RequisiteTab,
+    ),
+    Tab(
+        name='tab_account',
+        icon_src=Icons.ACCOUNT,
+        control=AccountTab,
+    ),
+]
+
+
 class MainView(View):
+    resume_fields = []
     tabs: list[BottomNavigationTab]
     tab_selected: BottomNavigationTab = None
     tab_default: BottomNavigationTab
     body: ListView
 
+    @batch_updates
     async def change_tab(self, tab: BottomNavigationTab):
         if not tab.name != self.tab_selected.name:
             return
@@ -51,47 +80,36 @@ class MainView(View):
         self.body.controls = controls
         await self.body.update_async()
 
+    def build_navigation(self, with_avatar: bool) -> BottomNavigation:
+        return BottomNavigation(
+            on_click_tab=None,
+            tabs=[
+                BottomNavigationTab(
+                    key=tab.name,
+                    name=self.client.session.tv(key=tab.name),
+                    account_change_func=None,
+                    change_view=None,
+                    icon_src=None if with_avatar and tab.name == 'tab_account' else tab.icon_src,
+                    control=tab.control,
+                )
+                for tab in TABS
+            ],
+        )
+
     async def construct(self):
         self.body = ListView(expand=True, padding=padding.only(bottom=36))
-        account_icon_src, icon_src_base64 = Icons.ACCOUNT, None
-        if self.client.session.account['file']:
-            account_icon_src = None
-            icon_src_base64 = b64encode(self.client.session.account['file']['value'].encode('ISO-8859-1')).decode()
-        TABS = [
-            Tab(
-                name='tab_home',
-                icon_src=Icons.HOME,
-                control=HomeTab,
-            ),
-            Tab(
-                name='tab_request',
-                icon_src=Icons.EXCHANGE,
-                control=RequestTab,
-            ),
-            Tab(
-                name='tab_requisite',
-                icon_src=Icons.REQUISITE,
-                control=RequisiteTab,
-            ),
-            Tab(
-                name='tab_account',
-                icon_src=account_icon_src,
-                icon_src_base64=icon_src_base64,
-                control=AccountTab,
-            ),
-        ]
-        self.tabs = [
-            BottomNavigationTab(
-                key=tab.name,
-                name=await self.client.session.gtv(key=tab.name),
-                account_change_func=self.client.session.change_account,
-                change_view=self.client.change_view,
-                icon_src=tab.icon_src,
-                icon_src_base64=tab.icon_src_base64,
-                control=tab.control,
-            )
-            for tab in TABS
-        ]
+        account_file = self.client.session.account['file']
+        navigation = templates.get(
+            key=(*self.client.session.get_template_key(name='bottom_navigation'), bool(account_file)),
+            build=partial(self.build_navigation, with_avatar=bool(account_file)),
+        )
+        navigation.on_click_tab = self.change_tab
+        self.tabs = navigation.tabs
+        for tab in self.tabs:
+            tab.account_change_func = self.client.session.change_account
+            tab.change_view = self.client.change_view
+            if account_file and tab.key == 'tab_account':
+                tab.icon.src_base64 = b64encode(account_file['value'].encode('ISO-8859-1')).decode()
         self.tab_default = self.tabs[0]
         if self.tab_selected:
             self.tab_default = next(tab for tab in self.tabs if tab.name == self.tab_selected.name)
@@ -104,10 +122,7 @@ class MainView(View):
             self.body,
 
             # Bottom Navigation
-            BottomNavigation(
-                on_click_tab=self.change_tab,
-                tabs=self.tabs,
-            ),
+            navigation,
         ]
 
         for tab in self.tabs:
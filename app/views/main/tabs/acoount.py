@@ -24,6 +24,7 @@ from app.controls.button import ListItemButton
 from app.controls.information import Title, Text
 from app.controls.information.avatar import Avatar
 from app.utils import Fonts, Icons
+from app.utils.templates import templates
 from app.views import AdminView
 from app.views.main.tabs.base import BaseTab
 from config import settings
@@ -32,10 +33,10 @@ from config import settings
 class Setting:
     name: str
     icon: str
-    on_click: Any
+    on_click: str | None
     url: Any
 
-    def __init__(self, name: str, icon: str, on_click: Any = None, url: Any = None):
+    def __init__(self, name: str, icon: str, on_click: str = None, url: Any = None):
         self.name = name
         self.icon = icon
         self.on_click = on_click
@@ -51,6 +52,65 @@ class Section:
         self.settings = settings_
 
 
+SECTIONS = [
+    Section(
+        name='my_account',
+        settings_=[
+            Setting(
+                name='account_settings',
+                icon=Icons.SETTINGS,
+                on_click='settings',
+            ),
+            Setting(
+                name='account_notifications',
+                icon=Icons.NOTIFICATIONS,
+                on_click='notification',
+            ),
+            Setting(
+                name='account_requisite_data',
+                icon=Icons.METHOD,
+                on_click='requisite_data',
+            ),
+            Setting(
+                name='account_language',
+                icon=Icons.LANGUAGE,
+                on_click='update_language',
+            ),
+            Setting(
+                name='account_change_account',
+                icon=Icons.ACCOUNT,
+                on_click='change_account',
+            ),
+        ],
+    ),
+    Section(
+        name='help',
+        settings_=[
+            Setting(
+                name='about',
+                icon=Icons.ABOUT,
+                on_click='about_us',
+            ),
+            Setting(
+                name='support',
+                icon=Icons.SUPPORT,
+                url=settings.url_telegram,
+            ),
+            Setting(
+                name='faq',
+                icon=Icons.FAQ,
+                on_click='question_view',
+            ),
+            Setting(
+                name='privacy_policy',
+                icon=Icons.PRIVACY_POLICY,
+                # on_click='privacy_policy',
+            ),
+        ],
+    ),
+]
+
+
 class AccountTab(BaseTab):
     account_column: Column
 
@@ -89,119 +149,79 @@ class AccountTab(BaseTab):
         if update:
             await self.account_column.update_async()
 
-    async def construct(self):
-        await self.update_account_column(update=False)
-        sections = [
-            Section(
-                name='my_account',
-                settings_=[
-                    Setting(
-                        name='account_settings',
-                        icon=Icons.SETTINGS,
-                        on_click=self.settings,
-                    ),
-                    Setting(
-                        name='account_notifications',
-                        icon=Icons.NOTIFICATIONS,
-                        on_click=self.notification,
-                    ),
-                    Setting(
-                        name='account_requisite_data',
-                        icon=Icons.METHOD,
-                        on_click=self.requisite_data,
-                    ),
-                    Setting(
-                        name='account_language',
-                        icon=Icons.LANGUAGE,
-                        on_click=self.update_language,
-                    ),
-                    Setting(
-                        name='account_change_account',
-                        icon=Icons.ACCOUNT,
-                        on_click=self.change_account,
-                    ),
-                ],
-            ),
-            Section(
-                name='help',
-                settings_=[
-                    Setting(
-                        name='about',
-                        icon=Icons.ABOUT,
-                        on_click=self.about_us,
-                    ),
-                    Setting(
-                        name='support',
-                        icon=Icons.SUPPORT,
-                        url=settings.url_telegram,
-                    ),
-                    Setting(
-                        name='faq',
-                        icon=Icons.FAQ,
-                        on_click=self.question_view,
-                    ),
-                    Setting(
-                        name='privacy_policy',
-                        icon=Icons.PRIVACY_POLICY,
-                        # on_click=self.privacy_policy,
+    def build_controls(self) -> list:
+        texts = self.client.session.resolve(
+            keys=[
+                key
+                for section in SECTIONS
+                for key in [section.name, *[setting.name for setting in section.settings]]
+            ],
+        )
+        return [
+            Title(value=self.client.session.tv(key='account_tab_title')),
+            *[
+                Container(
+                    content=Column(
+                        controls=[
+                            Container(
+                                content=Text(
+                                    value=texts[section.name],
+                                    font_family=Fonts.SEMIBOLD,
+                                    size=settings.get_font_size(multiple=2.5),
+                                    color=colors.ON_BACKGROUND,
+                                ),
+                            ),
+                            Column(
+                                controls=[
+                                    ListItemButton(
+                                        icon=setting.icon,
+                                        name=texts[setting.name],
+                                        on_click=setting.on_click,
+                                        url=setting.url,
+                                    )
+                                    for setting in section.settings
+                                ],
+                                spacing=4,
+                            ),
+                        ],
                     ),
-                ],
-            ),
-        ]
-        sections_controls = [
+                    padding=padding.only(top=12),
+                )
+                for section in SECTIONS
+            ],
             Container(
-                content=Column(
-                    controls=[
-                        Container(
-                            content=Text(
-                                value=await self.client.session.gtv(section.name),
-                                font_family=Fonts.SEMIBOLD,
-                                size=settings.get_font_size(multiple=2.5),
-                                color=colors.ON_BACKGROUND,
-                            ),
-                        ),
-                        Column(
-                            controls=[
-                                ListItemButton(
-                                    icon=setting.icon,
-                                    name=await self.client.session.gtv(key=setting.name),
-                                    on_click=setting.on_click,
-                                    url=setting.url,
-                                )
-                                for setting in section.settings
-                            ],
-                            spacing=4,
-                        ),
-                    ],
+                content=Text(
+                    value=f'{self.client.session.tv(key="version")} {settings.version}',
+                    font_family=Fonts.REGULAR,
+                    size=settings.get_font_size(multiple=2),
+                    color=colors.ON_BACKGROUND,
                 ),
-                padding=padding.only(top=12),
-            )
-            for section in sections
+                alignment=alignment.center,
+                on_click='go_admin',
+                padding=padding.symmetric(vertical=4),
+                ink=True,
+            ),
         ]
+
+    async def construct(self):
+        await self.update_account_column(update=False)
+        title, *sections_controls = templates.get(
+            key=self.client.session.get_template_key(name='account_tab'),
+            build=self.build_controls,
+            owner=self,
+        )
         self.scroll = ScrollMode.AUTO
         self.controls = [
             Container(
                 content=Column(
                     controls=[
-                        Title(value=await self.client.session.gtv(key='account_tab_title')),
+                        title,
                         Container(
                             content=self.account_column,
                             padding=padding.only(top=12),
                             alignment=alignment.center,
                         ),
                         *sections_controls,
-                        Container(
-                            content=Text(
-                                value=f'{await self.client.session.gtv(key="version")} {settings.version}',
-                                font_family=Fonts.REGULAR,
-                                size=settings.get_font_size(multiple=2),
-                                color=colors.ON_BACKGROUND,
-                            ),
-                            alignment=alignment.center,
-                            on_click=self.go_admin,
-                            padding=padding.symmetric(vertical=4),
-                            ink=True,
-                        ),
                     ],
                 ),
                 padding=10,
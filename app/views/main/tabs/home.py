@@ -25,6 +25,7 @@ from app.controls.button import Chip, StandardButton
 from app.controls.information import Text, InformationContainer, SubTitle
 from app.controls.navigation.pagination import PaginationWidget
 from app.utils import Fonts, Icons, value_to_float, value_to_str
+from app.utils.batch import batch_updates
 from app.utils.constants.request import RequestTypes
 from app.views.client.requests import RequestView
 from app.views.main.tabs.base import BaseTab
@@ -66,13 +67,13 @@ class HomeTab(BaseTab):
         time_delta = datetime.timedelta(hours=self.client.session.timezone.deviation)
         time_now = time_utcnow + time_delta
         if time_now.hour < 6:
-            hello_text_str = await self.client.session.gtv(key='good_night')
+            hello_text_str = self.client.session.tv(key='good_night')
         elif time_now.hour < 12:
-            hello_text_str = await self.client.session.gtv(key='good_morning')
+            hello_text_str = self.client.session.tv(key='good_morning')
         elif time_now.hour < 18:
-            hello_text_str = await self.client.session.gtv(key='good_afternoon')
+            hello_text_str = self.client.session.tv(key='good_afternoon')
         else:
-            hello_text_str = await self.client.session.gtv(key='good_evening')
+            hello_text_str = self.client.session.tv(key='good_evening')
         hello_text_str = f'{hello_text_str},'
         self.account_row.controls = [
             Text(
@@ -157,7 +158,7 @@ class HomeTab(BaseTab):
                             width=20,
                         ),
                         Text(
-                            value=await self.client.session.gtv(key=f'action_make_exchange'),
+                            value=self.client.session.tv(key=f'action_make_exchange'),
                             size=settings.get_font_size(multiple=1.5),
                             font_family=Fonts.BOLD,
                             color=colors.ON_PRIMARY,
@@ -178,7 +179,7 @@ class HomeTab(BaseTab):
                             width=20,
                         ),
                         Text(
-                            value=await self.client.session.gtv(key=f'action_send'),
+                            value=self.client.session.tv(key=f'action_send'),
                             size=settings.get_font_size(multiple=1.5),
                             font_family=Fonts.BOLD,
                             color=colors.ON_PRIMARY_CONTAINER,
@@ -201,7 +202,7 @@ class HomeTab(BaseTab):
     async def get_currently_request_cards(self) -> list[StandardButton]:
         cards: list[StandardButton] = []
         for request in self.currently_request:
-            state_str = await self.client.session.gtv(key=f'request_state_{request.state}')
+            state_str = self.client.session.tv(key=f'request_state_{request.state}')
             input_currency_id_str, output_currency_id_str, rate_currency_id_str = '', '', ''
             if request.type == RequestTypes.INPUT:
                 input_currency = request.input_method.currency
@@ -297,7 +298,7 @@ class HomeTab(BaseTab):
         self.currently_request_row.controls = []
         if cards:
             self.currently_request_row.controls = [
-                SubTitle(value=await self.client.session.gtv(key='requests_currently_title')),
+                SubTitle(value=self.client.session.tv(key='requests_currently_title')),
                 *cards,
             ]
         if update:
@@ -310,23 +311,29 @@ class HomeTab(BaseTab):
     async def get_history_transfer_chips(self) -> list[Chip]:
         return [
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.input}'),
+                name=self.client.session.tv(key=f'chip_{Chips.input}'),
                 key=Chips.input,
                 on_select=self.chip_select,
                 selected=self.selected_chip == Chips.input,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.output}'),
+                name=self.client.session.tv(key=f'chip_{Chips.output}'),
                 key=Chips.output,
                 on_select=self.chip_select,
                 selected=self.selected_chip == Chips.output,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.all}'),
+                name=self.client.session.tv(key=f'chip_{Chips.all}'),
                 key=Chips.all,
                 on_select=self.chip_select,
                 selected=self.selected_chip == Chips.all,
             ),
+            Chip(
+                name=self.client.session.tv(key='export'),
+                key='export',
+                on_select=self.export_transfers,
+                selected=False,
+            ),
         ]
 
     async def get_history_transfer_cards(self) -> list[StandardButton]:
@@ -386,16 +393,13 @@ class HomeTab(BaseTab):
 
     async def update_transfer_history_row(self, update: bool = True):
         self.transfer_history_row.controls = [
-            SubTitle(value=await self.client.session.gtv(key='last_transfers_title')),
+            SubTitle(value=self.client.session.tv(key='last_transfers_title')),
             *await self.get_history_transfer_chips(),
             *await self.get_history_transfer_cards(),
-            PaginationWidget(
+            PaginationWidget.from_template(
+                owner=self,
                 current_page=self.page_transfer,
                 total_pages=self.total_pages,
-                on_back=self.previous_page,
-                on_next=self.next_page,
-                text_back=await self.client.session.gtv(key='back'),
-                text_next=await self.client.session.gtv(key='next'),
             ),
         ]
         if update:
@@ -448,17 +452,27 @@ class HomeTab(BaseTab):
         from app.views.client.transfers import TransferView
         await self.client.change_view(view=TransferView(transfer_id=transfer_id))
 
+    @batch_updates
     async def chip_select(self, event: ControlEvent):
         self.selected_chip = event.control.key
         await self.construct()
         await self.update_async()
 
+    async def export_transfers(self, _):
+        url = await self.client.session.get_export_url(
+            name='transfers',
+            wallet_id=self.client.session.current_wallet['id'],
+        )
+        await self.client.page.launch_url_async(url=url)
+
+    @batch_updates
     async def next_page(self, _):
         if self.page_transfer < self.total_pages:
             self.page_transfer += 1
             await self.construct()
             await self.update_async()
 
+    @batch_updates
     async def previous_page(self, _):
         if self.page_transfer > 1:
             self.page_transfer -= 1
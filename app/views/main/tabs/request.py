@@ -87,7 +87,7 @@ class RequestTab(BaseTab):
             color, bgcolor = colors.ON_PRIMARY_CONTAINER, colors.PRIMARY_CONTAINER
             if request.state not in ['completed', 'canceled']:
                 color, bgcolor = colors.ON_PRIMARY, colors.PRIMARY
-            state_str = await self.client.session.gtv(key=f'request_state_{request.state}')
+            state_str = self.client.session.tv(key=f'request_state_{request.state}')
             date_str = request.date.strftime('%d %b %Y, %H:%M')
             input_currency_id_str, output_currency_id_str, rate_currency_id_str = '', '', ''
             if request.type == RequestTypes.INPUT:
@@ -200,7 +200,7 @@ class RequestTab(BaseTab):
         self.currently_request_row.controls = []
         if cards:
             self.currently_request_row.controls = [
-                SubTitle(value=await self.client.session.gtv(key='requests_currently_title')),
+                SubTitle(value=self.client.session.tv(key='requests_currently_title')),
                 *cards,
             ]
         if update:
@@ -213,25 +213,25 @@ class RequestTab(BaseTab):
     async def get_history_request_chips(self) -> list[Chip]:
         chips = [
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.ACTIVE}'),
+                name=self.client.session.tv(key=f'chip_{Chips.ACTIVE}'),
                 key=Chips.ACTIVE,
                 on_select=self.chip_select,
                 selected=True if self.selected_chip == Chips.ACTIVE else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.COMPLETED}'),
+                name=self.client.session.tv(key=f'chip_{Chips.COMPLETED}'),
                 key=Chips.COMPLETED,
                 on_select=self.chip_select,
                 selected=True if self.selected_chip == Chips.COMPLETED else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.CANCELED}'),
+                name=self.client.session.tv(key=f'chip_{Chips.CANCELED}'),
                 key=Chips.CANCELED,
                 on_select=self.chip_select,
                 selected=True if self.selected_chip == Chips.CANCELED else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{Chips.ALL}'),
+                name=self.client.session.tv(key=f'chip_{Chips.ALL}'),
                 key=Chips.ALL,
                 on_select=self.chip_select,
                 selected=True if self.selected_chip == Chips.ALL else False,
@@ -240,22 +240,36 @@ class RequestTab(BaseTab):
         if 'requests_partner' in self.client.session.account.permissions:
             chips += [
                 Chip(
-                    name=await self.client.session.gtv(key=f'chip_{Chips.PARTNERS}'),
+                    name=self.client.session.tv(key=f'chip_{Chips.PARTNERS}'),
                     key=Chips.PARTNERS,
                     on_select=self.chip_partner_select,
                     selected=True if self.partner_chip else False,
                 ),
             ]
+        chips += [
+            Chip(
+                name=self.client.session.tv(key='export_requests'),
+                key='export_requests',
+                on_select=partial(self.export, 'requests'),
+                selected=False,
+            ),
+            Chip(
+                name=self.client.session.tv(key='export_orders'),
+                key='export_orders',
+                on_select=partial(self.export, 'orders'),
+                selected=False,
+            ),
+        ]
         return chips
 
     async def update_history_requests_column(self, update: bool = True):
-        self.tf_history_requests_search.label = await self.client.session.gtv(key='request_history_search')
+        self.tf_history_requests_search.label = self.client.session.tv(key='request_history_search')
         self.tf_history_requests_search.value = self.search_value
         self.history_requests_column.controls = [
             Row(
                 controls=[
                     Text(
-                        value=await self.client.session.gtv(key='request_history_title'),
+                        value=self.client.session.tv(key='request_history_title'),
                         size=settings.get_font_size(multiple=2),
                         font_family=Fonts.BOLD,
                         color=colors.ON_BACKGROUND,
@@ -278,13 +292,10 @@ class RequestTab(BaseTab):
                 wrap=True,
             ),
             *await self.get_request_cards(requests=self.history_requests),
-            PaginationWidget(
+            PaginationWidget.from_template(
+                owner=self,
                 current_page=self.page_request,
                 total_pages=self.total_pages,
-                on_next=self.next_page,
-                on_back=self.previous_page,
-                text_next=await self.client.session.gtv(key='next'),
-                text_back=await self.client.session.gtv(key='back'),
             ),
         ]
         if update:
@@ -298,8 +309,8 @@ class RequestTab(BaseTab):
                 content=Column(
                     controls=[
                         Title(
-                            value=await self.client.session.gtv(key='request_tab_title'),
-                            create_name_text=await self.client.session.gtv(key='create'),
+                            value=self.client.session.tv(key='request_tab_title'),
+                            create_name_text=self.client.session.tv(key='create'),
                             on_create=self.request_create,
                         ),
                         self.currently_request_row,
@@ -364,6 +375,10 @@ class RequestTab(BaseTab):
         self.total_pages = history_requests.pages
         await self.update_history_requests_column()
 
+    async def export(self, name: str, _):
+        url = await self.client.session.get_export_url(name=name)
+        await self.client.page.launch_url_async(url=url)
+
     async def next_page(self, _):
         if self.page_request < self.total_pages:
             self.page_request += 1
@@ -86,7 +86,7 @@ class RequisiteTab(BaseTab):
                 value_
                 for key_, value_ in order.requisite_fields.items()
             ])
-            state_str = await self.client.session.gtv(key=f'requisite_order_{order.type}_{order.state}')
+            state_str = self.client.session.tv(key=f'requisite_order_{order.type}_{order.state}')
             value = value_to_float(value=order.currency_value, decimal=currency.decimal)
             value_str = f'{value} {currency.id_str.upper()}'
             cards.append(
@@ -166,7 +166,7 @@ class RequisiteTab(BaseTab):
         self.current_orders_column.controls = []
         if cards:
             self.current_orders_column.controls = [
-                SubTitle(value=await self.client.session.gtv(key='requisite_currently_orders_title')),
+                SubTitle(value=self.client.session.tv(key='requisite_currently_orders_title')),
                 *cards,
             ]
         if update:
@@ -179,7 +179,7 @@ class RequisiteTab(BaseTab):
     async def get_requisite_history_chips(self) -> list[Row]:
         type_chips = [
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{TypeChips.INPUT}'),
+                name=self.client.session.tv(key=f'chip_{TypeChips.INPUT}'),
                 key=TypeChips.INPUT,
                 on_select=partial(
                     self.chip_type_select,
@@ -188,7 +188,7 @@ class RequisiteTab(BaseTab):
                 selected=True if self.selected_type_chip == TypeChips.INPUT else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{TypeChips.OUTPUT}'),
+                name=self.client.session.tv(key=f'chip_{TypeChips.OUTPUT}'),
                 key=TypeChips.OUTPUT,
                 on_select=partial(
                     self.chip_type_select,
@@ -197,7 +197,7 @@ class RequisiteTab(BaseTab):
                 selected=True if self.selected_type_chip == TypeChips.OUTPUT else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{TypeChips.ALL}'),
+                name=self.client.session.tv(key=f'chip_{TypeChips.ALL}'),
                 key=TypeChips.ALL,
                 on_select=partial(
                     self.chip_type_select,
@@ -208,7 +208,7 @@ class RequisiteTab(BaseTab):
         ]
         state_chips = [
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{StateChips.ENABLE}'),
+                name=self.client.session.tv(key=f'chip_{StateChips.ENABLE}'),
                 key=StateChips.ENABLE,
                 on_select=partial(
                     self.chip_state_select,
@@ -217,7 +217,7 @@ class RequisiteTab(BaseTab):
                 selected=True if self.selected_state_chip == StateChips.ENABLE else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{StateChips.STOP}'),
+                name=self.client.session.tv(key=f'chip_{StateChips.STOP}'),
                 key=StateChips.STOP,
                 on_select=partial(
                     self.chip_state_select,
@@ -226,7 +226,7 @@ class RequisiteTab(BaseTab):
                 selected=True if self.selected_state_chip == StateChips.STOP else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{StateChips.DISABLE}'),
+                name=self.client.session.tv(key=f'chip_{StateChips.DISABLE}'),
                 key=StateChips.DISABLE,
                 on_select=partial(
                     self.chip_state_select,
@@ -235,7 +235,7 @@ class RequisiteTab(BaseTab):
                 selected=True if self.selected_state_chip == StateChips.DISABLE else False,
             ),
             Chip(
-                name=await self.client.session.gtv(key=f'chip_{StateChips.ALL}'),
+                name=self.client.session.tv(key=f'chip_{StateChips.ALL}'),
                 key=StateChips.ALL,
                 on_select=partial(
                     self.chip_state_select,
@@ -261,10 +261,10 @@ class RequisiteTab(BaseTab):
         for requisite in requisites:
             currency = requisite.currency
             method = requisite.input_method if requisite.type == 'input' else requisite.output_method
-            type_ = await self.client.session.gtv(key=f'requisite_type_{requisite.type}')
-            method_str = await self.client.session.gtv(key=method.name_text)
+            type_ = self.client.session.tv(key=f'requisite_type_{requisite.type}')
+            method_str = self.client.session.tv(key=method.name_text)
             type_str = f'{type_} ({method_str})'
-            state_str = await self.client.session.gtv(key=f'requisite_state_{requisite.state}')
+            state_str = self.client.session.tv(key=f'requisite_state_{requisite.state}')
             currency_value = value_to_float(value=requisite.currency_value, decimal=currency.decimal)
             total_currency_value = value_to_float(value=requisite.total_currency_value, decimal=currency.decimal)
             currency_value_str = f'{currency_value}/{total_currency_value} {currency.id_str.upper()} '
@@ -333,16 +333,13 @@ class RequisiteTab(BaseTab):
 
     async def update_history_requisites_column(self, update: bool = True):
         self.history_requisites_column.controls = [
-            SubTitle(value=await self.client.session.gtv(key='requisite_history_title')),
+            SubTitle(value=self.client.session.tv(key='requisite_history_title')),
             *await self.get_requisite_history_chips(),
             *await self.get_requisite_history_cards(requisites=self.history_requisites),
-            PaginationWidget(
+            PaginationWidget.from_template(
+                owner=self,
                 current_page=self.page_requisites,
                 total_pages=self.total_pages,
-                on_next=self.next_page,
-                on_back=self.previous_page,
-                text_next=await self.client.session.gtv(key='next'),
-                text_back=await self.client.session.gtv(key='back'),
             ),
         ]
         if update:
@@ -357,7 +354,7 @@ class RequisiteTab(BaseTab):
         self.orders_column.controls = []
         if cards:
             self.orders_column.controls = [
-                SubTitle(value=await self.client.session.gtv(key='requisite_orders_title')),
+                SubTitle(value=self.client.session.tv(key='requisite_orders_title')),
                 *cards,
             ]
         if update:
@@ -372,8 +369,8 @@ class RequisiteTab(BaseTab):
                 content=Column(
                     controls=[
                         Title(
-                            value=await self.client.session.gtv(key='requisite_tab_title'),
-                            create_name_text=await self.client.session.gtv(key='create'),
+                            value=self.client.session.tv(key='requisite_tab_title'),
+                            create_name_text=self.client.session.tv(key='create'),
                             on_create=self.requisite_create,
                             disabled_create=create_disable,
                         ),
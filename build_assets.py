@@ -0,0 +1,132 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import gzip
+import json
+import string
+from hashlib import md5
+from pathlib import Path
+
+import brotli
+from fontTools import subset
+
+ASSETS_DIR = Path('assets')
+MANIFEST_PATH = ASSETS_DIR / 'assets.json'
+# Only fonts are looked up through the manifest, index.html and manifest.json keep plain icon paths
+FINGERPRINT_SUFFIXES = ['.ttf']
+COMPRESS_SUFFIXES = ['.ttf', '.json']
+SKIP_DIRS = ['texts_packs', 'files']
+SKIP_FILES = ['index.html', 'assets.json']
+FONTS_DIR = ASSETS_DIR / 'fonts'
+SUBSETS_DIR = FONTS_DIR / 'subsets'
+TEXTS_DIR = ASSETS_DIR / 'texts_packs'
+BASE_CHARS = string.digits + string.ascii_letters + string.punctuation + ' ₽$€£¥₴₸₮₼₾₺₹₿№«»–—…'
+# Ordered from smallest, the app picks the first subset that covers a language's text pack
+SUBSETS = {
+    'latin': BASE_CHARS + ''.join(map(chr, range(0xa0, 0x180))),
+    'cyrillic': BASE_CHARS + ''.join(map(chr, range(0x400, 0x530))),
+    'latin-cyrillic': BASE_CHARS + ''.join(map(chr, [*range(0xa0, 0x180), *range(0x400, 0x530)])),
+}
+
+
+def get_sources() -> list[Path]:
+    manifest = json.loads(MANIFEST_PATH.read_text()) if MANIFEST_PATH.exists() else {'files': {}}
+    built = set(manifest['files'].values())
+    return [
+        path
+        for path in sorted(ASSETS_DIR.rglob('*'))
+        if path.is_file()
+        and path.parts[1] not in SKIP_DIRS
+        and path.name not in SKIP_FILES
+        and path.suffix not in ['.gz', '.br']
+        and SUBSETS_DIR not in path.parents
+        and path.relative_to(ASSETS_DIR).as_posix() not in built
+    ]
+
+
+def compress(path: Path, body: bytes) -> None:
+    path.with_name(f'{path.name}.gz').write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+    path.with_name(f'{path.name}.br').write_bytes(brotli.compress(body, quality=11))
+
+
+def write_subset(source: Path, target: Path, chars: str) -> None:
+    options = subset.Options()
+    options.layout_features = ['*']
+    options.notdef_outline = True
+    font = subset.load_font(str(source), options)
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(text=chars)
+    subsetter.subset(font)
+    subset.save_font(font, str(target), options)
+    compress(path=target, body=target.read_bytes())
+
+
+def get_languages() -> dict[str, str]:
+    # Text packs exported as {language}.json, only the glyphs each language uses go into its subset
+    languages = {}
+    for path in sorted(TEXTS_DIR.glob('*.json')):
+        pack = json.loads(path.read_text())
+        chars = set().union(*map(str, pack.values())) - set(string.whitespace)
+        languages[path.stem] = BASE_CHARS + ''.join(sorted(chars - set(BASE_CHARS)))
+    return languages
+
+
+def build_subsets(subsets: dict[str, str]) -> dict:
+    SUBSETS_DIR.mkdir(exist_ok=True)
+    sources = [path for path in sorted(FONTS_DIR.glob('*.ttf')) if '.' not in path.stem]
+    result = {}
+    for name, chars in subsets.items():
+        fonts = {}
+        for source in sources:
+            digest = md5(source.read_bytes() + chars.encode()).hexdigest()[:12]
+            target = SUBSETS_DIR / f'{source.stem}.{name}.{digest}.ttf'
+            if not target.exists():
+                write_subset(source=source, target=target, chars=chars)
+            fonts[source.stem] = target.relative_to(ASSETS_DIR).as_posix()
+        result[name] = {'chars': chars, 'fonts': fonts}
+    return result
+
+
+def build() -> dict:
+    files, encodings = {}, {}
+    for path in get_sources():
+        name = path.relative_to(ASSETS_DIR).as_posix()
+        body = path.read_bytes()
+        target = path
+        if path.suffix in FINGERPRINT_SUFFIXES:
+            target = path.with_name(f'{path.stem}.{md5(body).hexdigest()[:12]}{path.suffix}')
+            target.write_bytes(body)
+            files[name] = target.relative_to(ASSETS_DIR).as_posix()
+        if path.suffix in COMPRESS_SUFFIXES:
+            compress(path=target, body=body)
+            encodings[target.relative_to(ASSETS_DIR).as_posix()] = ['br', 'gzip']
+    manifest = {
+        'files': files,
+        'encodings': encodings,
+        'subsets': build_subsets(subsets=SUBSETS),
+        'languages': build_subsets(subsets=get_languages()),
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+if __name__ == '__main__':
+    result = build()
+    print(
+        f'{len(result["files"])} fingerprinted, {len(result["encodings"])} compressed, '
+        f'{len(result["subsets"])} subsets, {len(result["languages"])} language subsets',
+    )
@@ -24,7 +24,45 @@ class Settings(BaseSettings):
     secret_key: str
     version: str = '0.1'
     update_interval: int = 3
+    update_interval_max: int = 60
+    update_poll_interval: float = 0.5
+    update_deadline: float = 10
+    update_breaker_threshold: int = 3
+    api_cache_ttl: float = 0.5
+    api_validators_size: int = 256
+    api_timeout: float = 15
+    api_timeouts: dict[str, float] = {}
+    api_retries: int = 2
+    api_retry_backoff: float = 0.2
+    api_retry_budget: float = 0.1
+    api_hedge_samples: int = 20
+    api_concurrency: int = 32
+    api_concurrency_limits: dict[str, int] = {'view_load': 16, 'updater': 8, 'prefetch': 2}
+    references_ttl: float = 300
+    warm_up_timeout: float = 30
+    warm_up_retry: float = 1
+    warm_up_retry_max: float = 60
+    snapshot_path: str = 'data/snapshots'
+    snapshot_interval: float = 5
+    export_concurrency: int = 4
+    export_chunk_size: int = 16384
+    export_ticket_ttl: int = 60
+    export_tickets_path: str = 'data/export.sqlite3'
+    export_tickets_size: int = 1024
+    diagnostics_interval: float = 0.5
+    diagnostics_auth_ttl: int = 60
+    diagnostics_top: int = 20
     max_accounts: int = 10
+    file_keys_size: int = 2
+    file_keys_ttl: float = 300
+    previews_size: int = 256
+    previews_quality: int = 70
+    templates_size: int = 64
+    resume_ttl: int = 300
+    state_backend: str = 'sqlite'
+    state_path: str = 'data/states.sqlite3'
+    state_redis_url: str = 'redis://localhost:6379/0'
+    state_size: int = 1024
     coin_name: str = 'YACoin'
     language_default: str = 'eng'
     url_telegram: str = 'https://t.me/fexps_manager'
@@ -0,0 +1,61 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.utils.api import Api
+from app.utils.updater import update_check
+
+
+class Stub:
+    """Endpoint that decodes a fresh body on every call, like the real client does"""
+
+    def __init__(self, body: dict):
+        self.body = json.dumps(body)
+        self.calls = 0
+        self.client = SimpleNamespace(orders=SimpleNamespace(get=self.get))
+
+    async def get(self, **kwargs) -> dict:
+        self.calls += 1
+        return json.loads(self.body)
+
+
+def test_unchanged_body_skips_diff():
+    stub = Stub(body={'id': 1, 'state': 'waiting'})
+    schemes = []
+
+    def scheme(obj: dict) -> list:
+        schemes.append(obj)
+        return [obj['state']]
+
+    async def run():
+        api = Api(api=stub, ttl=0)
+        order = await api.client.orders.get(id_=1)
+        assert not update_check(scheme=scheme, obj_1=order, obj_2=await api.client.orders.get(id_=1))
+        assert not schemes
+        stub.body = json.dumps({'id': 1, 'state': 'completed'})
+        new_order = await api.client.orders.get(id_=1)
+        assert update_check(scheme=scheme, obj_1=order, obj_2=new_order)
+        assert new_order['state'] == 'completed'
+        assert stub.calls == 3
+        assert api.stats()['unchanged'] == 1
+        assert api.stats()['changed'] == 2
+    asyncio.run(run())
+
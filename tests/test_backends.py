@@ -0,0 +1,65 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import os
+from secrets import token_hex
+
+import pytest
+
+from app.utils.backends import MemoryBackend, RedisBackend, SqliteBackend
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'redis'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryBackend(size=2)
+    if request.param == 'sqlite':
+        return SqliteBackend(path=str(tmp_path / 'states.sqlite3'), size=2)
+    pytest.importorskip('redis')
+    if not os.environ.get('TEST_REDIS_URL'):
+        pytest.skip('TEST_REDIS_URL is not set')
+    return RedisBackend(url=os.environ['TEST_REDIS_URL'], size=2, prefix=f'test-{token_hex(4)}')
+
+
+def test_put_get_pop(backend):
+    async def run():
+        await backend.put(key='a', value={'token': 'x'}, ttl=60)
+        assert await backend.get(key='a') == {'token': 'x'}
+        assert await backend.get(key='a') == {'token': 'x'}
+        assert await backend.pop(key='a') == {'token': 'x'}
+        assert await backend.pop(key='a') is None
+        assert await backend.get(key='a') is None
+    asyncio.run(run())
+
+
+def test_expired(backend):
+    async def run():
+        await backend.put(key='a', value={'token': 'x'}, ttl=-1)
+        assert await backend.get(key='a') is None
+        assert await backend.pop(key='a') is None
+    asyncio.run(run())
+
+
+def test_size_bound(backend):
+    async def run():
+        for key in ['a', 'b', 'c']:
+            await backend.put(key=key, value={'key': key}, ttl=60)
+        assert await backend.get(key='a') is None
+        assert await backend.get(key='c') == {'key': 'c'}
+        assert backend.stats()['states'] == 2
+    asyncio.run(run())
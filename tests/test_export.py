@@ -0,0 +1,39 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import asyncio
+import csv
+import io
+
+from app.utils.export import iter_csv
+
+
+def test_formula_cells_are_escaped():
+    async def rows():
+        yield ['id', 'name', 'value']
+        yield [1, '=HYPERLINK("http://x")', -10.5]
+        yield [2, '@SUM(A1)', '-1+2']
+
+    async def run():
+        return ''.join([chunk async for chunk in iter_csv(rows=rows())])
+
+    assert list(csv.reader(io.StringIO(asyncio.run(run())))) == [
+        ['id', 'name', 'value'],
+        ['1', '\'=HYPERLINK("http://x")', '-10.5'],
+        ['2', "'@SUM(A1)", "'-1+2"],
+    ]
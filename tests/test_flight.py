@@ -0,0 +1,79 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import asyncio
+
+from app.utils.api import SingleFlight, priority
+
+
+def test_callers_get_copies():
+    async def run():
+        flight = SingleFlight(ttl=60)
+
+        async def read():
+            return {'fields': {'a': 1}}
+
+        first = await flight.do(key='a', func=read)
+        first['fields']['a'] = 2
+        assert await flight.do(key='a', func=read) == {'fields': {'a': 1}}
+        assert flight.stats()['cached'] == 1
+    asyncio.run(run())
+
+
+def test_forget_fences_running_reads():
+    async def run():
+        flight = SingleFlight(ttl=60)
+        values = iter(['stale', 'fresh'])
+
+        async def read():
+            value = next(values)
+            await asyncio.sleep(0.05)
+            return value
+
+        stale = asyncio.ensure_future(flight.do(key='a', func=read))
+        await asyncio.sleep(0)
+        flight.forget()
+        assert await flight.do(key='a', func=read) == 'fresh'
+        assert await stale == 'stale'
+        assert await flight.do(key='a', func=read) == 'fresh'
+    asyncio.run(run())
+
+
+def test_urgent_caller_skips_background_flight():
+    async def run():
+        flight = SingleFlight()
+        calls = []
+
+        async def read():
+            value = priority.get()
+            calls.append(value)
+            await asyncio.sleep(0.05)
+            return value
+
+        async def background():
+            priority.set('prefetch')
+            return await flight.do(key='a', func=read)
+
+        task = asyncio.ensure_future(background())
+        await asyncio.sleep(0)
+        assert await flight.do(key='a', func=read) == 'interactive'
+        assert await task == 'prefetch'
+        assert calls == ['prefetch', 'interactive']
+        await asyncio.gather(flight.do(key='a', func=read), flight.do(key='a', func=read))
+        assert len(calls) == 3
+    asyncio.run(run())
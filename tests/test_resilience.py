@@ -0,0 +1,172 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+
+import pytest
+from aiohttp import ClientSession, web
+
+from app.utils.api.resilience import ApiOutcomeUnknownException, ApiUnavailableException, Resilience
+from fexps_api_client.utils import ApiException
+
+
+class Stub:
+    """Local HTTP endpoint that injects the latency and status planned for each outgoing call"""
+
+    def __init__(self):
+        self.plan = []
+        self.calls = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        await asyncio.sleep(float(request.query['delay']))
+        return web.json_response({'call': int(request.query['call'])}, status=int(request.query['status']))
+
+    def run(self, test) -> None:
+        async def main():
+            app = web.Application()
+            app.router.add_get('/', self.handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = runner.addresses[0][1]
+            calls = 0
+            async with ClientSession() as session:
+                async def get() -> dict:
+                    nonlocal calls
+                    calls += 1
+                    delay, status = self.plan.pop(0) if self.plan else (0, 200)
+                    params = {'call': calls, 'delay': delay, 'status': status}
+                    async with session.get(f'http://127.0.0.1:{port}/', params=params) as response:
+                        response.raise_for_status()
+                        return await response.json()
+                try:
+                    await test(get)
+                finally:
+                    await runner.cleanup()
+        asyncio.run(main())
+
+
+def get_resilience(**kwargs) -> Resilience:
+    return Resilience(**{
+        'timeout': 0.5,
+        'timeouts': {},
+        'retries': 2,
+        'backoff': 0.01,
+        'hedge_samples': 5,
+        'budget': 0.5,
+        **kwargs,
+    })
+
+
+def test_hedge_wins_over_slow_request():
+    stub, resilience = Stub(), get_resilience(timeout=2)
+
+    async def test(get):
+        for _ in range(10):
+            await resilience.read(path=('x',), func=get)
+        stub.plan = [(1, 200)]
+        started = asyncio.get_running_loop().time()
+        result = await resilience.read(path=('x',), func=get)
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert result['call'] == 12
+        assert resilience.hedged == 1 and resilience.hedges_won == 1
+    stub.run(test)
+
+
+def test_hedge_waits_for_first_success():
+    stub, resilience = Stub(), get_resilience()
+
+    async def test(get):
+        for _ in range(10):
+            await resilience.read(path=('x',), func=get)
+        stub.plan = [(0.1, 200), (0.02, 500)]
+        result = await resilience.read(path=('x',), func=get)
+        assert result['call'] == 11
+        assert resilience.retried == 0
+    stub.run(test)
+
+
+def test_transient_errors_are_retried():
+    stub, resilience = Stub(), get_resilience()
+
+    async def test(get):
+        stub.plan = [(0, 503), (0, 503)]
+        result = await resilience.read(path=('x',), func=get)
+        assert result['call'] == 3
+        assert resilience.retried == 2
+    stub.run(test)
+
+
+def test_timeouts_surface_as_api_exception():
+    stub, resilience = Stub(), get_resilience(timeouts={'x': 0.05}, retries=1)
+
+    async def test(get):
+        stub.plan = [(0.2, 200), (0.2, 200), (0.2, 200)]
+        with pytest.raises(ApiUnavailableException) as exception:
+            await resilience.read(path=('x',), func=get)
+        assert isinstance(exception.value, ApiException)
+        assert exception.value.code == 'unavailable'
+        assert resilience.timeouts_count == 2
+        with pytest.raises(ApiOutcomeUnknownException) as exception:
+            await resilience.call(path=('x',), func=get)
+        assert exception.value.code == 'outcome_unknown'
+    stub.run(test)
+
+
+def test_unsent_writes_are_unavailable():
+    resilience = get_resilience()
+
+    async def test():
+        async with ClientSession() as session:
+            async def post():
+                # Nothing listens on port 9 locally, the connection is refused before anything is sent
+                async with session.post('http://127.0.0.1:9/') as response:
+                    return await response.json()
+            with pytest.raises(ApiUnavailableException):
+                await resilience.call(path=('x',), func=post)
+    asyncio.run(test())
+
+
+def test_budget_stops_retries():
+    stub, resilience = Stub(), get_resilience(budget=0)
+    resilience.budget.tokens = 0
+
+    async def test(get):
+        stub.plan = [(0, 503), (0, 503)]
+        with pytest.raises(ApiUnavailableException):
+            await resilience.read(path=('x',), func=get)
+        assert stub.calls == 1
+        assert resilience.exhausted == 1
+    stub.run(test)
+
+
+def test_api_errors_are_not_retried():
+    resilience = get_resilience()
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        raise ApiException()
+
+    async def test():
+        with pytest.raises(ApiException) as exception:
+            await resilience.read(path=('x',), func=fail)
+        assert not isinstance(exception.value, ApiUnavailableException)
+    asyncio.run(test())
+    assert len(calls) == 1
@@ -0,0 +1,38 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import asyncio
+import os
+from time import time
+
+from app.utils.api import Snapshot
+
+
+def test_invalidate_reaches_other_workers(tmp_path):
+    worker_1, worker_2 = Snapshot(path=str(tmp_path)), Snapshot(path=str(tmp_path))
+    worker_1.write(entries={'version:eng': b'1'})
+    os.utime(worker_1.current_path, (time() - 10, time() - 10))
+    for worker in [worker_1, worker_2]:
+        worker.swap()
+        assert worker.get_file()
+    worker_1.invalidate()
+    worker_2.swap()
+    assert worker_2.get_file() is None
+    worker_1.write(entries={'version:eng': b'2'})
+    for worker in [worker_1, worker_2]:
+        worker.swap()
+        assert worker.get_file().get('version:eng') == b'2'
@@ -0,0 +1,59 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from types import SimpleNamespace
+
+from app.controls.navigation.pagination import PaginationWidget
+
+
+class Owner:
+    def __init__(self):
+        self.client = SimpleNamespace(
+            session=SimpleNamespace(
+                tv=lambda key: key,
+                get_template_key=lambda name: (name, 'test'),
+            ),
+        )
+
+    async def previous_page(self, _):
+        pass
+
+    async def next_page(self, _):
+        pass
+
+
+def test_pagination_clone_binds_owner_handlers():
+    owner_1, owner_2 = Owner(), Owner()
+    pagination_1 = PaginationWidget.from_template(owner=owner_1, current_page=1, total_pages=3)
+    pagination_2 = PaginationWidget.from_template(owner=owner_2, current_page=2, total_pages=3)
+    assert pagination_1 is not pagination_2
+    assert pagination_1.back_button is not pagination_2.back_button
+    assert pagination_1.back_button.on_click == owner_1.previous_page
+    assert pagination_1.next_button.on_click == owner_1.next_page
+    assert pagination_2.back_button.on_click == owner_2.previous_page
+    assert pagination_2.next_button.on_click == owner_2.next_page
+
+
+def test_pagination_clone_keeps_own_state():
+    pagination_1 = PaginationWidget.from_template(owner=Owner(), current_page=1, total_pages=3)
+    pagination_2 = PaginationWidget.from_template(owner=Owner(), current_page=3, total_pages=3)
+    assert pagination_1.pages_text.value == '1/3'
+    assert pagination_2.pages_text.value == '3/3'
+    assert pagination_1.back_button.disabled and not pagination_1.next_button.disabled
+    assert pagination_2.next_button.disabled and not pagination_2.back_button.disabled
+    assert pagination_2.content.controls[0] is pagination_2.back_button
+    assert pagination_2.back_button.page is None and pagination_2.back_button.uid is None